@@ -0,0 +1,203 @@
+"""Shared helpers for the scripts under ``benchmarks/``.
+
+Every benchmark prints one JSON report in the same shape, so any two runs can
+be diffed with ``benchmarks/compare.py``::
+
+    {
+      "schema": 1,
+      "suite": "core_ops",
+      "environment": {"python": "3.11.7", "platform": "...", "espansr": "1.1.0", ...},
+      "params": {...},
+      "results": [
+        {"name": "list_all", "size": 1000, "rounds": 5,
+         "first_ms": 41.2, "median_ms": 38.9, "min_ms": 38.1, "max_ms": 41.2,
+         "counts": {"templates": 1000}}
+      ]
+    }
+
+A result is identified by ``(name, size)``. ``first_ms`` is the first, cold
+round; the other timings cover all rounds. ``counts`` holds deterministic
+integers (git spawns, files written) that should not grow between runs.
+Memory results (see :func:`memory_result`) carry ``peak_rss_kb`` instead of
+timings.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import espansr
+
+SCHEMA_VERSION = 1
+
+_WORDS = (
+    "please review the attached draft and let me know if anything needs to change "
+    "before we send it to the customer thanks again for your help with the release "
+    "notes meeting agenda follow up summary action items owner due date status"
+).split()
+
+_FOLDERS = ("email", "code", "support", "notes", "sales", "hr", "snippets", "review")
+
+
+def environment() -> dict:
+    """Describe the machine and versions a report was produced on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count() or 1,
+        "espansr": espansr.__version__,
+    }
+
+
+def make_report(suite: str, results: list[dict], **params: Any) -> dict:
+    """Wrap *results* in the shared report envelope."""
+    return {
+        "schema": SCHEMA_VERSION,
+        "suite": suite,
+        "environment": environment(),
+        "params": params,
+        "results": results,
+    }
+
+
+def summarize(name: str, samples: list[float], size: Optional[int] = None, **counts: int) -> dict:
+    """Return one result entry from per-round *samples* in seconds."""
+    return {
+        "name": name,
+        "size": size,
+        "rounds": len(samples),
+        "first_ms": round(samples[0] * 1000, 3),
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+        "counts": counts,
+    }
+
+
+def memory_result(name: str, size: Optional[int] = None) -> dict:
+    """Return a result entry holding this process's peak resident set size."""
+    return {"name": name, "size": size, "rounds": 1, "peak_rss_kb": peak_rss_kb(), "counts": {}}
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Return this process's peak resident set size in KiB, or None if unknown."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def time_rounds(
+    func: Callable[[], Any],
+    rounds: int,
+    *,
+    setup: Optional[Callable[[], Any]] = None,
+    budget: float = 30.0,
+) -> tuple[list[float], Any]:
+    """Time *func* up to *rounds* times; return (seconds per round, last result).
+
+    *setup* runs untimed before each round. At least one round always runs;
+    later rounds stop once *budget* seconds of timed work have been spent, so
+    the largest stores finish in reasonable time.
+    """
+    samples: list[float] = []
+    value = None
+    while len(samples) < max(rounds, 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        value = func()
+        samples.append(time.perf_counter() - start)
+        if sum(samples) >= budget:
+            break
+    return samples, value
+
+
+def parse_sizes(text: str) -> list[int]:
+    """Parse ``"100,1k,10k"`` into ``[100, 1000, 10000]``."""
+    sizes = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        scale = 1000 if part.endswith("k") else 1
+        sizes.append(int(part.rstrip("k")) * scale)
+    return sizes
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def synthetic_template(rng: random.Random, i: int) -> tuple[Optional[str], dict]:
+    """Return ``(folder, data)`` for the *i*-th synthetic template.
+
+    Shapes follow a typical store: most templates have a trigger and zero to
+    three variables, a few have many; content ranges from a one-liner to a few
+    kilobytes; roughly a fifth live at the store root, the rest in nested
+    folders.
+    """
+    var_count = rng.choices((0, 1, 2, 3, 6), weights=(30, 30, 20, 15, 5))[0]
+    variables = [
+        {"name": f"var{n}", "label": f"Field {n}", "default": rng.choice(("", "x", "today"))}
+        for n in range(var_count)
+    ]
+    paragraphs = rng.choices((1, 3, 8, 25), weights=(40, 35, 20, 5))[0]
+    lines = [_sentence(rng, rng.randint(6, 18)) for _ in range(paragraphs)]
+    for var in variables:
+        line = rng.randrange(len(lines))
+        lines[line] += f" {{{{{var['name']}}}}}"
+    data = {
+        "name": f"Template {i:05d}",
+        "content": "\n".join(lines),
+        "description": _sentence(rng, 6),
+        "trigger": f":t{i:05d}" if rng.random() < 0.9 else "",
+        "variables": variables,
+    }
+    folder = None
+    if rng.random() >= 0.2:
+        folder = rng.choice(_FOLDERS)
+        if rng.random() < 0.3:
+            folder += f"/{rng.choice(_FOLDERS)}"
+    return folder, data
+
+
+def make_store(root: Path, count: int, *, seed: int = 0, flat: bool = False) -> Path:
+    """Write *count* synthetic templates below *root* and return it.
+
+    With *flat*, every file goes in *root* itself (the layout ``import`` reads).
+    Files are backdated by an hour, like a settled store, so stat-keyed caches
+    trust them from the first run.
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    past = time.time() - 3600
+    for i in range(count):
+        folder, data = synthetic_template(rng, i)
+        target = root if flat or folder is None else root / folder
+        target.mkdir(parents=True, exist_ok=True)
+        path = target / f"template_{i:05d}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        os.utime(path, (past, past))
+    return root
+
+
+def emit(report: dict, out: Optional[str]) -> None:
+    """Print *report* as JSON, or write it to *out* when given."""
+    text = json.dumps(report, indent=2)
+    if out:
+        Path(out).write_text(text + "\n", encoding="utf-8")
+        print(f"Wrote {out}", file=sys.stderr)
+    else:
+        print(text)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""Compare two benchmark reports and flag regressions.
+
+Results are matched by ``(name, size)``. A result regresses when its median
+(or, for memory results, its peak RSS) grew by more than ``--threshold`` (a
+fraction) *and* by more than ``--min-delta-ms`` (``--min-delta-kb``), so
+noise on small stores is ignored, or when any of its ``counts`` grew (git
+spawns, files written). A timing must also have left the baseline's own
+spread: its fastest sample (``min_ms``) has to be slower than the baseline's
+slowest (``max_ms``), so a cache or disk hiccup that moves the median of a
+few I/O-heavy samples is not reported. Results present in only one report are
+listed but never fail the comparison.
+
+Usage::
+
+    python benchmarks/compare.py before.json after.json
+    python benchmarks/compare.py before.json after.json --threshold 0.5 --json
+
+Exits 1 when at least one result regressed, 2 when the reports are unusable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from _common import SCHEMA_VERSION
+
+
+def _key(result: dict) -> tuple[str, int]:
+    return result["name"], result.get("size") or 0
+
+
+def _label(key: tuple[str, int]) -> str:
+    name, size = key
+    return f"{name} [{size}]" if size else name
+
+
+def _metric(result: dict) -> str:
+    return "median_ms" if "median_ms" in result else "peak_rss_kb"
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float,
+    min_delta_ms: float,
+    min_delta_kb: float = 1024,
+) -> dict:
+    """Match results by ``(name, size)`` and flag the ones that regressed.
+
+    Returns a dict with per-result ``rows``, the number of ``regressions``, and
+    labels of results found ``only_baseline`` or ``only_current``.
+    """
+    before = {_key(r): r for r in baseline.get("results", [])}
+    after = {_key(r): r for r in current.get("results", [])}
+    rows = []
+    for key in sorted(before.keys() & after.keys(), key=lambda k: (k[1], k[0])):
+        old, new = before[key], after[key]
+        metric = _metric(new)
+        old_value, new_value = old.get(metric) or 0, new.get(metric) or 0
+        min_delta = min_delta_ms if metric == "median_ms" else min_delta_kb
+        ratio = new_value / old_value if old_value else 1.0
+        # Timings must also clear the baseline's sample range, not just its median.
+        outside_spread = metric != "median_ms" or (new.get("min_ms") or 0) > (
+            old.get("max_ms") or 0
+        )
+        reasons = []
+        if ratio - 1 > threshold and new_value - old_value > min_delta and outside_spread:
+            label = "median" if metric == "median_ms" else "peak RSS"
+            reasons.append(f"{label} +{(ratio - 1) * 100:.0f}%")
+        old_counts, new_counts = old.get("counts", {}), new.get("counts", {})
+        for count in sorted(old_counts.keys() & new_counts.keys()):
+            if new_counts[count] > old_counts[count]:
+                reasons.append(f"{count} {old_counts[count]} -> {new_counts[count]}")
+        rows.append(
+            {
+                "name": key[0],
+                "size": key[1] or None,
+                "metric": metric,
+                "baseline": old_value,
+                "current": new_value,
+                "ratio": round(ratio, 3),
+                "regressed": bool(reasons),
+                "reasons": reasons,
+            }
+        )
+    return {
+        "threshold": threshold,
+        "min_delta_ms": min_delta_ms,
+        "min_delta_kb": min_delta_kb,
+        "rows": rows,
+        "regressions": sum(row["regressed"] for row in rows),
+        "only_baseline": [_label(k) for k in sorted(before.keys() - after.keys())],
+        "only_current": [_label(k) for k in sorted(after.keys() - before.keys())],
+    }
+
+
+def format_comparison(result: dict) -> str:
+    """Render a comparison as an aligned text table."""
+    rows = result["rows"]
+    width = max([len(_label((r["name"], r["size"] or 0))) for r in rows] + [9])
+    lines = [f"{'benchmark':<{width}}  {'before':>10}  {'after':>10}  {'change':>7}  unit"]
+    for row in rows:
+        label = _label((row["name"], row["size"] or 0))
+        change = f"{(row['ratio'] - 1) * 100:+.0f}%"
+        unit = "ms" if row["metric"] == "median_ms" else "KiB"
+        line = (
+            f"{label:<{width}}  {row['baseline']:10.2f}  {row['current']:10.2f}  {change:>7}  "
+            f"{unit:<4}"
+        )
+        if row["regressed"]:
+            line += "  REGRESSION: " + ", ".join(row["reasons"])
+        line = line.rstrip()
+        lines.append(line)
+    for title, labels in (
+        ("Only in baseline", result["only_baseline"]),
+        ("Only in current", result["only_current"]),
+    ):
+        if labels:
+            lines.append(f"{title}: {', '.join(labels)}")
+    lines.append(f"{result['regressions']} regression(s)")
+    return "\n".join(lines)
+
+
+def _load(path: str) -> dict:
+    report = json.loads(Path(path).read_text(encoding="utf-8"))
+    if report.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported report schema {report.get('schema')!r}")
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("baseline", help="Report from the earlier run")
+    parser.add_argument("current", help="Report from the run under test")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed fractional growth of a median (default: 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="Ignore median growth smaller than this (default: 1.0)",
+    )
+    parser.add_argument(
+        "--min-delta-kb",
+        type=float,
+        default=1024,
+        help="Ignore peak RSS growth smaller than this (default: 1024)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    args = parser.parse_args()
+
+    try:
+        baseline, current = _load(args.baseline), _load(args.current)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if baseline.get("suite") != current.get("suite"):
+        print(
+            f"Error: suites differ ({baseline.get('suite')} vs {current.get('suite')})",
+            file=sys.stderr,
+        )
+        return 2
+
+    result = compare(baseline, current, args.threshold, args.min_delta_ms, args.min_delta_kb)
+    print(json.dumps(result, indent=2) if args.json else format_comparison(result))
+    return 1 if result["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
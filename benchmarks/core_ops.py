@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""Benchmark core template operations against synthetic stores.
+
+Builds stores of 100, 1k, 10k and 50k templates (see
+``_common.synthetic_template`` for their shape) in a temporary directory and
+times, for each size:
+
+- ``TemplateManager.list_all`` and ``TemplateManager.get``
+- ``validate_all``
+- ``build_command_catalog``
+- ``sync_to_espanso`` into a temporary match directory (no Espanso restart)
+- ``import_templates`` of a flat directory into an empty store
+- ``build_bundled_template_report`` (first round cold, later rounds warm)
+
+Configuration is a default :class:`Config`; the user's config and Espanso
+install are never touched.
+
+Usage::
+
+    python benchmarks/core_ops.py                          # all sizes, JSON to stdout
+    python benchmarks/core_ops.py --sizes 100,1k --rounds 3
+    python benchmarks/core_ops.py --out after.json
+    python benchmarks/compare.py before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from _common import emit, make_report, make_store, parse_sizes, summarize, time_rounds
+
+from espansr.core.command_catalog import build_command_catalog
+from espansr.core.config import Config
+from espansr.core.templates import (
+    TemplateManager,
+    build_bundled_template_report,
+    import_templates,
+)
+from espansr.integrations import espanso
+from espansr.integrations.validate import validate_all
+
+DEFAULT_SIZES = "100,1k,10k,50k"
+GET_LOOKUPS = 20
+
+
+@contextlib.contextmanager
+def _isolated(manager: TemplateManager, match_dir: Path):
+    """Point every module-level lookup at *manager*, *match_dir* and a default config."""
+    config = Config()
+    with contextlib.ExitStack() as stack:
+        for target in (
+            "espansr.core.templates.get_config",
+            "espansr.core.command_catalog.get_config",
+            "espansr.integrations.validate.get_config",
+            "espansr.integrations.espanso.get_config",
+        ):
+            stack.enter_context(patch(target, return_value=config))
+        for target in (
+            "espansr.core.templates.get_template_manager",
+            "espansr.integrations.validate.get_template_manager",
+            "espansr.integrations.espanso.get_template_manager",
+        ):
+            stack.enter_context(patch(target, return_value=manager))
+        stack.enter_context(patch.object(espanso, "get_match_dir", return_value=match_dir))
+        stack.enter_context(patch.object(espanso, "clean_stale_espanso_files"))
+        stack.enter_context(patch.object(espanso, "_request_publish_restart", return_value=None))
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        yield config
+
+
+def _bench_size(root: Path, size: int, rounds: int, budget: float) -> list[dict]:
+    store = make_store(root / "store", size)
+    import_source = make_store(root / "import-source", size, seed=1, flat=True)
+    import_target = root / "import-target"
+    match_dir = root / "espanso" / "match"
+    match_dir.mkdir(parents=True)
+    manager = TemplateManager(store)
+    names = [f"Template {i:05d}" for i in random.Random(2).sample(range(size), GET_LOOKUPS)]
+
+    results = []
+
+    def record(name, func, *, setup=None, **counts):
+        samples, value = time_rounds(func, rounds, setup=setup, budget=budget)
+        results.append(summarize(name, samples, size, **counts))
+        return value
+
+    with _isolated(manager, match_dir) as config:
+        templates = record("list_all", manager.list_all)
+        results[-1]["counts"]["templates"] = len(templates)
+
+        record("get", lambda: [manager.get(name) for name in names], lookups=GET_LOOKUPS)
+
+        warnings = record("validate_all", validate_all)
+        results[-1]["counts"]["warnings"] = len(warnings)
+
+        catalog = record("build_command_catalog", lambda: build_command_catalog(manager, config))
+        results[-1]["counts"]["entries"] = len(catalog)
+
+        record("sync_to_espanso", espanso.sync_to_espanso)
+        results[-1]["counts"]["triggers"] = espanso._last_sync_count
+
+        def reset_import_target():
+            shutil.rmtree(import_target, ignore_errors=True)
+
+        summary = record(
+            "import_templates",
+            lambda: import_templates(import_source, TemplateManager(import_target)),
+            setup=reset_import_target,
+        )
+        results[-1]["counts"]["imported"] = summary.succeeded
+
+        report = record(
+            "build_bundled_template_report",
+            lambda: build_bundled_template_report(templates_dir=store),
+        )
+        results[-1]["counts"]["errors"] = len(report.errors)
+
+    return results
+
+
+def run(sizes: list[int], rounds: int, budget: float) -> dict:
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            results.extend(_bench_size(Path(tmp), size, rounds, budget))
+        print(f"size {size}: done", file=sys.stderr)
+    return make_report("core_ops", results, sizes=sizes, rounds=rounds, budget_seconds=budget)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated store sizes, 'k' suffix allowed (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per operation")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="Stop repeating an operation after this many seconds (default: 30)",
+    )
+    parser.add_argument("--out", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    emit(run(parse_sizes(args.sizes), args.rounds, args.budget), args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
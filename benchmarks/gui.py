@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+"""Benchmark the GUI against synthetic stores on an offscreen Qt platform.
+
+For each store size (see ``_common.synthetic_template`` for the template
+shape) this measures:
+
+- construction of ``MainWindow``, ``TemplateBrowserWidget`` and
+  ``CommandsPopupDialog`` (shown and laid out, so painting is included);
+- browser filter latency per keystroke while typing queries into the search
+  field and erasing them again;
+- ``TemplateEditorWidget`` preview latency per keystroke typed into the
+  content of the largest template, and the time to load that template;
+- peak resident set size.
+
+Each size runs in its own child process so its peak RSS is not inflated by a
+larger store measured earlier. ``QT_QPA_PLATFORM`` defaults to
+``offscreen``; a default :class:`Config` is used and Espanso is never touched.
+The commands popup builds one card widget per trigger and dominates large
+runs; ``--skip popup`` leaves it out.
+
+Usage::
+
+    python benchmarks/gui.py                          # all sizes, JSON to stdout
+    python benchmarks/gui.py --sizes 100,1k --rounds 3
+    python benchmarks/gui.py --sizes 50k --skip popup
+    python benchmarks/gui.py --out after.json
+    python benchmarks/compare.py before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from _common import (  # noqa: E402
+    emit,
+    make_report,
+    make_store,
+    memory_result,
+    parse_sizes,
+    summarize,
+    time_rounds,
+)
+
+DEFAULT_SIZES = "100,1k,10k,50k"
+FILTER_QUERIES = ("template 01", "review", ":t004")
+PREVIEW_TEXT = " thanks {{var0}}"
+WIDGETS = ("main_window", "browser", "popup", "editor")
+
+
+@contextlib.contextmanager
+def _isolated(manager, match_dir: Path):
+    """Point the UI's config and store lookups at *manager* and a default config."""
+    from espansr.core.config import Config
+
+    config = Config()
+    with contextlib.ExitStack() as stack:
+        for target in (
+            "espansr.core.templates.get_config",
+            "espansr.core.command_catalog.get_config",
+            "espansr.ui.main_window.get_config",
+            "espansr.ui.template_browser.get_config",
+            "espansr.ui.template_editor.get_config",
+            "espansr.ui.commands_popup.get_config",
+        ):
+            stack.enter_context(patch(target, return_value=config))
+        for target in (
+            "espansr.core.templates.get_template_manager",
+            "espansr.ui.template_browser.get_template_manager",
+            "espansr.ui.template_editor.get_template_manager",
+        ):
+            stack.enter_context(patch(target, return_value=manager))
+        for target in (
+            "espansr.ui.main_window.get_config_manager",
+            "espansr.ui.main_window.save_config",
+        ):
+            stack.enter_context(patch(target))
+        stack.enter_context(
+            patch("espansr.integrations.espanso.get_match_dir", return_value=match_dir)
+        )
+        stack.enter_context(
+            patch(
+                "espansr.integrations.espanso.get_espanso_config_dir", return_value=match_dir.parent
+            )
+        )
+        stack.enter_context(patch("espansr.integrations.espanso.clean_stale_espanso_files"))
+        yield config
+
+
+def _keystroke_samples(app, widget, text: str, rounds: int, *, erase: bool = True) -> list[float]:
+    """Type *text* into *widget* (then erase it); return seconds per keystroke."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtTest import QTest
+
+    samples = []
+    for _ in range(rounds):
+        keys = [(ch, None) for ch in text]
+        if erase:
+            keys += [(None, Qt.Key.Key_Backspace)] * len(text)
+        for char, key in keys:
+            start = time.perf_counter()
+            if key is None:
+                QTest.keyClicks(widget, char)
+            else:
+                QTest.keyClick(widget, key)
+            app.processEvents()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _bench_size(
+    root: Path, size: int, rounds: int, budget: float, skip: frozenset[str] = frozenset()
+) -> list[dict]:
+    from PyQt6.QtWidgets import QApplication
+
+    from espansr.core.command_catalog import build_command_catalog
+    from espansr.core.templates import TemplateManager
+    from espansr.ui.commands_popup import CommandsPopupDialog
+    from espansr.ui.main_window import MainWindow
+    from espansr.ui.template_browser import TemplateBrowserWidget
+
+    app = QApplication.instance() or QApplication([])
+    manager = TemplateManager(make_store(root / "store", size))
+    match_dir = root / "espanso" / "match"
+    match_dir.mkdir(parents=True)
+    results = []
+
+    def construct(name, factory, **counts):
+        widgets = []
+
+        def build():
+            widget = factory()
+            widget.show()
+            app.processEvents()
+            widgets.append(widget)
+
+        def dispose():
+            while widgets:
+                widgets.pop().deleteLater()
+            app.processEvents()
+
+        samples, _ = time_rounds(build, rounds, setup=dispose, budget=budget)
+        results.append(summarize(name, samples, size, **counts))
+        return widgets[-1]
+
+    with _isolated(manager, match_dir) as config:
+        if "main_window" not in skip:
+            window = construct("main_window.construct", MainWindow)
+            window.close()
+            window.deleteLater()
+
+        if "browser" not in skip:
+            browser = construct("browser.construct", TemplateBrowserWidget)
+            browser._search.setFocus()
+            for query in FILTER_QUERIES:
+                samples = _keystroke_samples(app, browser._search, query, rounds)
+                name = f"browser.filter_keystroke[{query}]"
+                results.append(summarize(name, samples, size, keys=len(samples)))
+            browser.close()
+            browser.deleteLater()
+
+        if "popup" not in skip:
+            catalog = build_command_catalog(manager, config)
+            popup = construct(
+                "commands_popup.construct",
+                lambda: CommandsPopupDialog(entries=catalog),
+                entries=len(catalog),
+            )
+            popup.close()
+            popup.deleteLater()
+
+        if "editor" not in skip:
+            _bench_editor(app, manager, size, rounds, budget, results)
+
+    results.append(memory_result("peak_rss", size))
+    return results
+
+
+def _bench_editor(app, manager, size: int, rounds: int, budget: float, results: list) -> None:
+    """Time loading the largest template and typing into its content."""
+    from PyQt6.QtGui import QTextCursor
+
+    from espansr.ui.template_editor import TemplateEditorWidget
+
+    largest = max(manager.list_all(), key=lambda t: len(t.content))
+    editor = TemplateEditorWidget()
+    editor.set_previews_visible(True)
+    editor.show()
+    samples, _ = time_rounds(lambda: editor.load_template(largest), rounds, budget=budget)
+    results.append(summarize("editor.load_template", samples, size, chars=len(largest.content)))
+
+    editor._content_edit.setFocus()
+    editor._content_edit.moveCursor(QTextCursor.MoveOperation.End)
+    samples = _keystroke_samples(app, editor._content_edit, PREVIEW_TEXT, rounds)
+    results.append(summarize("editor.preview_keystroke", samples, size, keys=len(samples)))
+    editor.close()
+    editor.deleteLater()
+    app.processEvents()
+
+
+def _run_worker(size: int, rounds: int, budget: float, skip: frozenset[str]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        print(json.dumps(_bench_size(Path(tmp), size, rounds, budget, skip)))
+
+
+def run(sizes: list[int], rounds: int, budget: float, skip: frozenset[str] = frozenset()) -> dict:
+    results = []
+    for size in sizes:
+        command = [
+            sys.executable,
+            __file__,
+            "--worker",
+            str(size),
+            "--rounds",
+            str(rounds),
+            "--budget",
+            str(budget),
+            *(arg for name in sorted(skip) for arg in ("--skip", name)),
+        ]
+        proc = subprocess.run(command, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"size {size} failed:\n{proc.stderr}")
+        results.extend(json.loads(proc.stdout.splitlines()[-1]))
+        print(f"size {size}: done", file=sys.stderr)
+    return make_report(
+        "gui",
+        results,
+        sizes=sizes,
+        rounds=rounds,
+        budget_seconds=budget,
+        skipped=sorted(skip),
+        qpa_platform=os.environ["QT_QPA_PLATFORM"],
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated store sizes, 'k' suffix allowed (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="Stop repeating a construction after this many seconds (default: 30)",
+    )
+    parser.add_argument(
+        "--skip",
+        action="append",
+        choices=WIDGETS,
+        default=[],
+        help="Leave out one widget's measurements (repeatable)",
+    )
+    parser.add_argument("--out", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker is not None:
+        _run_worker(args.worker, args.rounds, args.budget, frozenset(args.skip))
+        return 0
+    emit(run(parse_sizes(args.sizes), args.rounds, args.budget, frozenset(args.skip)), args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""Benchmark ``RemoteManager.pull_with_result`` against a local bare repository.
+
+Creates a bare remote and two clones in a temporary directory, then measures
+git process spawns and wall time for an up-to-date pull and for a pull that
+brings in one changed template. No network access is needed.
+
+Usage::
+
+    python benchmarks/remote_pull.py                 # 20 rounds, JSON to stdout
+    python benchmarks/remote_pull.py --rounds 50 --out after.json
+
+The report uses the shared format described in ``_common.py``; each result
+counts the git processes spawned per pull.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from _common import emit, make_report, summarize
+
+from espansr.core.config import Config, ConfigManager
+from espansr.core.remote import RemoteManager
+
+
+def _clone(root: Path, remote: Path, name: str) -> RemoteManager:
+    templates_dir = root / name
+    templates_dir.mkdir()
+    config_manager = ConfigManager(config_path=root / f"{name}.json")
+    config_manager.save(Config())
+    manager = RemoteManager(templates_dir=templates_dir, config_manager=config_manager)
+    manager.set_remote(str(remote))
+    return manager
+
+
+def _measure(manager: RemoteManager) -> tuple[float, int]:
+    """Return (seconds, git spawns) for one pull."""
+    with patch.object(RemoteManager, "_git", autospec=True, side_effect=RemoteManager._git) as git:
+        start = time.perf_counter()
+        manager.pull_with_result()
+        elapsed = time.perf_counter() - start
+    return elapsed, git.call_count
+
+
+def _summarize(name: str, samples: list[tuple[float, int]]) -> dict:
+    times = [seconds for seconds, _ in samples]
+    return summarize(name, times, git_spawns=max(spawns for _, spawns in samples))
+
+
+def run(rounds: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        remote = root / "remote.git"
+        subprocess.run(["git", "init", "--bare", str(remote)], capture_output=True, check=True)
+        writer = _clone(root, remote, "writer")
+        (writer.templates_dir / "seed.json").write_text(
+            json.dumps({"name": "Seed", "content": "s", "trigger": ":seed"})
+        )
+        writer.push()
+        reader = _clone(root, remote, "reader")
+        reader.pull_with_result()
+
+        up_to_date = [_measure(reader) for _ in range(rounds)]
+
+        changed = []
+        for i in range(rounds):
+            (writer.templates_dir / "seed.json").write_text(
+                json.dumps({"name": "Seed", "content": f"s{i}", "trigger": ":seed"})
+            )
+            writer.push()
+            changed.append(_measure(reader))
+
+    results = [_summarize("pull.up_to_date", up_to_date), _summarize("pull.changed", changed)]
+    return make_report("remote_pull", results, rounds=rounds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20, help="Pulls per scenario")
+    parser.add_argument("--out", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    emit(run(args.rounds), args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,14 +21,50 @@ from pathlib import Path
 from espansr.core.cli_color import fail, ok, warn
 from espansr.core.config import get_config_dir, get_templates_dir
 from espansr.core.platform import get_platform
-from espansr.integrations.espanso import (
-    _get_candidate_paths,
-    clean_stale_espanso_files,
-    generate_commands_popup_file,
-    generate_launcher_file,
-    generate_sync_file,
-    get_espanso_config_dir,
-)
+
+# ── Lazy Espanso helpers ──────────────────────────────────────────────────────
+# The Espanso integration pulls in PyYAML, the template store, validation, and
+# the command catalog. Importing it here would charge that to every command,
+# including `--version` and orchestratr's `status --json` readiness probe, so
+# the helpers below import it on first call. They stay module attributes so
+# callers and tests can keep patching ``espansr.__main__.<name>``.
+
+
+def _espanso():
+    """Return the Espanso integration module, importing it on first use."""
+    from espansr.integrations import espanso
+
+    return espanso
+
+
+def get_espanso_config_dir():
+    """Lazy alias for :func:`espansr.integrations.espanso.get_espanso_config_dir`."""
+    return _espanso().get_espanso_config_dir()
+
+
+def _get_candidate_paths():
+    """Lazy alias for :func:`espansr.integrations.espanso._get_candidate_paths`."""
+    return _espanso()._get_candidate_paths()
+
+
+def clean_stale_espanso_files() -> None:
+    """Lazy alias for :func:`espansr.integrations.espanso.clean_stale_espanso_files`."""
+    _espanso().clean_stale_espanso_files()
+
+
+def generate_launcher_file(*args, **kwargs) -> bool:
+    """Lazy alias for :func:`espansr.integrations.espanso.generate_launcher_file`."""
+    return _espanso().generate_launcher_file(*args, **kwargs)
+
+
+def generate_commands_popup_file(*args, **kwargs) -> bool:
+    """Lazy alias for :func:`espansr.integrations.espanso.generate_commands_popup_file`."""
+    return _espanso().generate_commands_popup_file(*args, **kwargs)
+
+
+def generate_sync_file(*args, **kwargs) -> bool:
+    """Lazy alias for :func:`espansr.integrations.espanso.generate_sync_file`."""
+    return _espanso().generate_sync_file(*args, **kwargs)
 
 
 def _print_wsl_espanso_remediation() -> None:
@@ -173,7 +209,10 @@ exit 0
 
 
 def _auto_pull_if_configured() -> None:
-    """Run auto-pull silently if a remote is configured."""
+    """Apply background-fetched remote changes and schedule the next fetch.
+
+    Never blocks on the network; see ``RemoteManager.auto_pull``.
+    """
     try:
         from espansr.core.remote import RemoteManager
 
@@ -183,19 +222,51 @@ def _auto_pull_if_configured() -> None:
         pass  # auto-pull failures are non-blocking
 
 
+def _report_espanso_restart() -> None:
+    """Wait for the background restart of the last publish and report readiness."""
+    from espansr.core.spans import span
+    from espansr.integrations import espanso
+
+    handle = espanso._last_restart
+    if handle is None:
+        return
+    with span("espanso restart wait"):
+        ready = handle.wait()
+    if ready:
+        print(ok("Espanso is running with the new triggers."))
+    elif ready is False:
+        print(warn("Espanso did not report running after the restart; check 'espanso status'."))
+
+
 def cmd_publish(args) -> int:
-    """Publish local triggered templates to Espanso output."""
-    from espansr.integrations.espanso import sync_to_espanso
+    """Publish local triggered templates to Espanso output.
+
+    The Espanso restart runs in the background; the command waits for it only
+    to report whether Espanso came back up.
+    """
+    from espansr.integrations import espanso
 
     dry_run = getattr(args, "dry_run", False) if args else False
-    success = sync_to_espanso(
+    espanso._last_restart = None
+    success = espanso.sync_to_espanso(
         dry_run=dry_run,
         update_bundled=True,
         bundled_dir=_get_bundled_dir(),
     )
+    if success:
+        if not dry_run:
+            _record_status(get_espanso_config_dir())
+        _report_espanso_restart()
     return 0 if success else 1
 
 
+def _record_status(espanso_dir: Path | None) -> None:
+    """Save what publish or setup learned for ``status --json`` to answer from."""
+    from espansr.core.status_record import write_status_record
+
+    write_status_record(get_config_dir(), espanso_dir)
+
+
 def _get_bundled_dir() -> Path:
     """Return the path to the bundled templates directory.
 
@@ -292,6 +363,8 @@ def cmd_setup(args) -> int:
     # ── Espanso detection and launcher ────────────────────────────────────
     espanso_dir = get_espanso_config_dir()
     espanso_found = bool(espanso_dir)
+    if not dry_run:
+        _record_status(espanso_dir)
     if espanso_dir:
         if dry_run:
             print(f"[dry-run] Would detect Espanso config: {espanso_dir}")
@@ -431,6 +504,8 @@ def cmd_sync_bundled(args) -> int:
         TemplateManager,
         apply_bundled_template_report,
         build_bundled_template_report,
+        bundled_reconciliation_is_current,
+        record_bundled_reconciliation,
     )
 
     apply = getattr(args, "apply", False) if args else False
@@ -443,9 +518,15 @@ def cmd_sync_bundled(args) -> int:
         return 2
 
     templates_dir = get_templates_dir()
+    bundled_dir = _get_bundled_dir()
+    if not apply and not verbose and bundled_reconciliation_is_current(templates_dir, bundled_dir):
+        print("Bundled templates: unchanged since the last reconciliation")
+        print(ok("Bundled templates are already in sync."))
+        return 0
+
     report = build_bundled_template_report(
         templates_dir=templates_dir,
-        bundled_dir=_get_bundled_dir(),
+        bundled_dir=bundled_dir,
     )
 
     if report.errors:
@@ -472,6 +553,7 @@ def cmd_sync_bundled(args) -> int:
     if not apply:
         if report.has_drift():
             return 1
+        record_bundled_reconciliation(templates_dir, bundled_dir)
         print(ok("Bundled templates are already in sync."))
         return 0
 
@@ -505,6 +587,8 @@ def cmd_sync_bundled(args) -> int:
             print(f"  {entry.filename}")
         return 1
 
+    if not dry_run:
+        record_bundled_reconciliation(templates_dir, bundled_dir)
     return 0
 
 
@@ -517,7 +601,7 @@ def cmd_status(args) -> int:
     if getattr(args, "json", False):
         from espansr.integrations.orchestratr import get_status_json
 
-        print(get_status_json())
+        print(get_status_json(live=getattr(args, "live", False)))
         return 0
 
     config_dir = get_espanso_config_dir()
@@ -532,6 +616,11 @@ def cmd_status(args) -> int:
                     " (https://espanso.org), then run 'espanso start' from PowerShell"
                 )
             )
+            from espansr.integrations.espanso import get_windows_espanso_config_path
+
+            reported = get_windows_espanso_config_path()
+            if reported:
+                print(warn(f"Windows Espanso reports its config at {reported}"))
             _print_wsl_espanso_remediation()
         else:
             print(
@@ -549,7 +638,14 @@ def cmd_status(args) -> int:
 
     # WSL2: Espanso runs on the Windows side
     if get_platform() == "wsl2":
+        from espansr.integrations.espanso import espanso_status
+
         print(warn("Espanso binary: Windows host (WSL2 — use PowerShell to manage)"))
+        running = espanso_status()
+        if running is True:
+            print(ok("Espanso service: running"))
+        elif running is False:
+            print(warn("Espanso service: not running — run 'espanso start' from PowerShell"))
     else:
         print(fail("Espanso binary: not found"))
 
@@ -578,11 +674,36 @@ def cmd_list(args) -> int:
 
 
 def cmd_validate(args) -> int:
-    """Validate templates for Espanso compatibility."""
-    from espansr.integrations.validate import validate_all
+    """Validate templates for Espanso compatibility.
 
-    _auto_pull_if_configured()
-    warnings = validate_all()
+    ``--format ndjson|json|sarif`` streams machine-readable results to stdout
+    as they are found; anything else the run prints goes to stderr so stdout
+    stays parseable. ``--changed-since REV`` runs the per-template checks only
+    for templates changed since a git revision.
+    """
+    import contextlib
+
+    from espansr.core.templates import get_template_manager
+    from espansr.integrations.validate import iter_validate_all, validate_all
+    from espansr.integrations.validation_report import write_report
+
+    fmt = getattr(args, "format", None) or "text"
+    stdout = sys.stdout
+    quiet = contextlib.redirect_stdout(sys.stderr) if fmt != "text" else contextlib.nullcontext()
+    with quiet:
+        _auto_pull_if_configured()
+        only = None
+        if getattr(args, "changed_since", None):
+            templates_dir = get_template_manager().templates_dir
+            only = _changed_template_paths(templates_dir, args.changed_since)
+            if only is None:
+                return 1
+        if fmt != "text":
+            templates_dir = get_template_manager().templates_dir if fmt == "sarif" else None
+            errors = write_report(iter_validate_all(only), fmt, stdout, templates_dir)
+            return 1 if errors else 0
+
+    warnings = validate_all(only)
     errors = [w for w in warnings if w.severity == "error"]
     non_errors = [w for w in warnings if w.severity != "error"]
 
@@ -597,29 +718,49 @@ def cmd_validate(args) -> int:
     return 1 if errors else 0
 
 
+def _changed_template_paths(templates_dir: Path, rev: str) -> "set[str] | None":
+    """Return files under *templates_dir* changed since *rev*, relative to it.
+
+    Covers committed and uncommitted changes to tracked files plus untracked
+    files, so a template added in the working tree counts as changed. Paths
+    are read NUL-separated (``-z``) so git does not quote non-ASCII names.
+    Prints an error and returns None when git cannot answer.
+    """
+    if rev.startswith("-"):
+        print(f"Error: not a git revision: {rev}")
+        return None
+    changed: set[str] = set()
+    for command in (
+        ("diff", "--name-only", "-z", "--relative", rev, "--"),
+        ("ls-files", "-z", "--others", "--exclude-standard"),
+    ):
+        try:
+            result = _git_in(templates_dir, *command, timeout=30)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Error: could not run git in {templates_dir}: {e}")
+            return None
+        if result.returncode != 0:
+            print(f"Error: cannot list templates changed since {rev}: {result.stderr.strip()}")
+            return None
+        changed.update(path for path in result.stdout.split("\0") if path)
+    return changed
+
+
 def cmd_import(args) -> int:
-    """Import template JSON file(s) from an external path."""
+    """Import templates from a JSON file, Espanso match YAML, archive, bundle, or directory."""
     from pathlib import Path
 
-    from espansr.core.templates import import_template, import_templates
+    from espansr.core.bundle import is_bundle_path, iter_import_bundle
+    from espansr.core.templates import (
+        ImportSummary,
+        import_template,
+        iter_import_templates,
+        list_import_sources,
+    )
 
     target = Path(args.path)
 
-    if target.is_dir():
-        summary = import_templates(target)
-        if summary.error:
-            print(f"Error: {summary.error}")
-            return 1
-        print(f"Imported {summary.succeeded} template(s), {summary.failed} failed.")
-        for r in summary.results:
-            if r.template:
-                suffix = " (renamed)" if r.renamed else ""
-                print(f"  + {r.template.name}{suffix}")
-            elif r.error:
-                print(f"  ! {r.error}")
-        return 1 if summary.failed and summary.succeeded == 0 else 0
-
-    if target.is_file():
+    if target.is_file() and target.suffix.lower() == ".json":
         result = import_template(target)
         if result.template:
             suffix = " (renamed)" if result.renamed else ""
@@ -629,8 +770,64 @@ def cmd_import(args) -> int:
             print(f"Error: {result.error}")
             return 1
 
-    print(f"Error: path not found: {target}")
-    return 1
+    if not target.exists():
+        print(f"Error: path not found: {target}")
+        return 1
+
+    # Directories report N/M; a YAML file or archive only knows N until it ends.
+    sources = list_import_sources(target) if target.is_dir() else [target]
+    total = f"/{len(sources)}" if target.is_dir() else ""
+    show_progress = sys.stderr.isatty()
+    if target.is_file() and is_bundle_path(target):
+        results = iter_import_bundle(target)
+    else:
+        results = iter_import_templates(sources)
+    summary = ImportSummary()
+    for result in results:
+        summary.add(result)
+        if show_progress:
+            print(
+                f"\rImporting {len(summary.results)}{total}...",
+                end="",
+                file=sys.stderr,
+                flush=True,
+            )
+    if show_progress and summary.results:
+        print(file=sys.stderr)
+    print(f"Imported {summary.succeeded} template(s), {summary.failed} failed.")
+    for r in summary.results:
+        if r.template:
+            suffix = " (renamed)" if r.renamed else ""
+            print(f"  + {r.template.name}{suffix}")
+            if r.warning:
+                print(f"    warning: {r.warning}")
+        elif r.error:
+            print(f"  ! {r.error}")
+    return 1 if summary.failed and summary.succeeded == 0 else 0
+
+
+def cmd_export(args) -> int:
+    """Export the live template store to a single-file JSONL bundle."""
+    from pathlib import Path
+
+    from espansr.core.bundle import export_bundle, is_bundle_path
+
+    out_path = Path(args.bundle)
+    if not is_bundle_path(out_path):
+        print(fail("Bundle path must end in .jsonl or .jsonl.gz"))
+        return 2
+
+    try:
+        result = export_bundle(out_path, get_templates_dir(), include_history=args.history)
+    except OSError as exc:
+        print(fail(f"Could not write bundle: {exc}"))
+        return 1
+
+    for rel in result.skipped:
+        print(warn(f"Skipped unreadable template: {rel}"))
+    history = f" and {result.versions} history file(s)" if args.history else ""
+    print(ok(f"Exported {result.templates} template(s){history} to {out_path}"))
+    return 0
 
 
 @dataclass(frozen=True)
@@ -765,153 +962,201 @@ def cmd_retire(args) -> int:
     return 1
 
 
-def cmd_doctor(args) -> int:
-    """Run diagnostic health checks and print a consolidated report.
+def _doctor_checks(platform: str) -> list:
+    """Build the registry of ``espansr doctor`` checks, in report order.
 
-    Checks Python version, config dir, templates, Espanso config,
-    Espanso binary, launcher file, and template validation.
-    Returns 0 if no checks fail, 1 if any check is [FAIL].
+    Checks run concurrently, so values several of them need (the Espanso
+    config dir and match dir) go through a :class:`SharedProbe` and are
+    detected once.
     """
-    _auto_pull_if_configured()
+    from espansr.core.doctor import DoctorCheck, SharedProbe
     from espansr.core.templates import get_template_manager
     from espansr.integrations.espanso import get_match_dir
     from espansr.integrations.validate import validate_all
 
-    has_fail = False
-
-    def _ok(msg: str) -> None:
-        print(ok(msg))
-
-    def _warn(msg: str) -> None:
-        print(warn(msg))
+    espanso_dir = SharedProbe(lambda: get_espanso_config_dir())
 
-    def _fail(msg: str) -> None:
-        nonlocal has_fail
-        has_fail = True
-        print(fail(msg))
+    def _match_dir():
+        espanso_dir()  # detect (and persist) once before get_match_dir reads it
+        return get_match_dir()
 
-    # 1. Python version
-    ver = sys.version_info
-    if ver >= (3, 11):
-        _ok(f"Python {ver.major}.{ver.minor}.{ver.micro}")
-    else:
-        _fail(f"Python {ver.major}.{ver.minor}.{ver.micro} (3.11+ required)")
+    match_dir = SharedProbe(_match_dir)
 
-    # 2. espansr config dir
-    config_dir = get_config_dir()
-    if config_dir.is_dir():
-        _ok(f"Config dir: {config_dir}")
-    else:
-        _fail(f"Config dir not found: {config_dir}")
+    def check_python(report) -> None:
+        ver = sys.version_info
+        if ver >= (3, 11):
+            report.ok(f"Python {ver.major}.{ver.minor}.{ver.micro}")
+        else:
+            report.fail(f"Python {ver.major}.{ver.minor}.{ver.micro} (3.11+ required)")
 
-    # 3. Templates found
-    manager = get_template_manager()
-    triggered = list(manager.iter_with_triggers())
-    if triggered:
-        _ok(f"Templates: {len(triggered)} with triggers")
-    else:
-        _fail("No templates with triggers found")
+    def check_config_dir(report) -> None:
+        config_dir = get_config_dir()
+        if config_dir.is_dir():
+            report.ok(f"Config dir: {config_dir}")
+        else:
+            report.fail(f"Config dir not found: {config_dir}")
 
-    # 4. Espanso config detected
-    espanso_dir = get_espanso_config_dir()
-    if espanso_dir:
-        _ok(f"Espanso config: {espanso_dir}")
-    else:
-        _fail("Espanso config: not found")
-        if get_platform() == "wsl2":
-            _warn("WSL2 dependency: Espanso must be installed and started on Windows")
+    def check_templates(report) -> None:
+        triggered = list(get_template_manager().iter_with_triggers())
+        if triggered:
+            report.ok(f"Templates: {len(triggered)} with triggers")
+        else:
+            report.fail("No templates with triggers found")
 
-    # 5. Espanso binary
-    espanso_bin = shutil.which("espanso")
-    platform = get_platform()
-    if espanso_bin:
-        _ok(f"Espanso binary: {espanso_bin}")
-    elif platform == "wsl2":
-        _ok("Espanso binary: Windows host (WSL2)")
-        # Only suggest remediation when Windows-side Espanso config is not detected.
-        if not espanso_dir:
-            _warn("WSL2 remediation: run 'espanso start' in PowerShell, then 'espansr doctor'")
-    else:
-        _fail("Espanso binary: not found")
+    def check_espanso_config(report) -> None:
+        found = espanso_dir()
+        if found:
+            report.ok(f"Espanso config: {found}")
+        else:
+            report.fail("Espanso config: not found")
+            if platform == "wsl2":
+                report.warn("WSL2 dependency: Espanso must be installed and started on Windows")
+
+    def check_espanso_binary(report) -> None:
+        espanso_bin = shutil.which("espanso")
+        if espanso_bin:
+            report.ok(f"Espanso binary: {espanso_bin}")
+        elif platform == "wsl2":
+            report.ok("Espanso binary: Windows host (WSL2)")
+            # Only suggest remediation when Windows-side Espanso config is not detected.
+            if not espanso_dir():
+                report.warn(
+                    "WSL2 remediation: run 'espanso start' in PowerShell, then 'espansr doctor'"
+                )
+        else:
+            report.fail("Espanso binary: not found")
 
-    # 5b. WSL candidate conflict visibility
-    if platform == "wsl2":
+    def check_wsl_candidates(report) -> None:
         existing_candidates = []
         for p in _get_candidate_paths():
             try:
                 if p.exists():
                     existing_candidates.append(p)
             except PermissionError:
-                _warn(f"Skipping unreadable candidate path: {p}")
+                report.warn(f"Skipping unreadable candidate path: {p}")
             except OSError as exc:
-                _warn(f"Skipping candidate path due to OS error ({exc}): {p}")
-        if espanso_dir:
-            _ok(f"Canonical Espanso path: {espanso_dir}")
+                report.warn(f"Skipping candidate path due to OS error ({exc}): {p}")
+        canonical = espanso_dir()
+        if canonical:
+            report.ok(f"Canonical Espanso path: {canonical}")
         if len(existing_candidates) > 1:
-            _warn("Conflict risk: multiple Espanso candidate paths detected")
+            report.warn("Conflict risk: multiple Espanso candidate paths detected")
             for candidate in existing_candidates:
-                if candidate != espanso_dir:
-                    _warn(f"  Non-canonical candidate: {candidate}")
-            _warn("Recommendation: keep one active config path and rerun 'espansr doctor'")
-
-    # 6. Launcher file
-    match_dir = get_match_dir()
-    if match_dir and (match_dir / "espansr-launcher.yml").exists():
-        _ok("Launcher: espansr-launcher.yml present")
-    else:
-        _fail("Launcher: espansr-launcher.yml not found")
+                if candidate != canonical:
+                    report.warn(f"  Non-canonical candidate: {candidate}")
+            report.warn("Recommendation: keep one active config path and rerun 'espansr doctor'")
+
+    def check_launcher(report) -> None:
+        found = match_dir()
+        if found and (found / "espansr-launcher.yml").exists():
+            report.ok("Launcher: espansr-launcher.yml present")
+        else:
+            report.fail("Launcher: espansr-launcher.yml not found")
 
-    # 6b. Commands popup file
-    if match_dir and (match_dir / "espansr-commands.yml").exists():
-        _ok("Commands popup: espansr-commands.yml present")
-    else:
-        _fail("Commands popup: espansr-commands.yml not found")
+    def check_commands_popup(report) -> None:
+        found = match_dir()
+        if found and (found / "espansr-commands.yml").exists():
+            report.ok("Commands popup: espansr-commands.yml present")
+        else:
+            report.fail("Commands popup: espansr-commands.yml not found")
+
+    def check_command_availability(report) -> None:
+        # PATH-visible `espansr` shim. Warn-only so doctor exit-code semantics
+        # for the other checks are preserved. Surfaces the same failure mode
+        # that RDP/RustDesk-spawned non-interactive shells hit when only a
+        # shell alias exists.
+        from espansr.core.platform import (
+            ensure_command_shim,
+            get_user_bin_dir,
+            is_user_bin_on_path,
+        )
 
-    # 6c. Command availability — PATH-visible `espansr` shim. Non-blocking:
-    # always warn-only so doctor exit-code semantics for existing checks are
-    # preserved. Surfaces the same failure mode that RDP/RustDesk-spawned
-    # non-interactive shells hit when only a shell alias exists.
-    from espansr.core.platform import (
-        ensure_command_shim,
-        get_user_bin_dir,
-        is_user_bin_on_path,
-    )
+        user_bin = get_user_bin_dir()
+        # Probe without mutating: re-check current state via a dry inspect.
+        shim_path = user_bin / ("espansr.exe" if platform == "windows" else "espansr")
+        if shim_path.exists() or shim_path.is_symlink():
+            report.ok(f"Command availability: shim present at {shim_path}")
+        else:
+            # Try to create it if missing — repairs the common case where the
+            # user installed before the shim existed.
+            result = ensure_command_shim()
+            if result.status in ("created", "updated", "unchanged"):
+                report.ok(f"Command availability: {result.message}")
+            elif result.status == "conflict":
+                report.warn(f"Command availability: {result.message}")
+                report.warn("Run 'espansr setup --force-shim' to repair")
+            else:
+                report.warn(f"Command availability: {result.message}")
 
-    user_bin = get_user_bin_dir()
-    # Probe without mutating: re-check current state via a dry inspect.
-    shim_path = user_bin / ("espansr.exe" if platform == "windows" else "espansr")
-    if shim_path.exists() or shim_path.is_symlink():
-        _ok(f"Command availability: shim present at {shim_path}")
-    else:
-        # Try to create it if missing — repairs the common case where the
-        # user installed before the shim existed.
-        result = ensure_command_shim()
-        if result.status in ("created", "updated", "unchanged"):
-            _ok(f"Command availability: {result.message}")
-        elif result.status == "conflict":
-            _warn(f"Command availability: {result.message}")
-            _warn("Run 'espansr setup --force-shim' to repair")
+        if not is_user_bin_on_path(user_bin):
+            report.warn(
+                f"Command availability: {user_bin} is not on PATH for this process; "
+                "open a new login shell or add it to your shell profile"
+            )
+
+    def check_validation(report) -> None:
+        warnings = validate_all()
+        errors = [w for w in warnings if w.severity == "error"]
+        non_errors = [w for w in warnings if w.severity != "error"]
+        if errors:
+            report.fail(f"Validation: {len(errors)} error(s)")
+        elif non_errors:
+            report.warn(f"Validation: {len(non_errors)} warning(s)")
         else:
-            _warn(f"Command availability: {result.message}")
+            report.ok("Validation: all templates valid")
+
+    checks = [
+        DoctorCheck("python", check_python),
+        DoctorCheck("config-dir", check_config_dir),
+        DoctorCheck("templates", check_templates),
+        DoctorCheck("espanso-config", check_espanso_config),
+        DoctorCheck("espanso-binary", check_espanso_binary),
+    ]
+    if platform == "wsl2":
+        checks.append(DoctorCheck("espanso-candidates", check_wsl_candidates))
+    checks += [
+        DoctorCheck("launcher", check_launcher),
+        DoctorCheck("commands-popup", check_commands_popup),
+        DoctorCheck("command-availability", check_command_availability, required=False),
+        DoctorCheck("validation", check_validation, timeout=30.0),
+    ]
+    return checks
 
-    if not is_user_bin_on_path(user_bin):
-        _warn(
-            f"Command availability: {user_bin} is not on PATH for this process; "
-            "open a new login shell or add it to your shell profile"
-        )
 
-    # 7. Template validation
-    warnings = validate_all()
-    errors = [w for w in warnings if w.severity == "error"]
-    non_errors = [w for w in warnings if w.severity != "error"]
-    if errors:
-        _fail(f"Validation: {len(errors)} error(s)")
-    elif non_errors:
-        _warn(f"Validation: {len(non_errors)} warning(s)")
-    else:
-        _ok("Validation: all templates valid")
+def cmd_doctor(args) -> int:
+    """Run diagnostic health checks and print a consolidated report.
 
-    return 1 if has_fail else 0
+    Checks Python version, config dir, templates, Espanso config,
+    Espanso binary, launcher file, and template validation. The checks run
+    concurrently, each under its own timeout, and are reported in a fixed
+    order. With ``--timings``, also prints each check's wall time.
+    Returns 0 if no checks fail, 1 if any check is [FAIL].
+    """
+    import time
+
+    from espansr.core.doctor import run_checks
+
+    _auto_pull_if_configured()
+    show_timings = getattr(args, "timings", False) if args else False
+    printers = {"ok": ok, "warn": warn, "fail": fail}
+
+    started = time.perf_counter()
+    results = []
+    for result in run_checks(_doctor_checks(get_platform())):
+        results.append(result)
+        for line in result.lines:
+            print(printers[line.level](line.message))
+    elapsed = time.perf_counter() - started
+
+    if show_timings:
+        print("\nTimings:")
+        width = max(len(r.name) for r in results)
+        for r in results:
+            note = "  (timed out)" if r.timed_out else ""
+            print(f"  {r.name:<{width}}  {r.seconds * 1000:8.1f} ms{note}")
+        print(f"  {'total':<{width}}  {elapsed * 1000:8.1f} ms")
+
+    return 1 if any(r.failed for r in results) else 0
 
 
 def cmd_completions(args) -> int:
@@ -928,18 +1173,15 @@ def cmd_completions(args) -> int:
 
 
 def cmd_gui(args) -> int:
-    """Launch the PyQt6 GUI."""
-    _auto_pull_if_configured()
-    if getattr(args, "view", "main") == "commands":
-        from espansr.ui.commands_popup import launch_commands_popup
+    """Launch the PyQt6 GUI, or hand the view to an already running instance."""
+    from espansr.ui.single_instance import run_gui, send_to_running_instance
 
-        launch_commands_popup()
+    view = getattr(args, "view", "main")
+    if send_to_running_instance(view):
         return 0
 
-    from espansr.ui.main_window import launch
-
-    launch()
-    return 0
+    _auto_pull_if_configured()
+    return run_gui(view, resident=getattr(args, "resident", False))
 
 
 def cmd_remote(args) -> int:
@@ -956,7 +1198,12 @@ def cmd_remote(args) -> int:
 
         if action == "set":
             url = args.url
-            rm.set_remote(url)
+            rm.set_remote(
+                url,
+                partial_clone=getattr(args, "partial", False),
+                depth=getattr(args, "depth", 0) or 0,
+                sparse_paths=getattr(args, "sparse", None),
+            )
             print(ok(f"Remote set to {url}"))
             return 0
 
@@ -970,6 +1217,12 @@ def cmd_remote(args) -> int:
                 print(f"Last pull:   {status['last_pull']}")
             if status["last_push"]:
                 print(f"Last push:   {status['last_push']}")
+            if status.get("partial_clone"):
+                print("Clone:       partial (blob:none)")
+            if status.get("depth"):
+                print(f"Depth:       {status['depth']}")
+            if status.get("sparse_paths"):
+                print(f"Folders:     {', '.join(status['sparse_paths'])}")
             if status["dirty"]:
                 print(f"Modified:    {', '.join(status['dirty'])}")
             else:
@@ -999,20 +1252,30 @@ def cmd_pull(args) -> int:
         RemoteError,
         RemoteManager,
     )
-    from espansr.integrations.espanso import sync_to_espanso
+    from espansr.integrations import espanso
 
+    espanso._last_restart = None
     try:
         rm = RemoteManager()
         templates = getattr(args, "template", None)
         if templates:
             rm.pull_templates(templates)
             print(ok(f"Pulled {len(templates)} template(s) from remote."))
+            synced = espanso.sync_to_espanso(update_bundled=False)
         else:
             outcome = rm.pull_with_result()
             _print_pull_outcome(outcome)
+            # Only the pulled files need re-parsing; an unchanged output is not rewritten.
+            synced = espanso.sync_to_espanso(
+                update_bundled=False, changed_paths=outcome.changed_files
+            )
 
-        if sync_to_espanso(update_bundled=False):
-            print(ok("Espanso output refreshed."))
+        if synced:
+            if espanso.last_sync_unchanged():
+                print(ok("Espanso output already current."))
+            else:
+                print(ok("Espanso output refreshed."))
+                _report_espanso_restart()
             return 0
 
         print(fail("Pulled remote templates, but Espanso sync failed."))
@@ -1291,15 +1554,18 @@ def cmd_refresh(args) -> int:
 
 def _git_in(repo_dir: Path, *args: str, timeout: int = 120) -> subprocess.CompletedProcess:
     """Run ``git -C <repo_dir> <args>`` with output captured and prompts disabled."""
+    from espansr.core.spans import span
+
     env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
-    return subprocess.run(
-        ["git", "-C", str(repo_dir), *args],
-        capture_output=True,
-        text=True,
-        check=False,
-        env=env,
-        timeout=timeout,
-    )
+    with span(f"git {args[0]}" if args else "git"):
+        return subprocess.run(
+            ["git", "-C", str(repo_dir), *args],
+            capture_output=True,
+            text=True,
+            check=False,
+            env=env,
+            timeout=timeout,
+        )
 
 
 def _is_git_worktree(repo_dir: Path) -> bool:
@@ -1331,14 +1597,47 @@ def _ahead_of_upstream(repo_dir: Path) -> bool:
     return result.stdout.strip() not in ("", "0")
 
 
-def _run_sync(*, no_push: bool = False) -> int:
+def _republish() -> int:
+    """Republish templates to Espanso from the freshly pulled checkout.
+
+    Runs ``espansr publish`` in a new interpreter so code pulled into the
+    editable install is the code that renders the output.
+    """
+    print(ok("Republishing templates\u2026"))
+    try:
+        completed = subprocess.run([sys.executable, "-m", "espansr", "publish"], check=False)
+    except OSError as exc:
+        print(fail(f"Could not republish templates: {exc}"))
+        return 1
+    return 0 if completed.returncode == 0 else 1
+
+
+def _reinstall_if_needed(
+    repo_dir: Path, installer: str, platform: str, *, reinstall: bool = False
+) -> int:
+    """Rerun the installer only when the install fingerprint changed.
+
+    When the recorded fingerprint still matches the checkout (and
+    ``reinstall`` is not forced), the venv is left alone and the templates are
+    republished instead.
+    """
+    from espansr.core.install_meta import install_inputs_unchanged
+
+    if not reinstall and install_inputs_unchanged(repo_dir):
+        print(ok("Install inputs unchanged; skipping reinstall."))
+        return _republish()
+    return run_installer(repo_dir, installer, platform)
+
+
+def _run_sync(*, no_push: bool = False, reinstall: bool = False) -> int:
     """Pull latest, optionally yolo-push, then reinstall \u2014 the one-button update.
 
     Resolves the install location/OS from recorded metadata, pulls the project
     repo with ``--rebase``; on a clean pull it commits and pushes any local
     changes ("yolo") unless ``no_push``; then reruns the OS-appropriate
-    installer. Stops without reinstalling on a merge conflict so a broken tree
-    is never reinstalled.
+    installer when the install fingerprint changed (or ``reinstall`` is set)
+    and otherwise only republishes. Stops without reinstalling on a merge
+    conflict so a broken tree is never reinstalled.
     """
     target = _resolve_install_target()
     if target is None:
@@ -1352,11 +1651,11 @@ def _run_sync(*, no_push: bool = False) -> int:
     try:
         fetched = _git_in(repo_dir, "fetch", "--prune")
     except (OSError, subprocess.SubprocessError) as exc:
-        print(warn(f"git fetch failed ({exc}); reinstalling current checkout."))
-        return run_installer(repo_dir, installer, platform)
+        print(warn(f"git fetch failed ({exc}); updating from the current checkout."))
+        return _reinstall_if_needed(repo_dir, installer, platform, reinstall=reinstall)
     if fetched.returncode != 0:
-        print(warn("git fetch failed (offline?); reinstalling current checkout."))
-        return run_installer(repo_dir, installer, platform)
+        print(warn("git fetch failed (offline?); updating from the current checkout."))
+        return _reinstall_if_needed(repo_dir, installer, platform, reinstall=reinstall)
 
     stashed = False
     if _worktree_dirty(repo_dir):
@@ -1400,7 +1699,7 @@ def _run_sync(*, no_push: bool = False) -> int:
     else:
         print(ok("Auto-push disabled (--no-push)."))
 
-    return run_installer(repo_dir, installer, platform)
+    return _reinstall_if_needed(repo_dir, installer, platform, reinstall=reinstall)
 
 
 def cmd_sync(args) -> int:
@@ -1409,9 +1708,13 @@ def cmd_sync(args) -> int:
     The one-button update for a machine that was already installed once: it
     rebases the project repo onto the latest, "yolo" commits and pushes any
     local changes when there is no conflict, and reruns the installer recorded
-    at first install. ``--no-push`` performs a pull-only update.
+    at first install when the install fingerprint changed. ``--no-push``
+    performs a pull-only update; ``--reinstall`` always reruns the installer.
     """
-    return _run_sync(no_push=getattr(args, "no_push", False))
+    return _run_sync(
+        no_push=getattr(args, "no_push", False),
+        reinstall=getattr(args, "reinstall", False),
+    )
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -1423,6 +1726,18 @@ def _build_parser() -> argparse.ArgumentParser:
         description="Espanso text expansion template manager",
     )
     parser.add_argument("--version", action="version", version=f"espansr {__version__}")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Print a tree of timed stages to stderr when the command finishes",
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="FILE",
+        default=None,
+        help="With profiling, also write a Chrome trace (JSON) to FILE; implies --profile",
+    )
     subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
 
     def add_publish_flags(command_parser: argparse.ArgumentParser) -> None:
@@ -1485,8 +1800,28 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Output machine-readable JSON status for orchestratr",
     )
+    status_parser.add_argument(
+        "--live",
+        action="store_true",
+        default=False,
+        help="With --json, probe Espanso instead of using the status recorded by publish/setup",
+    )
     subparsers.add_parser("list", help="List templates with triggers")
-    subparsers.add_parser("validate", help="Validate templates for Espanso compatibility")
+    validate_parser = subparsers.add_parser(
+        "validate", help="Validate templates for Espanso compatibility"
+    )
+    validate_parser.add_argument(
+        "--format",
+        choices=["text", "ndjson", "json", "sarif"],
+        default="text",
+        help="Output format; ndjson, json, and sarif stream results as they are found",
+    )
+    validate_parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        default=None,
+        help="Only run per-template checks on templates changed since this git revision",
+    )
     retire_parser = subparsers.add_parser(
         "retire",
         help="Back up and delete a local template, then publish the remaining templates",
@@ -1524,7 +1859,13 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Overwrite a non-symlink file blocking the command shim path",
     )
-    subparsers.add_parser("doctor", help="Run diagnostic health checks")
+    doctor_parser = subparsers.add_parser("doctor", help="Run diagnostic health checks")
+    doctor_parser.add_argument(
+        "--timings",
+        action="store_true",
+        default=False,
+        help="Print the wall time of each check",
+    )
     subparsers.add_parser(
         "wsl-install-espanso",
         help="WSL helper: install/start Espanso on Windows via PowerShell",
@@ -1544,6 +1885,12 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Pull and reinstall only; do not auto-commit/push local changes",
     )
+    sync_parser.add_argument(
+        "--reinstall",
+        action="store_true",
+        default=False,
+        help="Rerun the installer even when the install fingerprint is unchanged",
+    )
     record_parser = subparsers.add_parser(
         "record-install",
         help="Record install metadata for 'espansr refresh' (used by installers)",
@@ -1591,7 +1938,28 @@ def _build_parser() -> argparse.ArgumentParser:
     import_parser = subparsers.add_parser(
         "import", help="Import template(s) from a file or directory"
     )
-    import_parser.add_argument("path", help="Path to a JSON file or directory of JSON files")
+    import_parser.add_argument(
+        "path",
+        help=(
+            "Path to a JSON file, Espanso match .yml file, .zip/.tar.gz archive, "
+            ".jsonl[.gz] bundle, or directory of JSON/.yml files"
+        ),
+    )
+    export_parser = subparsers.add_parser(
+        "export", help="Export all templates to a single-file bundle"
+    )
+    export_parser.add_argument(
+        "--bundle",
+        required=True,
+        metavar="PATH",
+        help="Bundle file to write (.jsonl, or .jsonl.gz for gzip)",
+    )
+    export_parser.add_argument(
+        "--history",
+        action="store_true",
+        default=False,
+        help="Include template version history from _versions/",
+    )
     gui_parser = subparsers.add_parser("gui", help="Launch the GUI")
     gui_parser.add_argument(
         "--view",
@@ -1599,6 +1967,12 @@ def _build_parser() -> argparse.ArgumentParser:
         default="main",
         help="Choose which GUI surface to launch",
     )
+    gui_parser.add_argument(
+        "--resident",
+        action="store_true",
+        default=False,
+        help="Keep running for ui.resident_minutes after the last window closes",
+    )
     comp_parser = subparsers.add_parser("completions", help="Print shell completion script")
     comp_parser.add_argument(
         "shell",
@@ -1611,6 +1985,24 @@ def _build_parser() -> argparse.ArgumentParser:
     remote_sub = remote_parser.add_subparsers(dest="remote_action", metavar="ACTION")
     set_parser = remote_sub.add_parser("set", help="Set the remote git URL")
     set_parser.add_argument("url", help="Git remote URL (SSH or HTTPS)")
+    set_parser.add_argument(
+        "--partial",
+        action="store_true",
+        help="Partial clone: download file contents only for checked-out templates",
+    )
+    set_parser.add_argument(
+        "--depth",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Fetch only the latest N commits (default: full history)",
+    )
+    set_parser.add_argument(
+        "--sparse",
+        action="append",
+        metavar="FOLDER",
+        help="Check out only this template folder (repeatable; top-level templates always)",
+    )
     remote_sub.add_parser("status", help="Show remote sync status")
     remote_sub.add_parser("remove", help="Disconnect from remote (keeps local templates)")
 
@@ -1641,6 +2033,48 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _run_command(handler, args) -> int:
+    """Run a command handler, recording spans when ``--profile`` is set."""
+    profile_out = getattr(args, "profile_out", None)
+    if not (getattr(args, "profile", False) or profile_out):
+        return handler(args)
+
+    from espansr.core import fs_calls, spans
+
+    spans.enable()
+    fs_calls.start()
+    try:
+        with spans.span(f"espansr {args.command}"):
+            return handler(args)
+    finally:
+        counter = fs_calls.stop()
+        spans.disable()
+        _print_profile(profile_out, counter)
+
+
+def _print_profile(profile_out: str | None, counter=None) -> None:
+    """Print the span tree and filesystem call counts to stderr.
+
+    Optionally also writes the spans as a Chrome trace to *profile_out*.
+    """
+    import json
+
+    from espansr.core import spans
+
+    print("\nProfile:", file=sys.stderr)
+    print(spans.format_tree(), file=sys.stderr)
+    if counter is not None:
+        print("\nFilesystem calls by path prefix:", file=sys.stderr)
+        print(counter.format_table() or "(none)", file=sys.stderr)
+    if profile_out:
+        try:
+            Path(profile_out).write_text(json.dumps(spans.to_chrome_trace()), encoding="utf-8")
+        except OSError as exc:
+            print(warn(f"Could not write trace to {profile_out}: {exc}"), file=sys.stderr)
+        else:
+            print(f"Chrome trace written to {profile_out}", file=sys.stderr)
+
+
 def main() -> None:
     """Entry point for the espansr CLI."""
     parser = _build_parser()
@@ -1654,6 +2088,7 @@ def main() -> None:
         "validate": cmd_validate,
         "retire": cmd_retire,
         "import": cmd_import,
+        "export": cmd_export,
         "setup": cmd_setup,
         "doctor": cmd_doctor,
         "wsl-install-espanso": cmd_wsl_install_espanso,
@@ -1669,7 +2104,7 @@ def main() -> None:
     }
 
     if args.command in handlers:
-        sys.exit(handlers[args.command](args))
+        sys.exit(_run_command(handlers[args.command], args))
     else:
         parser.print_help()
         sys.exit(0)
@@ -0,0 +1,322 @@
+"""Single-file JSONL bundles of the live template store.
+
+A bundle is a line-delimited JSON stream (optionally gzip-compressed when the
+file name ends in ``.gz``). The first line is a header; every following line is
+one record:
+
+- ``{"type": "template", "path": "team/review.json", "data": {...}}``
+- ``{"type": "version", "path": "_versions/review/v1.json", "data": {...}}``
+
+``path`` is relative to the templates directory and ``data`` is the file's JSON
+object exactly as stored, so restoring into an empty store reproduces the
+per-file layout :class:`~espansr.core.templates.TemplateManager` writes.
+Version records that are not valid JSON (raw backups) carry ``text`` instead of
+``data``. Bundles are written and read one record at a time.
+"""
+
+import gzip
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Dict, Generator, Iterator, List, Optional
+
+from espansr.core.config import get_templates_dir
+from espansr.core.template_index import TemplateIndex, iter_live_template_files
+from espansr.core.templates import (
+    ImportResult,
+    Template,
+    TemplateManager,
+    _ImportNameSet,
+    get_template_manager,
+)
+
+BUNDLE_FORMAT = "espansr-bundle"
+BUNDLE_VERSION = 1
+
+_BUNDLE_SUFFIXES = (".jsonl", ".jsonl.gz")
+_VERSIONS_DIR = "_versions"
+
+
+def is_bundle_path(path: Path) -> bool:
+    """Return True when *path* names a JSONL bundle (``.jsonl`` or ``.jsonl.gz``)."""
+    return path.name.lower().endswith(_BUNDLE_SUFFIXES)
+
+
+def _is_compressed(path: Path) -> bool:
+    return path.name.lower().endswith(".gz")
+
+
+def _open_bundle(path: Path, mode: str, *, compressed: bool) -> IO[str]:
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _dump_line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+@dataclass
+class BundleExportResult:
+    """Outcome of writing a bundle.
+
+    Attributes:
+        templates: Number of template records written.
+        versions: Number of version-history records written.
+        skipped: Relative paths of live files skipped because they are not valid JSON.
+    """
+
+    templates: int = 0
+    versions: int = 0
+    skipped: List[str] = field(default_factory=list)
+
+
+def _iter_version_files(templates_dir: Path) -> Iterator[Path]:
+    versions_dir = templates_dir / _VERSIONS_DIR
+    if not versions_dir.is_dir():
+        return
+    for path in sorted(versions_dir.rglob("*")):
+        if path.is_file():
+            yield path
+
+
+def export_bundle(
+    out_path: Path,
+    templates_dir: Optional[Path] = None,
+    *,
+    include_history: bool = False,
+) -> BundleExportResult:
+    """Write the live template store to a JSONL bundle at *out_path*.
+
+    Records are streamed to a temporary file that replaces *out_path* once the
+    bundle is complete.
+
+    Args:
+        out_path: Bundle file; a ``.gz`` suffix enables gzip compression.
+        templates_dir: Live templates directory. Defaults to the configured one.
+        include_history: Also write ``_versions/`` history records.
+
+    Raises:
+        OSError: If the bundle cannot be written.
+    """
+    templates_dir = templates_dir or get_templates_dir()
+    out_path = Path(out_path)
+    result = BundleExportResult()
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+
+    try:
+        with _open_bundle(tmp_path, "w", compressed=_is_compressed(out_path)) as stream:
+            stream.write(
+                _dump_line(
+                    {
+                        "format": BUNDLE_FORMAT,
+                        "version": BUNDLE_VERSION,
+                        "history": include_history,
+                    }
+                )
+            )
+            live_files = sorted(rel for rel, _ in iter_live_template_files(templates_dir))
+            for rel in live_files:
+                try:
+                    data = json.loads((templates_dir / rel).read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    result.skipped.append(rel)
+                    continue
+                stream.write(_dump_line({"type": "template", "path": rel, "data": data}))
+                result.templates += 1
+
+            if include_history:
+                for path in _iter_version_files(templates_dir):
+                    rel = path.relative_to(templates_dir).as_posix()
+                    text = path.read_text(encoding="utf-8", errors="replace")
+                    try:
+                        record = {"type": "version", "path": rel, "data": json.loads(text)}
+                    except ValueError:
+                        record = {"type": "version", "path": rel, "text": text}
+                    stream.write(_dump_line(record))
+                    result.versions += 1
+        os.replace(tmp_path, out_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return result
+
+
+class BundleFormatError(ValueError):
+    """Raised when a file is not a readable espansr bundle."""
+
+
+def iter_bundle_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a bundle after validating its header.
+
+    Raises:
+        BundleFormatError: If the header is missing or a line is not a JSON object.
+        OSError: If the file cannot be read.
+    """
+    path = Path(path)
+    with _open_bundle(path, "r", compressed=_is_compressed(path)) as stream:
+        header_line = stream.readline()
+        try:
+            header = json.loads(header_line) if header_line.strip() else None
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+            raise BundleFormatError(f"{path.name} is not an espansr bundle")
+        if header.get("version") != BUNDLE_VERSION:
+            raise BundleFormatError(
+                f"{path.name}: unsupported bundle version {header.get('version')!r}"
+            )
+
+        for line_number, line in enumerate(stream, start=2):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise BundleFormatError(f"{path.name}:{line_number}: {exc}") from exc
+            if not isinstance(record, dict):
+                raise BundleFormatError(f"{path.name}:{line_number}: expected an object")
+            yield record
+
+
+def _safe_relative_path(raw: Any) -> Optional[PurePosixPath]:
+    """Return *raw* as a store-relative path, or None if it could escape the store.
+
+    Bundles always record ``/``-separated paths. A backslash or a colon is
+    rejected outright: on Windows either one can turn a single harmless-looking
+    POSIX part (``..\\evil.json``, ``C:/evil.json``) into a parent-directory
+    or drive-absolute path.
+    """
+    if not isinstance(raw, str) or not raw or "\\" in raw or ":" in raw:
+        return None
+    rel = PurePosixPath(raw)
+    if rel.is_absolute() or ".." in rel.parts or "_meta" in rel.parts:
+        return None
+    return rel
+
+
+def _write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _restore_version(
+    templates_dir: Path,
+    rel: PurePosixPath,
+    record: Dict[str, Any],
+    renamed: Dict[str, str],
+) -> None:
+    """Write a version-history record unless that file already exists.
+
+    *renamed* maps the history slug of a template renamed on import to the
+    renamed template's name; its records are moved to the new slug and their
+    snapshots renamed, so they do not mix into another template's history.
+    """
+    slug = rel.parts[1] if len(rel.parts) > 2 else None
+    data = record.get("data")
+    if slug in renamed:
+        final_name = renamed[slug]
+        new_slug = PurePosixPath(_ImportNameSet.relative_path(final_name)).stem
+        rel = PurePosixPath(_VERSIONS_DIR, new_slug, *rel.parts[2:])
+        snapshot = data.get("template_data") if isinstance(data, dict) else None
+        if isinstance(snapshot, dict):
+            data = {**data, "template_data": {**snapshot, "name": final_name}}
+    target = templates_dir / rel
+    if target.exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if "data" in record:
+        _write_json(target, data)
+    elif isinstance(record.get("text"), str):
+        target.write_text(record["text"], encoding="utf-8")
+
+
+def iter_import_bundle(
+    path: Path, manager: Optional[TemplateManager] = None
+) -> Generator[ImportResult, None, None]:
+    """Restore a bundle into the live store, yielding one ImportResult per template.
+
+    Templates are written to their recorded paths with their stored JSON and
+    names whenever that path is free, so importing into an empty store
+    reproduces the bundled layout exactly, including same-named templates in
+    different folders. A template whose file already exists with identical
+    content is left alone; one whose path holds a different template is
+    renamed like any other import (``Name (2)``) and its version history
+    follows it to the new name's slug. Version-history records are restored
+    only where no file exists yet. The template index is saved once at the end.
+    """
+    if manager is None:
+        manager = get_template_manager()
+    templates_dir = manager.templates_dir
+
+    index = TemplateIndex(templates_dir)
+    index.refresh()
+    taken = _ImportNameSet(index)
+    # History slugs of renamed templates -> their new names, minus slugs that
+    # a template kept under its recorded path still uses.
+    renamed_slugs: Dict[str, str] = {}
+    kept_slugs: set = set()
+
+    try:
+        for record in iter_bundle_records(path):
+            rel = _safe_relative_path(record.get("path"))
+            if record.get("type") == "version":
+                if rel is not None and rel.parts[0] == _VERSIONS_DIR:
+                    renamed = {s: n for s, n in renamed_slugs.items() if s not in kept_slugs}
+                    _restore_version(templates_dir, rel, record, renamed)
+                continue
+            if record.get("type") != "template":
+                continue
+
+            data = record.get("data")
+            if rel is None or rel.parts[0] == _VERSIONS_DIR or rel.suffix != ".json":
+                yield ImportResult(
+                    error=f"{path.name}: invalid template path {record.get('path')!r}"
+                )
+                continue
+            if not isinstance(data, dict):
+                yield ImportResult(error=f"{rel}: expected a JSON object")
+                continue
+
+            target = templates_dir / rel
+            if rel.as_posix() in index.entries and _read_json(target) == data:
+                kept_slugs.add(rel.stem)
+                yield ImportResult(template=Template.from_dict(data, path=target))
+                continue
+
+            folder = "" if rel.parent == PurePosixPath(".") else rel.parent.as_posix()
+            name = data.get("name") if isinstance(data.get("name"), str) else "Untitled"
+            final_name, renamed = name, False
+            if taken.is_path_available(rel.as_posix()):
+                # Keep the recorded path and name so the layout round-trips exactly.
+                taken.reserve(name, rel.as_posix())
+                kept_slugs.add(rel.stem)
+            else:
+                final_name, renamed = taken.claim(name, folder)
+                data = {**data, "name": final_name}
+                target = templates_dir / taken.relative_path(final_name, folder)
+                renamed_slugs.setdefault(rel.stem, final_name)
+
+            try:
+                _write_json(target, data)
+            except OSError as exc:
+                yield ImportResult(error=f"Failed to save template '{final_name}': {exc}")
+                continue
+
+            template = Template.from_dict(data, path=target)
+            index.record(target, template.name, template.trigger)
+            yield ImportResult(template=template, renamed=renamed)
+    except (BundleFormatError, OSError, EOFError) as exc:
+        yield ImportResult(error=f"Cannot read bundle {path.name}: {exc}")
+    finally:
+        index.save()
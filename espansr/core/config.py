@@ -5,6 +5,7 @@ Handles loading/saving app configuration from a single JSON file.
 
 import json
 import logging
+import os
 import shutil
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
@@ -115,6 +116,10 @@ class UIConfig:
     # Template versioning
     max_template_versions: int = 10
 
+    # Keep a trigger-launched GUI process (gui --resident) alive after its last
+    # window closes so the next :aopen/:coms opens instantly (0 = exit with it)
+    resident_minutes: int = 10
+
 
 @dataclass
 class RemoteConfig:
@@ -122,8 +127,13 @@ class RemoteConfig:
 
     url: str = ""  # Git remote URL (empty = not configured)
     auto_pull: bool = True  # Pull on startup before template-loading commands
+    auto_pull_interval_minutes: int = 15  # Minimum gap between background auto-pull fetches
+    check_interval_minutes: int = 0  # GUI: fetch and flag remote updates periodically (0 = off)
     last_pull: str = ""  # ISO timestamp of last successful pull
     last_push: str = ""  # ISO timestamp of last successful push
+    partial_clone: bool = False  # Fetch with --filter=blob:none (blobs on demand)
+    depth: int = 0  # Shallow fetch depth (0 = full history)
+    sparse_paths: list = field(default_factory=list)  # Folders to check out (empty = all)
 
 
 @dataclass
@@ -207,6 +217,11 @@ class ConfigManager:
             print(f"Warning: Failed to load config: {e}")
             return Config()
 
+    def reload(self) -> Config:
+        """Re-read the config file, discarding the cached copy."""
+        self._config = self.load()
+        return self._config
+
     def _migrate_theme_default(self, config: Config) -> None:
         """Force pre-existing "light"/"auto" themes to "dark" once.
 
@@ -236,8 +251,11 @@ class ConfigManager:
 
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w", encoding="utf-8") as f:
+            # Write-then-rename so an interrupted save never truncates the config.
+            tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(config.to_dict(), f, indent=2)
+            os.replace(tmp_path, self.config_path)
             self._config = config
             return True
         except OSError as e:
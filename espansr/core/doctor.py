@@ -0,0 +1,139 @@
+"""Check registry and concurrent runner for ``espansr doctor``.
+
+Each check is a function that reports ``ok``/``warn``/``fail`` lines into a
+:class:`CheckReport`. :func:`run_checks` starts every check at once on its own
+daemon thread, waits for each up to its own timeout, and yields the results in
+registration order, so the report reads the same however the checks race.
+
+A check that overruns its timeout is reported as timed out and abandoned;
+being a daemon thread, it cannot keep the process alive. The checks
+themselves live with the CLI command; this module knows nothing about them.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+DEFAULT_CHECK_TIMEOUT = 10.0
+
+
+@dataclass
+class CheckLine:
+    """One reported line: ``level`` is ``"ok"``, ``"warn"``, or ``"fail"``."""
+
+    level: str
+    message: str
+
+
+class CheckReport:
+    """Collects the lines a single check reports."""
+
+    def __init__(self) -> None:
+        self.lines: list[CheckLine] = []
+
+    def ok(self, message: str) -> None:
+        self.lines.append(CheckLine("ok", message))
+
+    def warn(self, message: str) -> None:
+        self.lines.append(CheckLine("warn", message))
+
+    def fail(self, message: str) -> None:
+        self.lines.append(CheckLine("fail", message))
+
+
+@dataclass(frozen=True)
+class DoctorCheck:
+    """A registered doctor check.
+
+    ``required`` checks report a timeout or crash as a failure; the others
+    only warn, so they never change the exit code.
+    """
+
+    name: str
+    func: Callable[[CheckReport], None]
+    timeout: float = DEFAULT_CHECK_TIMEOUT
+    required: bool = True
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one check run."""
+
+    name: str
+    lines: list[CheckLine] = field(default_factory=list)
+    seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def failed(self) -> bool:
+        return any(line.level == "fail" for line in self.lines)
+
+
+class SharedProbe:
+    """A value several checks need, computed once by whichever asks first.
+
+    Later callers block until the first computation finishes, so concurrent
+    checks never run the same slow probe (or its config write) twice.
+    """
+
+    def __init__(self, compute: Callable[[], Any]):
+        self._compute = compute
+        self._lock = threading.Lock()
+        self._done = False
+        self._value: Any = None
+
+    def __call__(self) -> Any:
+        with self._lock:
+            if not self._done:
+                self._value = self._compute()
+                self._done = True
+        return self._value
+
+
+class _CheckRun:
+    """A check running on its own daemon thread."""
+
+    def __init__(self, check: DoctorCheck):
+        self.check = check
+        self.report = CheckReport()
+        self.error: Exception | None = None
+        self.seconds = 0.0
+        self.started = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name=f"doctor-{check.name}", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.check.func(self.report)
+        except Exception as exc:
+            self.error = exc
+        self.seconds = time.perf_counter() - self.started
+
+    def result(self) -> CheckResult:
+        """Wait for the check within its timeout and return its result."""
+        check = self.check
+        remaining = check.timeout - (time.perf_counter() - self.started)
+        self.thread.join(max(remaining, 0.0))
+        report = CheckReport()
+        if self.thread.is_alive():
+            message = f"{check.name}: timed out after {check.timeout:g}s"
+            (report.fail if check.required else report.warn)(message)
+            return CheckResult(check.name, report.lines, check.timeout, timed_out=True)
+
+        report.lines.extend(self.report.lines)
+        if self.error is not None:
+            message = f"{check.name}: check crashed: {self.error}"
+            (report.fail if check.required else report.warn)(message)
+        return CheckResult(check.name, report.lines, self.seconds)
+
+
+def run_checks(checks: Iterable[DoctorCheck]) -> Iterator[CheckResult]:
+    """Run *checks* concurrently and yield their results in registration order.
+
+    Each result is yielded as soon as it and every earlier check are done, so
+    callers can print progressively without reordering.
+    """
+    runs = [_CheckRun(check) for check in checks]
+    for run in runs:
+        yield run.result()
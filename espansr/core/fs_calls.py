@@ -0,0 +1,177 @@
+"""Opt-in counting of filesystem calls, grouped by path.
+
+Most espansr latency on slow mounts such as ``/mnt/c`` comes from the number
+of ``stat``/``open``/``mkdir`` calls rather than the bytes moved. While a
+:class:`FsCallCounter` is active (``espansr --profile`` starts one), every
+such call is counted by operation and path:
+
+- ``open``, ``mkdir``, ``scandir``, ``listdir``, ``rename`` (also
+  ``os.replace``), ``remove`` and ``rmdir`` through a Python audit hook;
+- ``stat`` and ``lstat`` by wrapping ``os.stat``/``os.lstat``, which
+  ``pathlib`` and ``os.path`` call for ``exists()``, ``is_dir()`` and friends.
+
+Counts also go to the innermost open span (see :mod:`espansr.core.spans`)
+as ``fs.<op>``, so the ``--profile`` tree shows which stage made them.
+
+Audit hooks cannot be removed, so the hook is installed once on first use
+and does nothing while no counter is active. Interpreter imports use their
+own ``stat`` and are not counted, although their ``open`` calls are.
+"""
+
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from espansr.core import spans
+
+_AUDIT_EVENTS = {
+    "open": "open",
+    "os.mkdir": "mkdir",
+    "os.scandir": "scandir",
+    "os.listdir": "listdir",
+    "os.rename": "rename",
+    "os.remove": "remove",
+    "os.rmdir": "rmdir",
+}
+
+_active: Optional["FsCallCounter"] = None
+_hook_installed = False
+_real_stat = os.stat
+_real_lstat = os.lstat
+
+
+class FsCallCounter:
+    """Filesystem call counts keyed by ``(operation, absolute path)``."""
+
+    def __init__(self) -> None:
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._home = os.path.expanduser("~")
+
+    def record(self, op: str, path) -> None:
+        """Count one *op* on *path* (file descriptors are ignored)."""
+        if isinstance(path, int) or path is None:
+            return
+        try:
+            path = os.fsdecode(path)
+        except TypeError:
+            return
+        path = os.path.abspath(path)
+        with self._lock:
+            self._counts[(op, path)] += 1
+        current = spans.current()
+        if current is not None:
+            current.add(f"fs.{op}")
+
+    def total(self, op: Optional[str] = None, under: Optional[os.PathLike | str] = None) -> int:
+        """Return the number of calls, optionally for one *op* and below *under*."""
+        root = os.path.abspath(os.fspath(under)) if under is not None else None
+        with self._lock:
+            items = list(self._counts.items())
+        return sum(
+            n
+            for (call_op, path), n in items
+            if (op is None or call_op == op)
+            and (root is None or path == root or path.startswith(root.rstrip(os.sep) + os.sep))
+        )
+
+    def by_operation(self, under: Optional[os.PathLike | str] = None) -> dict[str, int]:
+        """Return ``{op: count}`` for calls below *under* (or everywhere)."""
+        with self._lock:
+            ops = sorted({op for op, _ in self._counts})
+        totals = {op: self.total(op, under) for op in ops}
+        return {op: n for op, n in totals.items() if n}
+
+    def _prefix(self, path: str, depth: int) -> str:
+        home = self._home
+        if path == home or path.startswith(home + os.sep):
+            root, rest = "~", path[len(home) :]
+        else:
+            root, rest = os.path.splitdrive(path)
+        parts = [p for p in rest.split(os.sep) if p][:depth]
+        return os.sep.join([root, *parts]) if root else os.sep + os.sep.join(parts)
+
+    def by_prefix(self, depth: int = 3) -> dict[str, Counter]:
+        """Group counts by the first *depth* path components (home shown as ``~``)."""
+        groups: dict[str, Counter] = {}
+        with self._lock:
+            items = list(self._counts.items())
+        for (op, path), n in items:
+            groups.setdefault(self._prefix(path, depth), Counter())[op] += n
+        return groups
+
+    def format_table(self, depth: int = 3) -> str:
+        """Render per-prefix counts, busiest prefix first."""
+        groups = self.by_prefix(depth)
+        if not groups:
+            return ""
+        rows = sorted(groups.items(), key=lambda item: (-sum(item[1].values()), item[0]))
+        width = max(len(prefix) for prefix, _ in rows)
+        lines = []
+        for prefix, ops in rows:
+            detail = " ".join(f"{op}={n}" for op, n in sorted(ops.items()))
+            lines.append(f"{prefix:<{width}}  {sum(ops.values()):7d}  {detail}")
+        return "\n".join(lines)
+
+
+def _audit_hook(event: str, args: tuple) -> None:
+    counter = _active
+    if counter is None:
+        return
+    op = _AUDIT_EVENTS.get(event)
+    if op is None or not args:
+        return
+    counter.record(op, args[0])
+
+
+def _counting_stat(path, *args, **kwargs):
+    counter = _active
+    if counter is not None:
+        counter.record("stat", path)
+    return _real_stat(path, *args, **kwargs)
+
+
+def _counting_lstat(path, *args, **kwargs):
+    counter = _active
+    if counter is not None:
+        counter.record("lstat", path)
+    return _real_lstat(path, *args, **kwargs)
+
+
+def start() -> FsCallCounter:
+    """Start counting filesystem calls and return the new active counter."""
+    global _active, _hook_installed
+    if not _hook_installed:
+        sys.addaudithook(_audit_hook)
+        _hook_installed = True
+    _active = FsCallCounter()
+    os.stat = _counting_stat
+    os.lstat = _counting_lstat
+    return _active
+
+
+def stop() -> Optional[FsCallCounter]:
+    """Stop counting and return the counter that was active, if any."""
+    global _active
+    counter, _active = _active, None
+    os.stat = _real_stat
+    os.lstat = _real_lstat
+    return counter
+
+
+def get_active() -> Optional[FsCallCounter]:
+    """Return the active counter, or None when not counting."""
+    return _active
+
+
+@contextmanager
+def counting() -> Iterator[FsCallCounter]:
+    """Count filesystem calls made inside the ``with`` block."""
+    counter = start()
+    try:
+        yield counter
+    finally:
+        stop()
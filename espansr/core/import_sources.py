@@ -0,0 +1,278 @@
+"""Streaming import sources: Espanso match YAML files and template archives.
+
+Espanso match files are read with PyYAML's event API so only one match is
+materialized at a time, and ``.zip``/``.tar.gz`` archives are read member by
+member without extracting to disk. Every source yields unsaved
+:class:`~espansr.core.templates.ImportResult` objects; de-duplication and
+writing happen in :func:`~espansr.core.templates.iter_import_templates`.
+"""
+
+import codecs
+import io
+import json
+import re
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+import yaml
+
+from espansr.core.templates import ImportResult, _import_result_from_data
+
+YAML_SUFFIXES = (".yml", ".yaml")
+ZIP_SUFFIXES = (".zip",)
+TAR_SUFFIXES = (".tar.gz", ".tgz")
+
+# Archive directories that hold espansr metadata rather than templates.
+_SKIPPED_ARCHIVE_DIRS = frozenset({"_versions", "_meta"})
+
+_FORM_FIELD_RE = re.compile(r"\[\[\s*(\w+)\s*\]\]")
+
+
+def _has_suffix(name: str, suffixes: tuple[str, ...]) -> bool:
+    return name.lower().endswith(suffixes)
+
+
+# ── Espanso match YAML ───────────────────────────────────────────────────────
+
+
+def iter_espanso_matches(stream: TextIO) -> Iterator[Any]:
+    """Yield each entry of the top-level ``matches`` list in an Espanso YAML stream.
+
+    Uses the loader's event and compose API directly so a file with tens of
+    thousands of matches never builds the whole document. Other top-level keys
+    (``global_vars``, ``imports``, ...) are composed and discarded.
+
+    Raises:
+        yaml.YAMLError: If the stream is not valid YAML.
+    """
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()  # StreamStart
+        while not loader.check_event(yaml.StreamEndEvent):
+            loader.get_event()  # DocumentStart
+            if not loader.check_event(yaml.MappingStartEvent):
+                loader.compose_node(None, None)
+            else:
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key = loader.construct_object(loader.compose_node(None, None))
+                    if key == "matches" and loader.check_event(yaml.SequenceStartEvent):
+                        loader.get_event()
+                        while not loader.check_event(yaml.SequenceEndEvent):
+                            node = loader.compose_node(None, None)
+                            match = loader.construct_object(node, deep=True)
+                            # Drop per-node caches so memory stays flat.
+                            loader.constructed_objects = {}
+                            yield match
+                        loader.get_event()
+                    else:
+                        loader.compose_node(None, None)
+                    loader.constructed_objects = {}
+                loader.get_event()  # MappingEnd
+            loader.get_event()  # DocumentEnd
+            loader.anchors = {}
+    finally:
+        loader.dispose()
+
+
+def _form_variable(var: Dict[str, Any], name: str) -> tuple[Optional[dict], Optional[str], str]:
+    """Convert an Espanso ``form`` var to a template variable dict.
+
+    Returns:
+        (variable_dict, field_name, error)
+    """
+    params = var.get("params") or {}
+    if not isinstance(params, dict):
+        params = {}
+    layout = params.get("layout", "")
+    fields = _FORM_FIELD_RE.findall(layout) if isinstance(layout, str) else []
+    if len(fields) != 1:
+        return None, None, f"form variable '{name}' must have exactly one [[field]]"
+
+    field_name = fields[0]
+    label = _FORM_FIELD_RE.sub("", layout).strip().rstrip(":").strip()
+    field_params = (params.get("fields") or {}).get(field_name) or {}
+    if not isinstance(field_params, dict):
+        field_params = {}
+    default = params.get("default", field_params.get("default", ""))
+
+    variable: dict = {"name": name}
+    if label:
+        variable["label"] = label
+    if default:
+        variable["default"] = str(default)
+    if field_params.get("multiline"):
+        variable["multiline"] = True
+    return variable, field_name, ""
+
+
+def espanso_match_to_template_data(match: Any) -> tuple[Optional[dict], str]:
+    """Convert one Espanso match to internal template data.
+
+    Form placeholders such as ``{{var.value}}`` are mapped back to ``{{var}}``.
+    Only plain ``replace`` matches with ``form`` and ``date`` variables can be
+    represented as templates; anything else is reported as an error. A template
+    has one trigger, so a ``triggers`` list keeps its first entry; see
+    :func:`extra_triggers` for the rest.
+
+    Returns:
+        (template_data, error) — exactly one of them is set.
+    """
+    if not isinstance(match, dict):
+        return None, f"expected a mapping, got {type(match).__name__}"
+
+    if "regex" in match:
+        return None, "regex triggers are not supported"
+    trigger = match.get("trigger")
+    if trigger is None and isinstance(match.get("triggers"), list) and match["triggers"]:
+        trigger = match["triggers"][0]
+    if not isinstance(trigger, str) or not trigger:
+        return None, "match has no trigger"
+
+    content = match.get("replace")
+    if not isinstance(content, str):
+        return None, f"'{trigger}' has no plain 'replace' text"
+
+    variables: List[dict] = []
+    for var in match.get("vars") or []:
+        if not isinstance(var, dict) or not isinstance(var.get("name"), str):
+            return None, f"'{trigger}' has a malformed variable"
+        name = var["name"]
+        var_type = var.get("type", "")
+        if var_type == "form":
+            variable, field_name, error = _form_variable(var, name)
+            if error:
+                return None, f"'{trigger}': {error}"
+            content = re.sub(
+                r"\{\{\s*" + re.escape(f"{name}.{field_name}") + r"\s*\}\}",
+                f"{{{{{name}}}}}",
+                content,
+            )
+            variables.append(variable)
+        elif var_type == "date":
+            variable = {"name": name, "type": "date"}
+            if isinstance(var.get("params"), dict) and var["params"]:
+                variable["params"] = var["params"]
+            variables.append(variable)
+        else:
+            return None, f"'{trigger}': variable '{name}' uses unsupported type '{var_type}'"
+
+    label = match.get("label")
+    data: dict = {
+        "name": label if isinstance(label, str) and label.strip() else trigger,
+        "content": content,
+        "trigger": trigger,
+    }
+    if variables:
+        data["variables"] = variables
+    return data, ""
+
+
+def extra_triggers(match: Any) -> List[str]:
+    """Return the triggers of *match* that a converted template does not keep."""
+    if not isinstance(match, dict) or "trigger" in match:
+        return []
+    triggers = match.get("triggers")
+    if not isinstance(triggers, list):
+        return []
+    return [str(trigger) for trigger in triggers[1:]]
+
+
+def iter_espanso_yaml_imports(stream: TextIO, source_name: str) -> Iterator[ImportResult]:
+    """Yield one unsaved ImportResult per match in an Espanso match YAML stream.
+
+    A match with several triggers is imported under its first one, and the
+    result carries a warning naming the triggers that were dropped.
+    """
+    stem = PurePosixPath(source_name).stem
+    position = 0
+    try:
+        for match in iter_espanso_matches(stream):
+            position += 1
+            data, error = espanso_match_to_template_data(match)
+            if error:
+                yield ImportResult(error=f"{source_name}: match {position}: {error}")
+                continue
+            result = _import_result_from_data(data, source_name, stem)
+            dropped = extra_triggers(match)
+            if result.template is not None and dropped:
+                result.warning = (
+                    f"{source_name}: match {position}: kept trigger '{data['trigger']}', "
+                    f"dropped {', '.join(repr(t) for t in dropped)}"
+                )
+            yield result
+    except yaml.YAMLError as exc:
+        yield ImportResult(error=f"Invalid YAML in {source_name}: {exc}")
+
+
+# ── Archives ─────────────────────────────────────────────────────────────────
+
+
+def _iter_member_imports(raw: io.BufferedIOBase, member_name: str, label: str):
+    """Yield ImportResults for one archive member stream."""
+    # codecs' reader only needs read(); streamed tar members are not seekable,
+    # which io.TextIOWrapper requires.
+    text = codecs.getreader("utf-8")(raw)
+    if _has_suffix(member_name, YAML_SUFFIXES):
+        yield from iter_espanso_yaml_imports(text, label)
+        return
+    try:
+        raw_data = json.load(text)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        yield ImportResult(error=f"Invalid JSON in {label}: {exc}")
+        return
+    yield _import_result_from_data(raw_data, label, PurePosixPath(member_name).stem)
+
+
+def _is_importable_member(member_name: str) -> bool:
+    parts = PurePosixPath(member_name).parts
+    if _SKIPPED_ARCHIVE_DIRS.intersection(parts):
+        return False
+    return _has_suffix(member_name, (".json",) + YAML_SUFFIXES)
+
+
+def _iter_zip_imports(path: Path) -> Iterator[ImportResult]:
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not _is_importable_member(info.filename):
+                continue
+            with archive.open(info) as raw:
+                yield from _iter_member_imports(raw, info.filename, f"{path.name}:{info.filename}")
+
+
+def _iter_tar_imports(path: Path) -> Iterator[ImportResult]:
+    # "r|*" reads the archive as a forward-only stream; each member is consumed
+    # before the next header is read.
+    with tarfile.open(path, mode="r|*") as archive:
+        for member in archive:
+            if not member.isfile() or not _is_importable_member(member.name):
+                continue
+            raw = archive.extractfile(member)
+            if raw is None:
+                continue
+            yield from _iter_member_imports(raw, member.name, f"{path.name}:{member.name}")
+
+
+# ── Dispatch ─────────────────────────────────────────────────────────────────
+
+
+def iter_source_imports(path: Path) -> Iterator[ImportResult]:
+    """Yield unsaved ImportResults for a YAML match file or template archive."""
+    if not path.exists():
+        yield ImportResult(error=f"File not found: {path}")
+        return
+
+    try:
+        if _has_suffix(path.name, YAML_SUFFIXES):
+            with open(path, "r", encoding="utf-8") as stream:
+                yield from iter_espanso_yaml_imports(stream, path.name)
+        elif _has_suffix(path.name, ZIP_SUFFIXES):
+            yield from _iter_zip_imports(path)
+        elif _has_suffix(path.name, TAR_SUFFIXES):
+            yield from _iter_tar_imports(path)
+        else:
+            yield ImportResult(error=f"{path.name}: unsupported import file type")
+    except (OSError, zipfile.BadZipFile, tarfile.TarError, UnicodeDecodeError) as exc:
+        yield ImportResult(error=f"Cannot read {path.name}: {exc}")
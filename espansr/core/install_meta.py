@@ -5,11 +5,19 @@ rerun the correct OS-specific installer without guessing. The metadata is
 written by ``install.sh`` / ``install.ps1`` (through the hidden
 ``espansr record-install`` command) and read back by the ``refresh`` command.
 
+The metadata also carries an *install fingerprint*: a digest of the inputs
+that decide whether a reinstall is needed (``pyproject.toml``, the installer
+scripts, and the list of package files). ``espansr sync`` compares it with the
+checkout after pulling and skips the installer when nothing install-relevant
+changed.
+
 The metadata file lives in the espansr config directory as ``install.json``.
 This module is the single source of truth for its path and schema.
 """
 
+import hashlib
 import json
+import os
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +28,13 @@ from espansr.core.platform import get_platform
 
 INSTALL_META_FILENAME = "install.json"
 
+# Files whose contents feed the install fingerprint, relative to the repo root.
+FINGERPRINT_FILES = ("pyproject.toml", "install.sh", "install.ps1")
+# Package directory whose file *list* feeds the fingerprint. Editable installs
+# pick up edits to existing modules, but added or removed files can change
+# entry points and package data, so the names count and the contents do not.
+FINGERPRINT_PACKAGE = "espansr"
+
 
 @dataclass
 class InstallMeta:
@@ -30,6 +45,7 @@ class InstallMeta:
     installer: str  # "install.sh" or "install.ps1"
     venv_dir: str = ""  # virtual environment directory, if known
     recorded_at: str = ""  # ISO timestamp of when the metadata was written
+    fingerprint: str = ""  # install fingerprint at install time, if computed
 
 
 def installer_for_platform(platform: Optional[str] = None) -> str:
@@ -63,13 +79,47 @@ def infer_repo_dir() -> Optional[Path]:
     return None
 
 
+def _package_files(package_dir: Path) -> list[str]:
+    """Return sorted POSIX paths of the package's files, relative to its parent."""
+    files = []
+    for root, dirs, names in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__" and not d.startswith("."))
+        for name in names:
+            if name.endswith((".pyc", ".pyo")):
+                continue
+            rel = (Path(root) / name).relative_to(package_dir.parent)
+            files.append(rel.as_posix())
+    return sorted(files)
+
+
+def compute_install_fingerprint(repo_dir) -> str:
+    """Return a digest of the install-relevant inputs in ``repo_dir``.
+
+    Covers the contents of :data:`FINGERPRINT_FILES` and the file list of the
+    :data:`FINGERPRINT_PACKAGE` directory. Missing files contribute a marker so
+    adding or deleting an installer also changes the fingerprint.
+    """
+    root = Path(repo_dir)
+    digest = hashlib.sha256()
+    for name in FINGERPRINT_FILES:
+        digest.update(f"file:{name}\0".encode("utf-8"))
+        try:
+            digest.update(hashlib.sha256((root / name).read_bytes()).digest())
+        except OSError:
+            digest.update(b"missing")
+        digest.update(b"\0")
+    for rel in _package_files(root / FINGERPRINT_PACKAGE):
+        digest.update(f"pkg:{rel}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
 def record_install_meta(
     repo_dir,
     installer: Optional[str] = None,
     venv_dir: str = "",
     platform: Optional[str] = None,
 ) -> InstallMeta:
-    """Write install metadata to the config directory and return it."""
+    """Write install metadata, including the install fingerprint, and return it."""
     plat = platform or get_platform()
     meta = InstallMeta(
         platform=plat,
@@ -77,6 +127,7 @@ def record_install_meta(
         installer=installer or installer_for_platform(plat),
         venv_dir=str(venv_dir) if venv_dir else "",
         recorded_at=datetime.now(timezone.utc).isoformat(),
+        fingerprint=compute_install_fingerprint(repo_dir),
     )
     path = get_install_meta_path()
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -102,3 +153,20 @@ def load_install_meta() -> Optional[InstallMeta]:
         return None
     filtered.setdefault("installer", installer_for_platform(filtered.get("platform")))
     return InstallMeta(**filtered)
+
+
+def install_inputs_unchanged(repo_dir) -> bool:
+    """Return True when ``repo_dir`` still matches the recorded install fingerprint.
+
+    False when no metadata or fingerprint was recorded (older installs), when
+    the metadata describes a different repository folder, or when any
+    install-relevant input changed since the last install.
+    """
+    meta = load_install_meta()
+    if meta is None or not meta.fingerprint:
+        return False
+    try:
+        same_repo = Path(meta.repo_dir).resolve() == Path(repo_dir).resolve()
+    except OSError:
+        return False
+    return same_repo and meta.fingerprint == compute_install_fingerprint(repo_dir)
@@ -9,17 +9,27 @@ import os
 import shutil
 import stat
 import subprocess
+import sys
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Dict, List, Optional
 
 from espansr.core.config import ConfigManager, get_config_manager
+from espansr.core.spans import span
+from espansr.core.template_index import TemplateIndex
 
 logger = logging.getLogger(__name__)
 
 _GITIGNORE_ENTRIES = ["_versions/", "_meta/"]
 
+# Touched (inside .git/) when auto-pull starts a detached background fetch. A
+# FETCH_HEAD newer than this file means that fetch finished and its refs can be
+# applied locally on the next invocation.
+_BACKGROUND_FETCH_STAMP = "espansr-background-fetch"
+
 
 def _force_remove_readonly(func, path, exc_info):
     """Clear read-only bit and retry — handles git object files on Windows."""
@@ -43,6 +53,10 @@ class RemoteError(Exception):
     """General remote operation error."""
 
 
+class RemoteCancelledError(RemoteError):
+    """Raised when a cancellable git operation is cancelled by the caller."""
+
+
 @dataclass(frozen=True)
 class RemotePullOutcome:
     """Detailed result from pulling remote templates."""
@@ -52,6 +66,91 @@ class RemotePullOutcome:
     branch: Optional[str] = None
 
 
+# Remote branches probed, in order, as origin's default branch.
+_DEFAULT_BRANCHES = ("main", "master")
+
+# Object filter used for partial clones: trees and commits are fetched, file
+# contents only when a checkout (limited by sparse-checkout) needs them.
+_PARTIAL_CLONE_FILTER = "blob:none"
+
+
+# How often a cancellable git command checks its cancel event, in seconds.
+_CANCEL_POLL_SECONDS = 0.1
+
+
+def _run_cancellable(
+    cmd: List[str],
+    env: Dict[str, str],
+    timeout: float,
+    cancel: threading.Event,
+    *,
+    check: bool,
+) -> subprocess.CompletedProcess:
+    """Run *cmd* like ``subprocess.run``, killing it when *cancel* is set."""
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=_CANCEL_POLL_SECONDS)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel.is_set() or time.monotonic() >= deadline:
+                proc.kill()
+                proc.communicate()
+                if cancel.is_set():
+                    raise RemoteCancelledError("Remote operation cancelled")
+                raise
+    if check and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def _sync_commit_message(staged: List[str], limit: int = 10) -> str:
+    """Build the default push commit message listing the changed templates."""
+    templates = [path for path in staged if path != ".gitignore"] or staged
+    subject = f"espansr: sync {len(templates)} template(s)"
+    lines = [f"- {path}" for path in templates[:limit]]
+    if len(templates) > limit:
+        lines.append(f"- ... and {len(templates) - limit} more")
+    return subject + "\n\n" + "\n".join(lines)
+
+
+def _in_sparse_cone(path: str, folders: List[str]) -> bool:
+    """Return True when *path* is checked out under cone-mode sparse *folders*.
+
+    Cone mode always includes files at the repository root and directly inside
+    each ancestor of a selected folder, plus everything below the folder.
+    """
+    if not folders:
+        return True
+    parent = PurePosixPath(path).parent.as_posix()
+    if parent == ".":
+        return True
+    for folder in folders:
+        folder = folder.strip("/")
+        if path.startswith(f"{folder}/") or folder.startswith(f"{parent}/"):
+            return True
+    return False
+
+
+@dataclass
+class _PullRefs:
+    """Refs resolved for a pull by a single ``for-each-ref`` call."""
+
+    head: Optional[str] = None
+    local_branch: str = ""
+    upstream: str = ""
+    remote_branch: Optional[str] = None
+    remote_head: Optional[str] = None
+
+
 class RemoteManager:
     """Manages git-backed remote sync for the templates directory."""
 
@@ -77,22 +176,33 @@ class RemoteManager:
         *args: str,
         check: bool = True,
         timeout: int = 30,
+        input: Optional[str] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> subprocess.CompletedProcess:
         """Run a git command inside the templates directory.
 
+        *input* is passed to the command's stdin (e.g. ``--pathspec-from-file=-``).
+        When *cancel* is given, the command is killed as soon as the event is set.
+
         Raises GitTimeoutError if the command does not complete within *timeout* seconds.
+        Raises RemoteCancelledError if *cancel* is set while the command runs.
         """
         cmd = ["git", "-C", str(self.templates_dir), *args]
         env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
         try:
-            return subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=check,
-                env=env,
-                timeout=timeout,
-            )
+            command = next((arg for arg in args if not arg.startswith("-")), "")
+            with span(f"git {command}".rstrip()):
+                if cancel is not None:
+                    return _run_cancellable(cmd, env, timeout, cancel, check=check)
+                return subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=check,
+                    env=env,
+                    timeout=timeout,
+                    input=input,
+                )
         except subprocess.TimeoutExpired:
             raise GitTimeoutError(
                 f"git {' '.join(args)} timed out after {timeout}s — "
@@ -102,6 +212,19 @@ class RemoteManager:
     def _is_git_repo(self) -> bool:
         return (self.templates_dir / ".git").exists()
 
+    def _require_repo(self) -> None:
+        """Raise unless git is installed and the templates directory is a repo.
+
+        Checked before any remote git call, so a missing git is reported as
+        GitNotFoundError and git never walks up into an enclosing repository.
+        """
+        self.check_git()
+        if not self._is_git_repo():
+            raise RemoteError(
+                "Templates directory is not a git repository. "
+                "Run 'espansr remote set <url>' first."
+            )
+
     def _ensure_git_user(self) -> None:
         """Set a local git user config if not already set (needed for commits)."""
         result = self._git("config", "user.name", check=False)
@@ -156,8 +279,29 @@ class RemoteManager:
             self._git("add", ".gitignore")
             self._git("commit", "-m", "espansr: initial commit")
 
-    def set_remote(self, url: str) -> None:
-        """Configure the git remote and persist URL in config."""
+    def set_remote(
+        self,
+        url: str,
+        *,
+        partial_clone: bool = False,
+        depth: int = 0,
+        sparse_paths: Optional[List[str]] = None,
+    ) -> None:
+        """Configure the git remote and persist URL and clone options in config.
+
+        Args:
+            url: Git remote URL.
+            partial_clone: Fetch with ``--filter=blob:none`` so file contents
+                are downloaded only for files that are checked out. A repo that
+                is already a partial clone stays one.
+            depth: Shallow fetch depth; 0 keeps full history.
+            sparse_paths: Folders to check out (cone-mode sparse checkout).
+                Top-level templates are always checked out. Empty checks out
+                everything.
+        """
+        if depth < 0:
+            raise RemoteError("Depth must be 0 (full history) or a positive number of commits.")
+
         self.check_git()
         self.init_repo()
 
@@ -171,14 +315,53 @@ class RemoteManager:
         # Persist in config
         config = self._config_manager.config
         config.remote.url = url
+        config.remote.partial_clone = partial_clone or self._is_partial_clone()
+        config.remote.depth = depth
+        config.remote.sparse_paths = [p.strip("/") for p in sparse_paths or [] if p.strip("/")]
+        self._apply_clone_options()
         self._config_manager.save(config)
 
+    def _is_partial_clone(self) -> bool:
+        result = self._git("config", "--get", "remote.origin.promisor", check=False)
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
+    def _apply_clone_options(self) -> None:
+        """Write the configured partial-clone and sparse-checkout settings to git."""
+        remote = self._config_manager.config.remote
+        if remote.partial_clone:
+            # A promisor remote makes every plain `git fetch origin` use the filter
+            # and lets git fetch missing blobs on demand.
+            self._git("config", "remote.origin.promisor", "true")
+            self._git("config", "remote.origin.partialclonefilter", _PARTIAL_CLONE_FILTER)
+
+        if remote.sparse_paths:
+            result = self._git(
+                "sparse-checkout", "set", "--cone", *remote.sparse_paths, check=False
+            )
+            if result.returncode != 0:
+                raise RemoteError(f"Failed to set sparse checkout: {result.stderr.strip()}")
+        elif self._git_path("info/sparse-checkout").exists():
+            self._git("sparse-checkout", "disable", check=False)
+
+    def _fetch_args(self) -> List[str]:
+        """Return ``git fetch`` arguments honouring the configured depth."""
+        depth = self._config_manager.config.remote.depth
+        return ["fetch", *([f"--depth={depth}"] if depth > 0 else []), "origin"]
+
+    def _checked_out(self, paths: List[str]) -> List[str]:
+        """Drop paths outside the configured sparse-checkout folders."""
+        folders = self._config_manager.config.remote.sparse_paths
+        return [path for path in paths if _in_sparse_cone(path, folders)]
+
     def remove_remote(self) -> None:
         """Disconnect from remote: clear config and remove .git."""
         config = self._config_manager.config
         config.remote.url = ""
         config.remote.last_pull = ""
         config.remote.last_push = ""
+        config.remote.partial_clone = False
+        config.remote.depth = 0
+        config.remote.sparse_paths = []
         self._config_manager.save(config)
 
         git_dir = self.templates_dir / ".git"
@@ -196,6 +379,9 @@ class RemoteManager:
             "url": config.remote.url,
             "last_pull": config.remote.last_pull,
             "last_push": config.remote.last_push,
+            "partial_clone": config.remote.partial_clone,
+            "depth": config.remote.depth,
+            "sparse_paths": list(config.remote.sparse_paths),
             "dirty": [],
         }
 
@@ -212,7 +398,7 @@ class RemoteManager:
 
     def _detect_remote_branch(self) -> Optional[str]:
         """Detect the default branch on origin."""
-        for branch in ("main", "master"):
+        for branch in _DEFAULT_BRANCHES:
             check = self._git("rev-parse", "--verify", f"origin/{branch}", check=False)
             if check.returncode == 0:
                 return branch
@@ -238,14 +424,21 @@ class RemoteManager:
         if before_head is None:
             result = self._git("ls-tree", "-r", "--name-only", after_head, check=False)
         elif before_head != after_head:
-            result = self._git("diff", "--name-only", before_head, after_head, "--", check=False)
+            # Rename detection reads file contents, which a partial clone would
+            # have to download for folders outside the sparse checkout.
+            renames = ["--no-renames"] if self._config_manager.config.remote.partial_clone else []
+            result = self._git(
+                "diff", "--name-only", *renames, before_head, after_head, "--", check=False
+            )
         else:
             return []
 
         if result.returncode != 0:
             return []
 
-        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        return self._checked_out(
+            [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        )
 
     def pull(self) -> bool:
         """Pull latest templates from remote (rebase strategy).
@@ -257,9 +450,97 @@ class RemoteManager:
         self.pull_with_result()
         return True
 
-    def pull_with_result(self) -> RemotePullOutcome:
+    def _resolve_pull_refs(self) -> _PullRefs:
+        """Resolve HEAD, its upstream, and origin's default branch in one git call."""
+        result = self._git(
+            "for-each-ref",
+            "--format=%(HEAD) %(objectname) %(refname) %(upstream)",
+            "refs/heads",
+            *(f"refs/remotes/origin/{branch}" for branch in _DEFAULT_BRANCHES),
+            check=False,
+        )
+        refs = _PullRefs()
+        remote_heads: Dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            marker, _, rest = line.partition(" ")
+            parts = rest.split()
+            if len(parts) < 2:
+                continue
+            sha, refname = parts[0], parts[1]
+            if refname.startswith("refs/remotes/origin/"):
+                remote_heads[refname.rsplit("/", 1)[-1]] = sha
+            elif marker == "*":
+                refs.head = sha
+                refs.local_branch = refname[len("refs/heads/") :]
+                refs.upstream = parts[2] if len(parts) > 2 else ""
+
+        for branch in _DEFAULT_BRANCHES:
+            if branch in remote_heads:
+                refs.remote_branch = branch
+                refs.remote_head = remote_heads[branch]
+                break
+
+        if refs.head is None:
+            # Detached HEAD has no "*" branch line; fall back to rev-parse.
+            refs.head = self._current_head()
+        return refs
+
+    def fetch(self, *, cancel: Optional[threading.Event] = None) -> None:
+        """Fetch from origin without touching the working tree.
+
+        Args:
+            cancel: Optional event; setting it kills the fetch.
+
+        Raises GitNotFoundError if git is not installed.
+        Raises RemoteCancelledError if cancelled.
+        Raises RemoteError if the store is not a repository or the fetch fails.
+        """
+        self._require_repo()
+        fetch_result = self._git(*self._fetch_args(), check=False, cancel=cancel)
+        if fetch_result.returncode != 0:
+            raise RemoteError(f"Failed to fetch from remote: {fetch_result.stderr.strip()}")
+
+    def ahead_behind(self) -> tuple[int, int]:
+        """Return ``(ahead, behind)`` commit counts of HEAD against the fetched remote.
+
+        Uses only local refs, so call :meth:`fetch` first for a current answer.
+        Returns ``(0, 0)`` when the remote has no branch yet or HEAD is unborn.
+
+        Raises GitNotFoundError if git is not installed.
+        Raises RemoteError if the store is not a repository.
+        """
+        self._require_repo()
+        refs = self._resolve_pull_refs()
+        if refs.remote_branch is None:
+            return 0, 0
+        if refs.head is None:
+            result = self._git("rev-list", "--count", f"origin/{refs.remote_branch}", check=False)
+            count = result.stdout.strip()
+            return 0, int(count) if result.returncode == 0 and count.isdigit() else 0
+        result = self._git(
+            "rev-list",
+            "--left-right",
+            "--count",
+            f"HEAD...origin/{refs.remote_branch}",
+            check=False,
+        )
+        parts = result.stdout.split()
+        if result.returncode != 0 or len(parts) != 2:
+            return 0, 0
+        return int(parts[0]), int(parts[1])
+
+    def pull_with_result(self, *, fetch: bool = True) -> RemotePullOutcome:
         """Pull latest templates from remote and report whether files changed.
 
+        Uses at most one fetch, one ``for-each-ref`` to resolve refs, a rebase
+        onto the fetched ``origin/<branch>`` (no second fetch), and one diff for
+        the changed files. An up-to-date pull stops after resolving refs.
+
+        Args:
+            fetch: Fetch from origin first. When False, local commits are
+                rebased onto the already-fetched ``origin/<branch>`` ref without
+                touching the network (used to apply a background fetch).
+
         Returns:
             RemotePullOutcome with status "changed", "up_to_date", or
             "empty_remote".
@@ -267,45 +548,31 @@ class RemoteManager:
         Raises RemoteConflictError on merge conflicts.
         Raises RemoteError on other failures.
         """
-        self.check_git()
-        if not self._is_git_repo():
-            raise RemoteError(
-                "Templates directory is not a git repository. "
-                "Run 'espansr remote set <url>' first."
-            )
+        self._require_repo()
 
         # Fetch first
-        fetch_result = self._git("fetch", "origin", check=False)
-        if fetch_result.returncode != 0:
-            raise RemoteError(f"Failed to fetch from remote: {fetch_result.stderr.strip()}")
+        if fetch:
+            self.fetch()
 
-        remote_branch = self._detect_remote_branch()
+        refs = self._resolve_pull_refs()
+        remote_branch = refs.remote_branch
         if remote_branch is None:
             # Remote is empty, nothing to pull
             return RemotePullOutcome(status="empty_remote")
 
-        # Check if we have local commits
-        before_head = self._current_head()
+        remote_ref = f"origin/{remote_branch}"
+        before_head = refs.head
+        changed_files: List[str] = []
         if before_head is None:
             # No local commits — just checkout the remote branch
-            self._git(
-                "checkout",
-                "-B",
-                remote_branch,
-                f"origin/{remote_branch}",
-                check=False,
-            )
-            self._git(
-                "branch",
-                f"--set-upstream-to=origin/{remote_branch}",
-                remote_branch,
-                check=False,
-            )
-        else:
+            self._git("checkout", "-B", remote_branch, "--track", remote_ref, check=False)
+            changed_files = self._changed_files_between(None, refs.remote_head)
+        elif before_head != refs.remote_head:
             # Ensure tracking is set up
-            self._git("branch", f"--set-upstream-to=origin/{remote_branch}", check=False)
-            # Rebase local changes on top of remote
-            rebase_result = self._git("pull", "--rebase", "origin", remote_branch, check=False)
+            if refs.local_branch and refs.upstream != f"refs/remotes/{remote_ref}":
+                self._git("branch", f"--set-upstream-to={remote_ref}", check=False)
+            # Rebase local changes on top of the already-fetched remote ref
+            rebase_result = self._git("rebase", remote_ref, check=False)
             if rebase_result.returncode != 0:
                 stderr = rebase_result.stderr.strip()
                 stdout = rebase_result.stdout.strip()
@@ -320,9 +587,7 @@ class RemoteManager:
                         "Resolve conflicts manually or use 'espansr remote remove' and re-set."
                     )
                 raise RemoteError(f"Pull failed: {stderr or stdout}")
-
-        after_head = self._current_head()
-        changed_files = self._changed_files_between(before_head, after_head)
+            changed_files = self._changed_files_between(before_head, "HEAD")
 
         # Update timestamp
         config = self._config_manager.config
@@ -348,7 +613,7 @@ class RemoteManager:
             raise RemoteError("Templates directory is not a git repository.")
 
         # Fetch latest
-        self._git("fetch", "origin", check=True)
+        self._git(*self._fetch_args(), check=True)
 
         # Determine remote branch
         remote_branch = self._detect_remote_branch() or "main"
@@ -364,11 +629,53 @@ class RemoteManager:
         self._config_manager.save(config)
         return True
 
-    def push(self, message: Optional[str] = None) -> bool:
-        """Stage all changes, commit, and push.
+    def _stage_changed_paths(self, index: TemplateIndex, paths: List[str]) -> None:
+        """Stage exactly *paths*: additions and edits, then removals.
+
+        Paths are passed with ``--literal-pathspecs`` so a template named
+        ``notes[1].json`` or ``a*.json`` is not expanded as a glob.
+        """
+        present = [rel for rel in paths if rel in index.entries]
+        removed = [rel for rel in paths if rel not in index.entries]
+        if present:
+            self._git(
+                "--literal-pathspecs",
+                "add",
+                "--pathspec-from-file=-",
+                "--pathspec-file-nul",
+                input="\0".join(present),
+            )
+        if removed:
+            self._git(
+                "--literal-pathspecs",
+                "rm",
+                "--cached",
+                "--quiet",
+                "--ignore-unmatch",
+                "--pathspec-from-file=-",
+                "--pathspec-file-nul",
+                input="\0".join(removed),
+            )
+
+    def push(
+        self,
+        message: Optional[str] = None,
+        *,
+        cancel: Optional[threading.Event] = None,
+    ) -> bool:
+        """Stage template changes since the last push, commit, and push.
+
+        Paths are taken from the template index's change log: only templates
+        added, edited, or removed since the last successful push are staged,
+        along with ``.gitignore``. Files still inside the mtime-granularity
+        window count as changed on every refresh, so a same-size rewrite in
+        the same tick is not missed. When no push has been recorded in the
+        index yet, everything is staged with ``git add .``.
 
         Args:
-            message: Custom commit message. Auto-generated if None.
+            message: Custom commit message. Lists the changed templates if None.
+            cancel: Optional event; setting it kills the network push. A local
+                commit already made is kept and pushed next time.
         """
         self.check_git()
         if not self._is_git_repo():
@@ -377,16 +684,23 @@ class RemoteManager:
         self._ensure_git_user()
         self.ensure_gitignore()
 
-        # Stage everything
-        self._git("add", ".")
+        index = TemplateIndex(self.templates_dir)
+        since = index.pushed_generation
+        index.refresh()
+        if since is None:
+            # No change log yet — stage everything once.
+            self._git("add", ".")
+        else:
+            self._git("add", "--", ".gitignore")
+            self._stage_changed_paths(index, self._checked_out(index.changed_since(since)))
 
         # Check if there's anything to commit
-        status_result = self._git("status", "--porcelain", check=False)
-        staged = [line for line in status_result.stdout.strip().splitlines() if line.strip()]
+        diff_result = self._git("diff", "--cached", "--name-only", check=False)
+        staged = [line.strip() for line in diff_result.stdout.splitlines() if line.strip()]
 
         if staged:
             if message is None:
-                message = f"espansr: sync {len(staged)} template(s)"
+                message = _sync_commit_message(staged)
             self._git("commit", "-m", message)
 
         # Push — determine branch name
@@ -395,7 +709,7 @@ class RemoteManager:
         if not branch or branch == "HEAD":
             branch = "main"
 
-        push_result = self._git("push", "-u", "origin", branch, check=False)
+        push_result = self._git("push", "-u", "origin", branch, check=False, cancel=cancel)
         if push_result.returncode != 0:
             stderr = push_result.stderr.strip()
             if "rejected" in stderr or "non-fast-forward" in stderr:
@@ -405,6 +719,8 @@ class RemoteManager:
         config = self._config_manager.config
         config.remote.last_push = datetime.now().isoformat()
         self._config_manager.save(config)
+        index.mark_pushed(index.generation)
+        index.save()
         return True
 
     def push_templates(self, template_files: List[str], message: Optional[str] = None) -> bool:
@@ -427,7 +743,11 @@ class RemoteManager:
             self._git("add", ".gitignore")
 
         # Stage only the specified files
+        checked_out = set(self._checked_out(template_files))
         for fname in template_files:
+            if fname not in checked_out:
+                logger.warning("Skipping %s: outside the sparse-checkout folders", fname)
+                continue
             fpath = self.templates_dir / fname
             if fpath.exists():
                 self._git("add", fname)
@@ -456,11 +776,74 @@ class RemoteManager:
         self._config_manager.save(config)
         return True
 
+    def _git_path(self, name: str) -> Path:
+        return self.templates_dir / ".git" / name
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[float]:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _background_fetch_ready(self) -> bool:
+        """Return True when a background fetch finished and has not been applied."""
+        started = self._mtime(self._git_path(_BACKGROUND_FETCH_STAMP))
+        finished = self._mtime(self._git_path("FETCH_HEAD"))
+        return started is not None and finished is not None and finished >= started
+
+    def _auto_pull_due(self, interval_seconds: float) -> bool:
+        """Return True when the last pull and last background fetch are both stale."""
+        now = time.time()
+        last_pull = self._config_manager.config.remote.last_pull
+        if last_pull:
+            try:
+                if now - datetime.fromisoformat(last_pull).timestamp() < interval_seconds:
+                    return False
+            except ValueError:
+                pass
+        started = self._mtime(self._git_path(_BACKGROUND_FETCH_STAMP))
+        return started is None or now - started >= interval_seconds
+
+    def _spawn_background_fetch(self) -> None:
+        """Start ``git fetch origin`` as a detached process and return immediately."""
+        stamp = self._git_path(_BACKGROUND_FETCH_STAMP)
+        stamp.touch()
+        # Keep the stamp strictly older than the FETCH_HEAD this fetch writes.
+        started = time.time() - 1
+        os.utime(stamp, (started, started))
+
+        kwargs: Dict = {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+            "env": {**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            "close_fds": True,
+        }
+        if sys.platform == "win32":
+            kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+                | subprocess.CREATE_NO_WINDOW
+            )
+        else:
+            kwargs["start_new_session"] = True
+        fetch, *options = self._fetch_args()
+        subprocess.Popen(
+            ["git", "-C", str(self.templates_dir), fetch, "--quiet", *options], **kwargs
+        )
+
     def auto_pull(self) -> bool:
-        """Silently pull if a remote is configured and auto_pull is enabled.
+        """Apply fetched remote changes and schedule a throttled background fetch.
+
+        Never waits on the network: refs brought in by a previous background
+        fetch are rebased onto locally, and a new detached ``git fetch`` is
+        started only when both ``remote.last_pull`` and the last background
+        fetch are older than ``remote.auto_pull_interval_minutes``. Its results
+        are applied on the next invocation.
 
-        Returns True if pull succeeded or was skipped (no remote configured).
-        Returns False if pull failed (failure is logged as a warning).
+        Returns True if auto-pull succeeded or was skipped (no remote configured).
+        Returns False if applying or scheduling failed (logged as a warning).
         """
         config = self._config_manager.config
         if not config.remote.url or not config.remote.auto_pull:
@@ -471,8 +854,13 @@ class RemoteManager:
 
         try:
             self.check_git()
-            self.pull()
+            if self._background_fetch_ready():
+                self.pull_with_result(fetch=False)
+                self._git_path(_BACKGROUND_FETCH_STAMP).unlink(missing_ok=True)
+            interval = max(0, config.remote.auto_pull_interval_minutes) * 60
+            if self._auto_pull_due(interval):
+                self._spawn_background_fetch()
             return True
-        except (GitNotFoundError, RemoteError, RemoteConflictError) as exc:
+        except (GitNotFoundError, RemoteError, RemoteConflictError, OSError) as exc:
             logger.warning("Auto-pull failed: %s", exc)
             return False
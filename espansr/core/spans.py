@@ -0,0 +1,200 @@
+"""Lightweight tracing spans for ``espansr --profile``.
+
+Wrap a stage in :func:`span` to record its name, wall time, and any counts
+it adds::
+
+    with span("validation") as s:
+        warnings = validate_all()
+        s.add("warnings", len(warnings))
+
+Spans nest per thread; a span opened on a worker thread with no open parent
+becomes a root of its own. Recording is off unless :func:`enable` was called
+(the CLI does so for ``--profile``). While disabled, :func:`span` returns a
+shared no-op object, so instrumented code pays one function call per stage.
+
+Results render as an indented tree (:func:`format_tree`) or as Chrome trace
+JSON (:func:`to_chrome_trace`) for ``chrome://tracing`` or Perfetto.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+_enabled = False
+_origin = 0.0
+_roots: list["Span"] = []
+_roots_lock = threading.Lock()
+_local = threading.local()
+
+
+@dataclass
+class Span:
+    """One recorded stage: offsets are seconds since :func:`enable`."""
+
+    name: str
+    start: float = 0.0
+    duration: float = 0.0
+    counts: dict[str, int] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+    thread_id: int = 0
+    thread_name: str = ""
+
+    def add(self, key: str, n: int = 1) -> None:
+        """Add *n* to the counter *key*."""
+        self.counts[key] = self.counts.get(key, 0) + n
+
+    def __enter__(self) -> "Span":
+        stack = _stack()
+        if stack:
+            stack[-1].children.append(self)
+        else:
+            with _roots_lock:
+                _roots.append(self)
+        stack.append(self)
+        self.start = time.perf_counter() - _origin
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.duration = time.perf_counter() - _origin - self.start
+        stack = _stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+
+
+class _NullSpan:
+    """Stand-in returned by :func:`span` while recording is disabled."""
+
+    __slots__ = ()
+
+    def add(self, key: str, n: int = 1) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _stack() -> list[Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def span(name: str, **counts: int) -> Any:
+    """Return a context manager recording the stage *name*.
+
+    Keyword arguments seed the span's counters.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    thread = threading.current_thread()
+    return Span(name, counts=dict(counts), thread_id=thread.ident or 0, thread_name=thread.name)
+
+
+def current() -> Optional[Span]:
+    """Return the innermost open span on this thread, or None."""
+    if not _enabled:
+        return None
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+def is_enabled() -> bool:
+    """Return True while spans are being recorded."""
+    return _enabled
+
+
+def enable() -> None:
+    """Start recording spans, discarding any earlier recording."""
+    global _enabled, _origin
+    reset()
+    _origin = time.perf_counter()
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording spans; recorded spans stay available."""
+    global _enabled
+    _enabled = False
+
+
+def reset() -> None:
+    """Discard recorded spans."""
+    with _roots_lock:
+        _roots.clear()
+    _local.stack = []
+
+
+def get_roots() -> list[Span]:
+    """Return the recorded root spans in the order they started."""
+    with _roots_lock:
+        return sorted(_roots, key=lambda s: s.start)
+
+
+def format_tree(roots: Optional[list[Span]] = None) -> str:
+    """Render spans as an indented tree with durations and counts."""
+    roots = get_roots() if roots is None else roots
+    rows: list[tuple[str, Span]] = []
+    main_thread = threading.main_thread().ident
+
+    def walk(node: Span, depth: int) -> None:
+        label = "  " * depth + node.name
+        if depth == 0 and node.thread_id != main_thread:
+            label += f" [{node.thread_name}]"
+        rows.append((label, node))
+        for child in node.children:
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+    if not rows:
+        return ""
+
+    width = max(len(label) for label, _ in rows)
+    lines = []
+    for label, node in rows:
+        line = f"{label:<{width}}  {node.duration * 1000:9.1f} ms"
+        if node.counts:
+            line += "  " + " ".join(f"{k}={v}" for k, v in sorted(node.counts.items()))
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def to_chrome_trace(roots: Optional[list[Span]] = None) -> dict:
+    """Return spans in the Chrome trace event format (complete ``X`` events)."""
+    roots = get_roots() if roots is None else roots
+    pid = os.getpid()
+    events: list[dict] = []
+    threads: dict[int, str] = {}
+
+    def walk(node: Span) -> None:
+        threads.setdefault(node.thread_id, node.thread_name)
+        events.append(
+            {
+                "name": node.name,
+                "ph": "X",
+                "ts": round(node.start * 1e6, 3),
+                "dur": round(node.duration * 1e6, 3),
+                "pid": pid,
+                "tid": node.thread_id,
+                "args": dict(node.counts),
+            }
+        )
+        for child in node.children:
+            walk(child)
+
+    for root in roots:
+        walk(root)
+    for tid, name in threads.items():
+        events.append(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
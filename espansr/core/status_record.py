@@ -0,0 +1,73 @@
+"""Cached status record for fast ``espansr status --json`` answers.
+
+orchestratr polls ``espansr status --json`` as its readiness check and gives
+it three seconds. Detecting the Espanso config directory can probe ``/mnt/c``
+on WSL2 and be much slower than that, so ``publish`` and ``setup`` record the
+answer they already found here, and the status command reads it back without
+probing.
+
+The record lives in the espansr config directory as ``status.json``. This
+module is the single source of truth for its path and schema, and it imports
+nothing heavier than the standard library.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+STATUS_RECORD_FILENAME = "status.json"
+
+
+@dataclass
+class StatusRecord:
+    """Facts about the Espanso install recorded by the last publish or setup."""
+
+    espanso_config_dir: str = ""  # detected Espanso config dir, "" when not found
+    recorded_at: str = ""  # ISO timestamp of when the record was written
+
+
+def get_status_record_path(config_dir: Path) -> Path:
+    """Return the path to the status record inside *config_dir*."""
+    return config_dir / STATUS_RECORD_FILENAME
+
+
+def write_status_record(
+    config_dir: Path, espanso_config_dir: Optional[Path]
+) -> Optional[StatusRecord]:
+    """Write the status record and return it, or None when it cannot be written.
+
+    Args:
+        config_dir: espansr config directory.
+        espanso_config_dir: Detected Espanso config directory, or None.
+    """
+    record = StatusRecord(
+        espanso_config_dir=str(espanso_config_dir) if espanso_config_dir else "",
+        recorded_at=datetime.now(timezone.utc).isoformat(),
+    )
+    path = get_status_record_path(config_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(asdict(record), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        return None
+    return record
+
+
+def load_status_record(config_dir: Path) -> Optional[StatusRecord]:
+    """Load the status record, or ``None`` when missing or unreadable."""
+    try:
+        data = json.loads(get_status_record_path(config_dir).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    known = set(StatusRecord.__dataclass_fields__)
+    try:
+        return StatusRecord(**{k: v for k, v in data.items() if k in known})
+    except TypeError:
+        return None
@@ -0,0 +1,291 @@
+"""Persistent index of the live template store.
+
+Maps every live template file (relative path) to its stat key, name, and
+trigger so callers can answer "which names and triggers exist" without parsing
+the whole store. The index is stored as ``_meta/index.json`` inside the live
+templates directory and is refreshed lazily with one stat per file; only files
+whose size or mtime changed are re-parsed.
+
+A file read within the filesystem's timestamp granularity of its mtime is
+marked *racy*: a second write in the same tick could keep the same size and
+mtime, so racy entries are re-read (and stamped as changed) on every refresh
+until the file has settled.
+
+Every change the index observes (a new, edited, or removed file) is stamped
+with an increasing generation number, which forms a change log: callers such as
+``RemoteManager.push`` remember the generation they last acted on and ask for
+the paths changed since.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+INDEX_FILENAME = "index.json"
+_INDEX_VERSION = 1
+
+# Files modified this recently are never trusted by stat alone: a rewrite
+# within the filesystem's timestamp granularity could keep the same mtime and
+# size while changing content.
+_DIGEST_CACHE_MIN_AGE_NS = 2_000_000_000
+
+# Directories inside the live store that never hold live templates.
+_SKIPPED_DIRS = frozenset({"_versions", "_meta"})
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Indexed facts about one live template file.
+
+    Attributes:
+        stat: ``(mtime_ns, size)`` observed when the entry was recorded.
+        name: Template name, or None when the file could not be parsed.
+        trigger: Template trigger (empty when none).
+        generation: Index generation at which this file last changed.
+        racy: True when the file was read within the timestamp-granularity
+            window of its mtime, so its stat key alone cannot be trusted.
+    """
+
+    stat: tuple[int, int]
+    name: Optional[str]
+    trigger: str = ""
+    generation: int = 0
+    racy: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        data = {
+            "stat": list(self.stat),
+            "name": self.name,
+            "trigger": self.trigger,
+            "generation": self.generation,
+        }
+        if self.racy:
+            data["racy"] = True
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["IndexEntry"]:
+        """Create from a dictionary, returning None for malformed entries."""
+        stat = data.get("stat")
+        if not isinstance(stat, list) or len(stat) != 2:
+            return None
+        name = data.get("name")
+        return cls(
+            stat=(int(stat[0]), int(stat[1])),
+            name=name if isinstance(name, str) else None,
+            trigger=str(data.get("trigger") or ""),
+            generation=int(data.get("generation") or 0),
+            racy=data.get("racy") is True,
+        )
+
+
+def iter_live_template_files(templates_dir: Path) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield ``(relative_posix_path, stat)`` for every live template JSON file.
+
+    Walks with ``os.scandir`` and prunes ``_versions/`` and ``_meta/`` instead of
+    globbing into them.
+    """
+    stack = [(templates_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = f"{prefix}{entry.name}"
+            try:
+                if entry.is_dir():
+                    if entry.name not in _SKIPPED_DIRS:
+                        stack.append((Path(entry.path), f"{rel}/"))
+                    continue
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield rel, entry.stat()
+            except OSError:
+                continue
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int]:
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_index_facts(path: Path) -> tuple[Optional[str], str]:
+    """Return ``(name, trigger)`` for a template file, or ``(None, "")`` if unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None, ""
+    if not isinstance(data, dict):
+        return None, ""
+    trigger = data.get("trigger", "")
+    return str(data.get("name", "Untitled")), trigger if isinstance(trigger, str) else ""
+
+
+class TemplateIndex:
+    """Stat-keyed index of the live template store."""
+
+    def __init__(self, templates_dir: Path):
+        """Initialize and load any persisted index for *templates_dir*."""
+        self.templates_dir = templates_dir
+        self._path = templates_dir / "_meta" / INDEX_FILENAME
+        self._entries: Dict[str, IndexEntry] = {}
+        # Removed paths and the generation at which they disappeared.
+        self._removed: Dict[str, int] = {}
+        self._generation = 0
+        self._pushed_generation: Optional[int] = None
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return
+        for rel, raw in (data.get("entries") or {}).items():
+            if isinstance(raw, dict):
+                entry = IndexEntry.from_dict(raw)
+                if entry is not None:
+                    self._entries[rel] = entry
+        removed = data.get("removed")
+        if isinstance(removed, dict):
+            self._removed = {rel: int(gen) for rel, gen in removed.items() if isinstance(gen, int)}
+        self._generation = int(data.get("generation") or 0)
+        pushed = data.get("pushed_generation")
+        self._pushed_generation = pushed if isinstance(pushed, int) else None
+
+    @property
+    def entries(self) -> Dict[str, IndexEntry]:
+        """Return the indexed entries keyed by relative POSIX path."""
+        return self._entries
+
+    def refresh(
+        self,
+        force: Iterable[str] = (),
+        reader: Optional[Callable[[Path], tuple[Optional[str], str]]] = None,
+    ) -> None:
+        """Bring the index up to date with one stat per live file.
+
+        Files whose stat key changed are re-parsed; vanished files are dropped.
+        Racy entries are re-parsed and stamped with a new generation even when
+        their stat key matches, because a same-tick rewrite is invisible to it.
+
+        Args:
+            force: Relative paths to re-parse even when their stat key matches,
+                e.g. files a git operation just rewrote within mtime granularity.
+            reader: Returns ``(name, trigger)`` for a file being re-parsed, with
+                ``(None, "")`` for unreadable files. Defaults to reading only
+                those two fields; callers that need the whole template pass a
+                reader that keeps it, so no file is parsed twice.
+        """
+        read = reader or _read_index_facts
+        forced = set(force)
+        seen = set()
+        now = time.time_ns()
+        for rel, st in iter_live_template_files(self.templates_dir):
+            seen.add(rel)
+            key = _stat_key(st)
+            cached = self._entries.get(rel)
+            trusted = cached is not None and cached.stat == key and not cached.racy
+            if trusted and rel not in forced:
+                continue
+            name, trigger = read(self.templates_dir / rel)
+            entry = IndexEntry(
+                stat=key,
+                name=name,
+                trigger=trigger,
+                racy=now - key[0] < _DIGEST_CACHE_MIN_AGE_NS,
+            )
+            if trusted:
+                # Forced re-read of a settled, unchanged stat: keep its generation.
+                if (cached.name, cached.trigger) != (name, trigger):
+                    self._set(rel, entry)
+                continue
+            self._set(rel, entry)
+
+        for rel in set(self._entries) - seen:
+            del self._entries[rel]
+            self._generation += 1
+            self._removed[rel] = self._generation
+            self._dirty = True
+
+    def _set(self, rel: str, entry: IndexEntry) -> None:
+        """Store *entry* for *rel* stamped with the next generation."""
+        self._generation += 1
+        self._entries[rel] = IndexEntry(
+            stat=entry.stat,
+            name=entry.name,
+            trigger=entry.trigger,
+            generation=self._generation,
+            racy=entry.racy,
+        )
+        self._removed.pop(rel, None)
+        self._dirty = True
+
+    def record(self, path: Path, name: str, trigger: str = "") -> None:
+        """Record a file espansr just wrote, without re-reading it."""
+        try:
+            key = _stat_key(path.stat())
+            rel = path.relative_to(self.templates_dir).as_posix()
+        except (OSError, ValueError):
+            return
+        racy = time.time_ns() - key[0] < _DIGEST_CACHE_MIN_AGE_NS
+        self._set(rel, IndexEntry(stat=key, name=name, trigger=trigger, racy=racy))
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the most recent change the index observed."""
+        return self._generation
+
+    @property
+    def pushed_generation(self) -> Optional[int]:
+        """Return the generation recorded by :meth:`mark_pushed`, or None if never pushed."""
+        return self._pushed_generation
+
+    def changed_since(self, generation: int) -> list[str]:
+        """Return relative paths added, edited, or removed after *generation*, sorted."""
+        changed = {rel for rel, entry in self._entries.items() if entry.generation > generation}
+        changed.update(rel for rel, gen in self._removed.items() if gen > generation)
+        return sorted(changed)
+
+    def mark_pushed(self, generation: int) -> None:
+        """Record that every change up to *generation* has been pushed."""
+        self._pushed_generation = generation
+        self._removed = {rel: gen for rel, gen in self._removed.items() if gen > generation}
+        self._dirty = True
+
+    def names(self) -> set[str]:
+        """Return the lower-cased names of every parseable live template."""
+        return {entry.name.lower() for entry in self._entries.values() if entry.name is not None}
+
+    def top_level_filenames(self) -> set[str]:
+        """Return the filenames of templates stored at the root of the live store."""
+        return {rel for rel in self._entries if "/" not in rel}
+
+    def save(self) -> bool:
+        """Persist the index when it changed; return True when the file is current."""
+        if not self._dirty:
+            return True
+        payload = {
+            "version": _INDEX_VERSION,
+            "generation": self._generation,
+            "pushed_generation": self._pushed_generation,
+            "entries": {rel: entry.to_dict() for rel, entry in sorted(self._entries.items())},
+            "removed": dict(sorted(self._removed.items())),
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        except OSError:
+            return False
+        self._dirty = False
+        return True
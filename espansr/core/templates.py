@@ -5,15 +5,20 @@ Templates are stored as individual JSON files in the templates directory.
 Version history is stored in _versions/ subdirectory.
 """
 
+import hashlib
 import json
+import os
 import re
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional
 
 from espansr.core.config import get_config, get_templates_dir
+from espansr.core.template_index import _DIGEST_CACHE_MIN_AGE_NS, TemplateIndex
 
 
 @dataclass
@@ -738,16 +743,183 @@ def _normalize_template_object(data: Dict[str, Any]) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
-def _collect_local_trigger_owners(local_paths: Dict[str, Path]) -> Dict[str, List[Path]]:
-    """Return local JSON files grouped by trigger, skipping unreadable files."""
-    owners: Dict[str, List[Path]] = {}
-    for path in local_paths.values():
-        try:
-            data = _load_template_object(path)
-        except ValueError:
+# Precomputed normalized-content hashes for the bundled starters. Regenerate
+# with ``python scripts/build_bundled_manifest.py`` after changing a starter.
+BUNDLED_MANIFEST_FILENAME = "bundled.sha256"
+
+# Live-store cache of normalized hashes for top-level templates, keyed by stat.
+_DIGEST_CACHE_PATH = Path("_meta") / "template_digests.json"
+
+
+@dataclass(frozen=True)
+class _TemplateDigest:
+    """Normalized content hash and trigger for one template JSON file."""
+
+    hash: str = ""
+    trigger: str = ""
+    error: str = ""
+
+
+def _hash_template_object(data: Dict[str, Any]) -> str:
+    """Return the SHA-256 of a template's normalized form."""
+    return hashlib.sha256(_normalize_template_object(data).encode("utf-8")).hexdigest()
+
+
+def _digest_template_file(path: Path) -> _TemplateDigest:
+    """Parse *path* and return its digest, recording load errors instead of raising."""
+    try:
+        data = _load_template_object(path)
+    except ValueError as exc:
+        return _TemplateDigest(error=str(exc))
+    return _TemplateDigest(
+        hash=_hash_template_object(data),
+        trigger=_coerce_optional_string(data.get("trigger", "")),
+    )
+
+
+def render_bundled_manifest(bundled_dir: Optional[Path] = None) -> str:
+    """Render the bundled manifest text for every starter in *bundled_dir*.
+
+    Each line holds the normalized-content hash, the raw-file hash, and the
+    filename. The raw hash lets readers detect a starter edited without
+    regenerating the manifest.
+    """
+    lines = [
+        "# espansr bundled starter manifest — regenerate with:",
+        "#   python scripts/build_bundled_manifest.py",
+        "# <normalized-sha256> <raw-sha256> <filename>",
+    ]
+    for filename, path in get_bundled_template_paths(bundled_dir).items():
+        digest = _digest_template_file(path)
+        if digest.error:
+            raise ValueError(digest.error)
+        raw_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        lines.append(f"{digest.hash} {raw_hash} {filename}")
+    return "\n".join(lines) + "\n"
+
+
+def load_bundled_manifest(bundled_dir: Optional[Path] = None) -> Dict[str, tuple[str, str]]:
+    """Return ``{filename: (normalized_hash, raw_hash)}`` from the bundled manifest.
+
+    Returns an empty mapping when the manifest is missing or unreadable, in
+    which case callers fall back to parsing the bundled files.
+    """
+    root = bundled_dir or get_bundled_templates_dir()
+    try:
+        text = (root / BUNDLED_MANIFEST_FILENAME).read_text(encoding="utf-8")
+    except OSError:
+        return {}
+
+    manifest: Dict[str, tuple[str, str]] = {}
+    for line in text.splitlines():
+        if not line.strip() or line.startswith("#"):
             continue
+        parts = line.split(maxsplit=2)
+        if len(parts) == 3:
+            manifest[parts[2]] = (parts[0], parts[1])
+    return manifest
+
+
+def _bundled_template_digests(
+    bundled_paths: Dict[str, Path],
+    bundled_dir: Optional[Path] = None,
+) -> Dict[str, _TemplateDigest]:
+    """Return digests for bundled starters, preferring the shipped manifest.
+
+    A manifest entry is used only when the bundled file's raw bytes still hash
+    to the recorded value; anything else is parsed. Triggers are not part of
+    the manifest, so manifest-backed digests carry an empty trigger.
+    """
+    manifest = load_bundled_manifest(bundled_dir)
+    digests: Dict[str, _TemplateDigest] = {}
+    for filename, path in bundled_paths.items():
+        recorded = manifest.get(filename)
+        if recorded is not None:
+            try:
+                raw_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                raw_hash = ""
+            if raw_hash == recorded[1]:
+                digests[filename] = _TemplateDigest(hash=recorded[0])
+                continue
+        digests[filename] = _digest_template_file(path)
+    return digests
+
+
+class _TemplateDigestCache:
+    """Stat-keyed cache of normalized hashes for live top-level templates.
+
+    Persisted under ``_meta/`` in the live template store so repeated publishes
+    only re-parse files whose size or mtime changed.
+    """
+
+    def __init__(self, templates_dir: Path):
+        self._path = templates_dir / _DIGEST_CACHE_PATH
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def get(self, path: Path) -> _TemplateDigest:
+        """Return the digest for *path*, parsing only when its stat key changed."""
+        try:
+            st = path.stat()
+        except OSError:
+            return _digest_template_file(path)
+
+        key = [st.st_mtime_ns, st.st_size]
+        cached = self._entries.get(path.name)
+        if cached is not None and cached.get("stat") == key:
+            return _TemplateDigest(
+                hash=cached.get("hash", ""),
+                trigger=cached.get("trigger", ""),
+                error=cached.get("error", ""),
+            )
+
+        digest = _digest_template_file(path)
+        if time.time_ns() - st.st_mtime_ns >= _DIGEST_CACHE_MIN_AGE_NS:
+            self._entries[path.name] = {
+                "stat": key,
+                "hash": digest.hash,
+                "trigger": digest.trigger,
+                "error": digest.error,
+            }
+            self._dirty = True
+        elif self._entries.pop(path.name, None) is not None:
+            self._dirty = True
+        return digest
+
+    def save(self, live_names: Optional[set[str]] = None) -> None:
+        """Persist changed entries, dropping files no longer in *live_names*."""
+        if live_names is not None:
+            stale = set(self._entries) - live_names
+            for name in stale:
+                del self._entries[name]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty or not self._path.parent.parent.is_dir():
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._entries, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+            self._dirty = False
+        except OSError:
+            pass  # The cache is an optimization; a failed write only costs a re-parse.
 
-        trigger = _coerce_optional_string(data.get("trigger", ""))
+
+def _collect_local_trigger_owners(
+    local_digests: Dict[str, _TemplateDigest],
+    local_paths: Dict[str, Path],
+) -> Dict[str, List[Path]]:
+    """Return local JSON files grouped by trigger, skipping unreadable files."""
+    owners: Dict[str, List[Path]] = {}
+    for name, path in local_paths.items():
+        trigger = local_digests[name].trigger
         if trigger:
             owners.setdefault(trigger, []).append(path)
     return owners
@@ -785,6 +957,7 @@ def _retired_bundled_template_status(
 
 def _collect_retired_bundled_template_entries(
     local_paths: Dict[str, Path],
+    local_digests: Dict[str, _TemplateDigest],
     report: BundledTemplateReport,
 ) -> set[str]:
     """Queue retirement for bundled templates removed from the product.
@@ -798,13 +971,12 @@ def _collect_retired_bundled_template_entries(
         local_path = local_paths.get(filename)
         if local_path is None:
             continue
-        try:
-            local_obj = _load_template_object(local_path)
-        except ValueError:
+        digest = local_digests[filename]
+        if digest.error:
             # Unreadable file at a retired name: leave it for the user rather
             # than risk deleting unrelated work we cannot identify.
             continue
-        if _coerce_optional_string(local_obj.get("trigger", "")) != trigger:
+        if digest.trigger != trigger:
             continue
         report.entries.append(
             BundledTemplateStatus(
@@ -836,13 +1008,20 @@ def build_bundled_template_report(
 
     Only top-level JSON files are compared because bundled starter templates are
     seeded into the root of the live templates directory.
+
+    Comparison is by normalized-content hash: bundled hashes come from the
+    shipped manifest and local hashes from a stat-keyed cache, so templates
+    are only parsed when they are new, edited, or genuinely differ.
     """
     local_root = templates_dir or get_templates_dir()
     bundled_paths = get_bundled_template_paths(bundled_dir)
     local_paths = {}
     if local_root.exists():
         local_paths = {path.name: path for path in sorted(local_root.glob("*.json"))}
-    local_trigger_owners = _collect_local_trigger_owners(local_paths)
+    digest_cache = _TemplateDigestCache(local_root)
+    local_digests = {name: digest_cache.get(path) for name, path in local_paths.items()}
+    bundled_digests = _bundled_template_digests(bundled_paths, bundled_dir)
+    local_trigger_owners = _collect_local_trigger_owners(local_digests, local_paths)
     renamed_filenames = {
         old_filename
         for filename in bundled_paths
@@ -852,18 +1031,17 @@ def build_bundled_template_report(
     report = BundledTemplateReport()
     for filename, bundled_path in bundled_paths.items():
         local_path = local_root / filename
-        try:
-            bundled_obj = _load_template_object(bundled_path)
-        except ValueError as exc:
-            report.errors.append(str(exc))
+        bundled_digest = bundled_digests[filename]
+        if bundled_digest.error:
+            report.errors.append(bundled_digest.error)
             continue
 
         old_filenames = _RENAMED_BUNDLED_TEMPLATE_FILES.get(filename, ())
         old_local_paths = [local_root / old for old in old_filenames if old in local_paths]
         old_local_path = old_local_paths[0] if old_local_paths else None
-        if not local_path.exists():
+        if filename not in local_paths:
             if old_local_path is not None:
-                trigger = _coerce_optional_string(bundled_obj.get("trigger", ""))
+                trigger = bundled_digest.trigger or _digest_template_file(bundled_path).trigger
                 collisions = _renamed_trigger_collisions(
                     trigger,
                     filename,
@@ -878,9 +1056,8 @@ def build_bundled_template_report(
                     )
                     continue
 
-                try:
-                    _load_template_object(old_local_path)
-                except ValueError as exc:
+                old_digest = local_digests[old_local_path.name]
+                if old_digest.error:
                     report.entries.append(
                         BundledTemplateStatus(
                             filename=filename,
@@ -888,7 +1065,10 @@ def build_bundled_template_report(
                             bundled_path=bundled_path,
                             local_path=old_local_path,
                             target_path=local_path,
-                            detail=f"renamed starter source {old_local_path.name}: {exc}",
+                            detail=(
+                                f"renamed starter source {old_local_path.name}: "
+                                f"{old_digest.error}"
+                            ),
                         )
                     )
                     continue
@@ -924,16 +1104,15 @@ def build_bundled_template_report(
             )
             continue
 
-        try:
-            local_obj = _load_template_object(local_path)
-        except ValueError as exc:
+        local_digest = local_digests[filename]
+        if local_digest.error:
             report.entries.append(
                 BundledTemplateStatus(
                     filename=filename,
                     status="invalid_local",
                     bundled_path=bundled_path,
                     local_path=local_path,
-                    detail=str(exc),
+                    detail=local_digest.error,
                 )
             )
             for retired_path in old_local_paths:
@@ -948,7 +1127,7 @@ def build_bundled_template_report(
             continue
 
         status = "up_to_date"
-        if _normalize_template_object(bundled_obj) != _normalize_template_object(local_obj):
+        if bundled_digest.hash != local_digest.hash:
             status = "changed_local"
 
         report.entries.append(
@@ -970,7 +1149,10 @@ def build_bundled_template_report(
             )
 
     managed_filenames = set(bundled_paths) | renamed_filenames
-    managed_filenames |= _collect_retired_bundled_template_entries(local_paths, report)
+    managed_filenames |= _collect_retired_bundled_template_entries(
+        local_paths, local_digests, report
+    )
+    digest_cache.save(live_names=set(local_paths))
     report.local_only = [
         path for name, path in local_paths.items() if name not in managed_filenames
     ]
@@ -1067,6 +1249,133 @@ def apply_bundled_template_report(
     return result
 
 
+# Records the inputs of the last clean reconciliation so an unchanged store can
+# skip the bundled report entirely.
+_BUNDLED_STAMP_PATH = Path("_meta") / "bundled_stamp.json"
+
+
+def _bundled_set_hash(bundled_dir: Optional[Path] = None) -> str:
+    """Return a hash identifying the bundled starter set.
+
+    Uses the shipped manifest when present; otherwise hashes every bundled
+    file's name and raw bytes.
+    """
+    root = bundled_dir or get_bundled_templates_dir()
+    digest = hashlib.sha256()
+    try:
+        digest.update((root / BUNDLED_MANIFEST_FILENAME).read_bytes())
+        return digest.hexdigest()
+    except OSError:
+        pass
+    for filename, path in get_bundled_template_paths(root).items():
+        digest.update(filename.encode("utf-8") + b"\0")
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"<unreadable>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _reconciliation_rules_hash() -> str:
+    """Return a hash of the rename/retire tables that shape the bundled report."""
+    rules = json.dumps(
+        [_RENAMED_BUNDLED_TEMPLATE_FILES, _RETIRED_BUNDLED_TEMPLATE_FILES],
+        sort_keys=True,
+    )
+    return hashlib.sha256(rules.encode("utf-8")).hexdigest()
+
+
+def _local_top_level_fingerprint(local_root: Path) -> Optional[str]:
+    """Return a stat fingerprint of the top-level JSON files in *local_root*.
+
+    Returns None when the directory is unreadable or a file was modified too
+    recently for its mtime to be trusted, so no stamp is recorded or honoured.
+    """
+    now_ns = time.time_ns()
+    rows = []
+    try:
+        with os.scandir(local_root) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                if now_ns - st.st_mtime_ns < _DIGEST_CACHE_MIN_AGE_NS:
+                    return None
+                rows.append(f"{entry.name}:{st.st_mtime_ns}:{st.st_size}")
+    except OSError:
+        return None
+    rows.sort()
+    return hashlib.sha256("\n".join(rows).encode("utf-8")).hexdigest()
+
+
+def _bundled_reconciliation_stamp(
+    local_root: Path,
+    bundled_dir: Optional[Path] = None,
+) -> Optional[Dict[str, str]]:
+    """Return the current reconciliation inputs, or None when they cannot be trusted."""
+    from espansr import __version__
+
+    local = _local_top_level_fingerprint(local_root)
+    if local is None:
+        return None
+    return {
+        "bundled": _bundled_set_hash(bundled_dir),
+        "local": local,
+        "rules": _reconciliation_rules_hash(),
+        "version": __version__,
+    }
+
+
+def bundled_reconciliation_is_current(
+    templates_dir: Optional[Path] = None,
+    bundled_dir: Optional[Path] = None,
+) -> bool:
+    """Return True when nothing changed since the last clean reconciliation.
+
+    Compares the recorded stamp (bundled set hash, local top-level fingerprint,
+    rename/retire rules, and espansr version) against the current state.
+    """
+    local_root = templates_dir or get_templates_dir()
+    try:
+        recorded = json.loads((local_root / _BUNDLED_STAMP_PATH).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False
+    if not isinstance(recorded, dict):
+        return False
+    current = _bundled_reconciliation_stamp(local_root, bundled_dir)
+    if current is None:
+        return False
+    return all(recorded.get(key) == value for key, value in current.items())
+
+
+def record_bundled_reconciliation(
+    templates_dir: Optional[Path] = None,
+    bundled_dir: Optional[Path] = None,
+) -> bool:
+    """Record a reconciliation stamp for the current store; return True when written."""
+    local_root = templates_dir or get_templates_dir()
+    stamp = _bundled_reconciliation_stamp(local_root, bundled_dir)
+    if stamp is None:
+        return False
+    stamp["recorded_at"] = datetime.now().isoformat()
+    path = local_root / _BUNDLED_STAMP_PATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(stamp, indent=2), encoding="utf-8")
+        return True
+    except OSError:
+        return False
+
+
+def _reconciliation_is_clean(
+    report: BundledTemplateReport,
+    result: BundledTemplateApplyResult,
+) -> bool:
+    """Return True when an applied report left nothing for the next run to do."""
+    return not report.errors and not result.skipped_invalid
+
+
 def sync_bundled_templates_to_live(
     templates_dir: Optional[Path] = None,
     bundled_dir: Optional[Path] = None,
@@ -1078,8 +1387,14 @@ def sync_bundled_templates_to_live(
     Missing bundled templates are copied into the live store. Bundled-matching
     local templates that differ are versioned before being replaced. Invalid
     local JSON is skipped unless ``force_invalid_local`` is set.
+
+    When the reconciliation stamp shows nothing changed since the last clean
+    run, the report is skipped and empty results are returned.
     """
     local_root = templates_dir or get_templates_dir()
+    if bundled_reconciliation_is_current(local_root, bundled_dir):
+        return BundledTemplateReport(), BundledTemplateApplyResult()
+
     report = build_bundled_template_report(
         templates_dir=local_root,
         bundled_dir=bundled_dir,
@@ -1090,6 +1405,8 @@ def sync_bundled_templates_to_live(
         dry_run=dry_run,
         force_invalid_local=force_invalid_local,
     )
+    if not dry_run and _reconciliation_is_clean(report, result):
+        record_bundled_reconciliation(local_root, bundled_dir)
     return report, result
 
 
@@ -1122,11 +1439,14 @@ class ImportResult:
         template: The imported Template, or None if import failed.
         error: Error message if import failed, else None.
         renamed: True if the template was renamed to avoid a collision.
+        warning: Something the import could not carry over (e.g. extra
+            Espanso triggers), reported alongside a successful import.
     """
 
     template: Optional[Template] = None
     error: Optional[str] = None
     renamed: bool = False
+    warning: Optional[str] = None
 
 
 @dataclass
@@ -1147,6 +1467,14 @@ class ImportSummary:
     skipped: int = 0
     error: Optional[str] = None
 
+    def add(self, result: ImportResult) -> None:
+        """Record one per-file result and update the counts."""
+        self.results.append(result)
+        if result.template is not None:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
 
 def _strip_to_known_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     """Return a copy of *data* containing only known template fields."""
@@ -1177,23 +1505,11 @@ def _deduplicate_name(name: str, manager: TemplateManager) -> tuple[str, bool]:
         counter += 1
 
 
-def import_template(path: Path, manager: Optional[TemplateManager] = None) -> ImportResult:
-    """Import a single JSON template file.
-
-    Loads the file, strips unrecognized fields, de-duplicates the name against
-    existing templates, and saves the result via *manager*.
-
-    Args:
-        path: Path to a JSON template file.
-        manager: TemplateManager to use. Defaults to the global instance.
+def _parse_import_file(path: Path) -> ImportResult:
+    """Load and clean one import source without touching the live store.
 
-    Returns:
-        ImportResult with the saved Template or an error message.
+    Runs on import worker threads, so it must not read or write shared state.
     """
-    if manager is None:
-        manager = get_template_manager()
-
-    path = Path(path)
     if not path.exists():
         return ImportResult(error=f"File not found: {path}")
 
@@ -1205,17 +1521,50 @@ def import_template(path: Path, manager: Optional[TemplateManager] = None) -> Im
     except OSError as exc:
         return ImportResult(error=f"Cannot read {path.name}: {exc}")
 
+    return _import_result_from_data(raw_data, path.name, path.stem)
+
+
+def _import_result_from_data(raw_data: Any, source_name: str, stem: str) -> ImportResult:
+    """Build an unsaved ImportResult from decoded template JSON.
+
+    Args:
+        raw_data: Decoded JSON value.
+        source_name: Name used in error messages (file or archive member).
+        stem: Fallback template name source when the data has no name.
+    """
     if not isinstance(raw_data, dict):
         return ImportResult(
-            error=f"{path.name}: expected a JSON object, got {type(raw_data).__name__}"
+            error=f"{source_name}: expected a JSON object, got {type(raw_data).__name__}"
         )
 
     # Default name from filename stem when missing
     if not raw_data.get("name"):
-        raw_data["name"] = path.stem.replace("_", " ")
+        raw_data["name"] = stem.replace("_", " ")
 
     cleaned = _strip_to_known_fields(raw_data)
-    template = Template.from_dict(cleaned)
+    return ImportResult(template=Template.from_dict(cleaned))
+
+
+def import_template(path: Path, manager: Optional[TemplateManager] = None) -> ImportResult:
+    """Import a single JSON template file.
+
+    Loads the file, strips unrecognized fields, de-duplicates the name against
+    existing templates, and saves the result via *manager*.
+
+    Args:
+        path: Path to a JSON template file.
+        manager: TemplateManager to use. Defaults to the global instance.
+
+    Returns:
+        ImportResult with the saved Template or an error message.
+    """
+    if manager is None:
+        manager = get_template_manager()
+
+    result = _parse_import_file(Path(path))
+    template = result.template
+    if template is None:
+        return result
 
     # De-duplicate name
     final_name, was_renamed = _deduplicate_name(template.name, manager)
@@ -1227,30 +1576,164 @@ def import_template(path: Path, manager: Optional[TemplateManager] = None) -> Im
     return ImportResult(template=template, renamed=was_renamed)
 
 
-def import_templates(directory: Path, manager: Optional[TemplateManager] = None) -> ImportSummary:
-    """Import all JSON template files from a directory.
+# Sources parsed per worker-pool round trip during bulk import.
+_IMPORT_CHUNK_SIZE = 256
+
+
+class _ImportNameSet:
+    """In-memory view of taken names and paths for bulk de-duplication.
+
+    Mirrors :func:`_deduplicate_name`: a name is taken when its safe filename
+    already exists in the target folder (the store root by default) or any live
+    template has the same name (case-insensitive).
+    """
+
+    def __init__(self, index: TemplateIndex):
+        self._names = index.names()
+        self._paths = set(index.entries)
+
+    @staticmethod
+    def relative_path(name: str, folder: str = "") -> str:
+        """Return the store-relative path a template named *name* is saved to."""
+        filename = Template(name=name, content="").filename
+        return f"{folder}/{filename}" if folder else filename
+
+    def is_path_available(self, relative_path: str) -> bool:
+        """Return True when no live or reserved template uses *relative_path*."""
+        return relative_path not in self._paths
+
+    def _is_taken(self, name: str, folder: str) -> bool:
+        return name.lower() in self._names or self.relative_path(name, folder) in self._paths
+
+    def claim(self, name: str, folder: str = "") -> tuple[str, bool]:
+        """Return a unique name for *name* in *folder* and reserve it."""
+        final_name, renamed = name, False
+        counter = 2
+        while self._is_taken(final_name, folder):
+            final_name, renamed = f"{name} ({counter})", True
+            counter += 1
+        self.reserve(final_name, self.relative_path(final_name, folder))
+        return final_name, renamed
+
+    def reserve(self, name: str, relative_path: str) -> None:
+        """Mark *name* and *relative_path* as taken."""
+        self._names.add(name.lower())
+        self._paths.add(relative_path)
+
+
+def _is_json_import_source(path: Path) -> bool:
+    return path.suffix.lower() == ".json"
+
+
+def _iter_parsed_imports(
+    paths: List[Path], pool: ThreadPoolExecutor
+) -> Generator[ImportResult, None, None]:
+    """Yield unsaved ImportResults for *paths*, in order.
+
+    Runs of JSON files are parsed on *pool* in chunks; Espanso YAML files and
+    archives are streamed one match or member at a time.
+    """
+    position = 0
+    while position < len(paths):
+        path = paths[position]
+        if not _is_json_import_source(path):
+            from espansr.core.import_sources import iter_source_imports
+
+            yield from iter_source_imports(path)
+            position += 1
+            continue
+
+        chunk = []
+        while (
+            position < len(paths)
+            and len(chunk) < _IMPORT_CHUNK_SIZE
+            and _is_json_import_source(paths[position])
+        ):
+            chunk.append(paths[position])
+            position += 1
+        yield from pool.map(_parse_import_file, chunk)
+
+
+def iter_import_templates(
+    paths: Iterable[Path],
+    manager: Optional[TemplateManager] = None,
+    *,
+    workers: Optional[int] = None,
+) -> Generator[ImportResult, None, None]:
+    """Import many template sources, yielding one ImportResult per template in order.
+
+    JSON files are read and stripped on a thread pool in chunks, while Espanso
+    match YAML files and ``.zip``/``.tar.gz`` archives are streamed (see
+    :mod:`espansr.core.import_sources`). Names are de-duplicated against an
+    in-memory set seeded once from the template index, each template is saved
+    as soon as it is parsed (so it is on disk before its result is yielded),
+    and the index is saved once at the end (also when the caller stops
+    iterating early).
 
     Args:
-        directory: Path to a directory containing JSON files.
+        paths: JSON template files, Espanso match YAML files, or archives.
         manager: TemplateManager to use. Defaults to the global instance.
+        workers: Worker threads for parsing. Defaults to the executor default.
 
-    Returns:
-        ImportSummary with per-file results and aggregate counts.
+    Yields:
+        ImportResult for each JSON file and each YAML match or archive member,
+        in input order.
     """
     if manager is None:
         manager = get_template_manager()
 
+    paths = [Path(p) for p in paths]
+    if not paths:
+        return
+
+    index = TemplateIndex(manager.templates_dir)
+    index.refresh()
+    taken = _ImportNameSet(index)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for parsed in _iter_parsed_imports(paths, pool):
+                template = parsed.template
+                if template is None:
+                    yield parsed
+                    continue
+
+                template.name, was_renamed = taken.claim(template.name)
+                if not manager.save(template):
+                    yield ImportResult(error=f"Failed to save template '{template.name}'")
+                    continue
+
+                index.record(template._path, template.name, template.trigger)
+                yield ImportResult(template=template, renamed=was_renamed, warning=parsed.warning)
+    finally:
+        index.save()
+
+
+def list_import_sources(directory: Path) -> List[Path]:
+    """Return the importable files directly inside *directory*, sorted by name."""
+    return sorted(
+        path
+        for path in directory.iterdir()
+        if path.is_file() and path.suffix.lower() in (".json", ".yml", ".yaml")
+    )
+
+
+def import_templates(directory: Path, manager: Optional[TemplateManager] = None) -> ImportSummary:
+    """Import all JSON template and Espanso match YAML files from a directory.
+
+    Args:
+        directory: Path to a directory containing JSON or ``.yml`` files.
+        manager: TemplateManager to use. Defaults to the global instance.
+
+    Returns:
+        ImportSummary with per-file results and aggregate counts.
+    """
     directory = Path(directory)
     if not directory.is_dir():
         return ImportSummary(error=f"Directory not found: {directory}")
 
     summary = ImportSummary()
-    for json_path in sorted(directory.glob("*.json")):
-        result = import_template(json_path, manager)
-        summary.results.append(result)
-        if result.template is not None:
-            summary.succeeded += 1
-        else:
-            summary.failed += 1
+    for result in iter_import_templates(list_import_sources(directory), manager):
+        summary.add(result)
 
     return summary
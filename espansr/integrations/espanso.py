@@ -6,9 +6,11 @@ Supports Linux, WSL2 (auto-detects Windows Espanso config path), and macOS.
 
 import logging
 import shlex
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path, PureWindowsPath
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 import yaml
 
@@ -20,7 +22,8 @@ from espansr.core.platform import (
     is_windows,
     is_wsl2,
 )
-from espansr.core.templates import get_template_manager
+from espansr.core.spans import span
+from espansr.core.templates import Template, get_template_manager
 from espansr.integrations.validate import validate_all
 
 logger = logging.getLogger(__name__)
@@ -362,6 +365,9 @@ def _generate_gui_trigger_file(
 ) -> bool:
     """Generate a managed Espanso shell trigger that launches a GUI surface.
 
+    The launch passes ``--resident`` so the GUI process outlives its window
+    and the next trigger can hand its view to it.
+
     Args:
         filename: The file name written into the Espanso match directory.
         trigger: The Espanso trigger keyword.
@@ -374,7 +380,7 @@ def _generate_gui_trigger_file(
     import shutil
     import sys
 
-    gui_args = gui_args or []
+    gui_args = [*(gui_args or []), "--resident"]
 
     if match_dir is None:
         match_dir = get_match_dir()
@@ -566,6 +572,23 @@ def generate_sync_file(match_dir: Optional[Path] = None) -> bool:
 # The GUI reads this after sync to display a richer feedback message.
 _last_sync_count: int = 0
 
+# True when the most recent incremental sync_to_espanso() call found the rendered
+# output identical to the file on disk and skipped the write and restart.
+_last_sync_unchanged: bool = False
+
+# Restart requested by the most recent sync_to_espanso() call, or None when it
+# did not restart Espanso. Callers may wait on it to confirm readiness.
+_last_restart: "Optional[RestartHandle]" = None
+
+
+def last_sync_unchanged() -> bool:
+    """Return True when the last sync_to_espanso() call left the output untouched.
+
+    Only an incremental sync (one given *changed_paths*) whose rendered output
+    matched the file on disk skips the write and the Espanso restart.
+    """
+    return _last_sync_unchanged
+
 
 def _sync_bundled_templates_before_espanso(
     dry_run: bool = False,
@@ -575,11 +598,12 @@ def _sync_bundled_templates_before_espanso(
     """Apply bundled template updates before writing Espanso output."""
     from espansr.core.templates import sync_bundled_templates_to_live
 
-    report, result = sync_bundled_templates_to_live(
-        templates_dir=templates_dir,
-        bundled_dir=bundled_dir,
-        dry_run=dry_run,
-    )
+    with span("bundled reconciliation"):
+        report, result = sync_bundled_templates_to_live(
+            templates_dir=templates_dir,
+            bundled_dir=bundled_dir,
+            dry_run=dry_run,
+        )
 
     for error in report.errors:
         print(f"Error: {error}")
@@ -613,11 +637,34 @@ def _sync_bundled_templates_before_espanso(
 # Espanso daemon restart. Public API: sync_to_espanso().
 
 
+def _render_match_entry(template: Template) -> dict:
+    """Convert one triggered template to its Espanso match entry."""
+    replace_text = _convert_to_espanso_placeholders(template.content, template.variables or [])
+    match_entry: dict = {
+        "trigger": template.trigger,
+        "replace": replace_text,
+    }
+
+    if template.variables:
+        match_entry["vars"] = [_build_espanso_var_entry(var) for var in template.variables]
+
+    return match_entry
+
+
+def _read_existing_output(output_path: Path) -> Optional[str]:
+    """Return the current Espanso output file text, or None when unreadable."""
+    try:
+        return output_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def sync_to_espanso(
     dry_run: bool = False,
     update_bundled: bool = False,
     templates_dir: Optional[Path] = None,
     bundled_dir: Optional[Path] = None,
+    changed_paths: Optional[Iterable[str]] = None,
 ) -> bool:
     """Sync templates to Espanso match file.
 
@@ -627,6 +674,15 @@ def sync_to_espanso(
     After a successful call, ``_last_sync_count`` holds the number
     of templates that were written.
 
+    When *changed_paths* is given the publish is incremental: only those
+    templates (and any whose file stat changed) are re-parsed and re-validated,
+    cross-template trigger checks run against the template index, and when the
+    rendered output matches the existing file the write and Espanso restart are
+    skipped (:func:`last_sync_unchanged` then returns True).
+
+    On WSL2 and Windows the Espanso restart runs in the background; the
+    request is kept in ``_last_restart`` so callers can wait for readiness.
+
     Args:
         dry_run: If True, print what would be written without writing.
         update_bundled: If True, apply bundled template updates to the live
@@ -635,12 +691,17 @@ def sync_to_espanso(
             used by tests.
         bundled_dir: Optional bundled template directory override, primarily
             used by tests.
+        changed_paths: Template paths, relative to the live templates
+            directory, known to have changed since the last publish (for
+            example ``RemotePullOutcome.changed_files``).
 
     Returns:
         True if sync was successful, False otherwise.
     """
-    global _last_sync_count
+    global _last_sync_count, _last_sync_unchanged, _last_restart
     _last_sync_count = 0
+    _last_sync_unchanged = False
+    _last_restart = None
 
     if update_bundled and not _sync_bundled_templates_before_espanso(
         dry_run=dry_run,
@@ -657,8 +718,25 @@ def sync_to_espanso(
     if not dry_run:
         clean_stale_espanso_files()
 
+    incremental = None
+    if changed_paths is not None:
+        from espansr.integrations.publish_cache import build_incremental_publish
+
+        changed_paths = list(changed_paths)
+        with span("incremental build", changed=len(changed_paths)):
+            incremental = build_incremental_publish(
+                templates_dir or get_template_manager().templates_dir,
+                changed_paths,
+                _render_match_entry,
+            )
+
     # Validate before writing
-    warnings = validate_all()
+    if incremental is not None:
+        warnings = incremental.warnings
+    else:
+        with span("validation") as s:
+            warnings = validate_all()
+            s.add("warnings", len(warnings))
     errors = [w for w in warnings if w.severity == "error"]
     non_errors = [w for w in warnings if w.severity != "error"]
 
@@ -671,20 +749,13 @@ def sync_to_espanso(
         print(f"Sync aborted: {len(errors)} validation error(s) found")
         return False
 
-    template_manager = get_template_manager()
-    matches = []
-
-    for template in template_manager.iter_with_triggers():
-        replace_text = _convert_to_espanso_placeholders(template.content, template.variables or [])
-        match_entry: dict = {
-            "trigger": template.trigger,
-            "replace": replace_text,
-        }
-
-        if template.variables:
-            match_entry["vars"] = [_build_espanso_var_entry(var) for var in template.variables]
-
-        matches.append(match_entry)
+    if incremental is not None:
+        matches = incremental.matches
+    else:
+        template_manager = get_template_manager()
+        with span("template load") as s:
+            matches = [_render_match_entry(t) for t in template_manager.iter_with_triggers()]
+            s.add("templates", len(matches))
 
     output_path = match_dir / "espansr.yml"
 
@@ -704,16 +775,7 @@ def sync_to_espanso(
 
         if removed_stale_output:
             print(f"No templates with triggers found; removed {output_path}")
-            if is_wsl2():
-                _restart_espanso_wsl2()
-            elif is_windows():
-                if restart_espanso():
-                    print("Espanso restarted successfully.")
-                else:
-                    print(
-                        "Note: Run 'espanso restart' from a new PowerShell window "
-                        "to reload triggers."
-                    )
+            _last_restart = _request_publish_restart()
         else:
             print("No templates with triggers found")
         return True
@@ -726,25 +788,21 @@ def sync_to_espanso(
 
     try:
         content = {"matches": matches}
-        with open(output_path, "w", encoding="utf-8") as f:
-            yaml.dump(content, f, default_flow_style=False, allow_unicode=True)
+        with span("yaml emit", triggers=len(matches)):
+            rendered = yaml.dump(content, default_flow_style=False, allow_unicode=True)
+        if incremental is not None and _read_existing_output(output_path) == rendered:
+            _last_sync_count = len(matches)
+            _last_sync_unchanged = True
+            print(f"Espanso output unchanged; skipped writing {output_path}")
+            return True
+        with span("file write", bytes=len(rendered)):
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(rendered)
 
         _last_sync_count = len(matches)
         print(f"Synced {len(matches)} trigger(s) to {output_path}")
 
-        # Restart Espanso so new triggers become active immediately.
-        # WSL2: file writes via /mnt/c/ bypass the Windows file watcher — use PowerShell restart.
-        # Windows native: file-watcher polling is unreliable for newly added template files.
-        if is_wsl2():
-            _restart_espanso_wsl2()
-        elif is_windows():
-            if restart_espanso():
-                print("Espanso restarted successfully.")
-            else:
-                print(
-                    "Note: Run 'espanso restart' from a new PowerShell window to reload triggers."
-                )
-
+        _last_restart = _request_publish_restart()
         return True
     except Exception as e:
         print(f"Error writing Espanso file: {e}")
@@ -752,44 +810,45 @@ def sync_to_espanso(
 
 
 # ── Section 5: Process management ────────────────────────────────────────────
-# Restarts the Espanso daemon after sync. Handles WSL2 (via powershell.exe)
-# and Windows native (probes %LOCALAPPDATA%\Programs\Espanso\espanso.cmd).
-# _restart_espanso_wsl2, _find_espanso_executable, restart_espanso
+# Restarts and probes the Espanso daemon. WSL2 goes through the resident
+# PowerShell bridge (see powershell_bridge.py); Windows native probes
+# %LOCALAPPDATA%\Programs\Espanso\espanso.cmd.
+# _run_wsl2_powershell, _restart_espanso_wsl2, _find_espanso_executable,
+# restart_espanso, _parse_espanso_status, espanso_status,
+# get_windows_espanso_config_path, RestartHandle, request_restart
 
 
-def _restart_espanso_wsl2() -> None:
-    """Restart Espanso via PowerShell (WSL2 context)."""
-    import subprocess
+def _run_wsl2_powershell(script: str, *, timeout: float = 10.0):
+    """Run *script* on the Windows host through the resident PowerShell bridge.
+
+    Returns the :class:`BridgeResult`, or None when the bridge is unavailable.
+    The working directory is moved off the WSL UNC path first, which Espanso
+    cannot start from.
+    """
+    from espansr.integrations.powershell_bridge import BridgeError, get_powershell_bridge
 
     try:
-        subprocess.run(
-            [
-                "powershell.exe",
-                "-NoProfile",
-                "-Command",
-                "cd C:/; espanso service stop",
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=10,
-        )
-        result = subprocess.run(
-            [
-                "powershell.exe",
-                "-NoProfile",
-                "-Command",
-                "cd C:/; Start-Process espanso -ArgumentList 'service','start' -WindowStyle Hidden",
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            print("Espanso restarted successfully.")
-        else:
-            print("Note: Run 'espanso restart' from Windows PowerShell to reload triggers.")
-    except Exception:
-        print("Note: Run 'espanso restart' from Windows PowerShell to reload triggers.")
+        return get_powershell_bridge().run(f"Set-Location C:/; {script}", timeout=timeout)
+    except BridgeError as exc:
+        logger.debug("PowerShell bridge failed for %r: %s", script, exc)
+        return None
+
+
+def _restart_espanso_wsl2() -> bool:
+    """Restart Espanso via the resident PowerShell bridge (WSL2 context).
+
+    Returns:
+        True if the service start command succeeded, False otherwise.
+    """
+    _run_wsl2_powershell("espanso service stop")
+    result = _run_wsl2_powershell(
+        "Start-Process espanso -ArgumentList 'service','start' -WindowStyle Hidden"
+    )
+    if result is not None and result.ok:
+        print("Espanso restarted successfully.")
+        return True
+    print("Note: Run 'espanso restart' from Windows PowerShell to reload triggers.")
+    return False
 
 
 def _find_espanso_executable() -> str | None:
@@ -823,16 +882,9 @@ def restart_espanso() -> bool:
     import subprocess
 
     if is_wsl2():
-        try:
-            subprocess.run(
-                ["powershell.exe", "-Command", "espanso restart"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=10,
-            )
+        result = _run_wsl2_powershell("espanso restart")
+        if result is not None and result.ok:
             return True
-        except Exception:
-            pass
 
     exe = _find_espanso_executable()
     if exe:
@@ -854,6 +906,211 @@ def restart_espanso() -> bool:
     return False
 
 
+def _parse_espanso_status(text: str) -> Optional[bool]:
+    """Map ``espanso status`` output to True (running), False, or None (unknown)."""
+    lowered = text.lower()
+    if "not running" in lowered:
+        return False
+    if "running" in lowered:
+        return True
+    return None
+
+
+def espanso_status(*, timeout: float = 5.0) -> Optional[bool]:
+    """Ask Espanso whether its daemon is running.
+
+    Uses the PowerShell bridge on WSL2 and the local executable elsewhere.
+
+    Returns:
+        True when running, False when Espanso reports it is not running,
+        None when Espanso could not be queried.
+    """
+    import subprocess
+
+    if is_wsl2():
+        result = _run_wsl2_powershell("espanso status", timeout=timeout)
+        return None if result is None else _parse_espanso_status(result.output)
+
+    exe = _find_espanso_executable()
+    if not exe:
+        return None
+    kwargs: dict = {"capture_output": True, "text": True, "timeout": timeout}
+    if is_windows():
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    try:
+        completed = subprocess.run([exe, "status"], **kwargs)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return _parse_espanso_status(completed.stdout + completed.stderr)
+
+
+def get_windows_espanso_config_path() -> Optional[str]:
+    """Return the config path the Windows-side Espanso reports (WSL2 only).
+
+    Runs ``espanso path config`` through the PowerShell bridge. Returns the
+    Windows path as printed, or None off WSL2 or when Espanso cannot answer.
+    """
+    if not is_wsl2():
+        return None
+    result = _run_wsl2_powershell("espanso path config")
+    if result is None or not result.ok:
+        return None
+    path = result.output.strip()
+    return path or None
+
+
+class RestartHandle:
+    """A pending or finished background Espanso restart.
+
+    Attributes:
+        requests: Number of restart requests coalesced into this restart.
+        restarted: Whether the restart command succeeded (None until it ran).
+        ready: True once ``espanso status`` reported running, False when it
+            did not within the readiness budget, None when Espanso could not
+            be queried (or until the restart finished).
+    """
+
+    def __init__(self, action: Callable[[], bool], ready_timeout: float, poll_interval: float):
+        """Initialize a handle for *action*; the coordinator runs it later."""
+        self.requests = 1
+        self.restarted: Optional[bool] = None
+        self.ready: Optional[bool] = None
+        self._action = action
+        self._ready_timeout = ready_timeout
+        self._poll_interval = poll_interval
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        """Return True once the restart and readiness polling have finished."""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[bool]:
+        """Block until the restart finishes (or *timeout* passes) and return :attr:`ready`."""
+        self._done.wait(timeout)
+        return self.ready
+
+    def _run(self) -> None:
+        with span("espanso restart", requests=self.requests):
+            try:
+                self.restarted = bool(self._action())
+            except Exception as exc:  # restart failures must not kill the worker
+                logger.debug("Espanso restart failed: %s", exc)
+                self.restarted = False
+            if self.restarted:
+                with span("espanso readiness"):
+                    self.ready = _poll_espanso_ready(self._ready_timeout, self._poll_interval)
+        self._done.set()
+
+
+def _poll_espanso_ready(timeout: float, interval: float) -> Optional[bool]:
+    """Poll ``espanso status`` with exponential backoff until it reports running.
+
+    Returns True when running, False when *timeout* passes first, and None as
+    soon as the status cannot be queried at all.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        status = espanso_status()
+        if status is None or status:
+            return status
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, _RESTART_POLL_MAX_SECONDS)
+
+
+class _RestartCoordinator:
+    """Runs restarts one at a time on a worker thread, coalescing bursts.
+
+    A request made while no restart is running starts one at once. Requests
+    made while one is running share a single follow-up restart, so a burst of
+    publishes costs at most two restarts and the last one sees every write.
+    """
+
+    def __init__(self):
+        """Initialize with no restart running."""
+        self._lock = threading.Lock()
+        self._running: Optional[RestartHandle] = None
+        self._queued: Optional[RestartHandle] = None
+
+    def request(self, handle: RestartHandle) -> RestartHandle:
+        """Schedule *handle*, or return the already queued follow-up restart."""
+        with self._lock:
+            if self._queued is not None:
+                self._queued.requests += 1
+                return self._queued
+            if self._running is not None:
+                self._queued = handle
+                return handle
+            self._running = handle
+        # Non-daemon so a CLI process finishes the restart before exiting.
+        threading.Thread(target=self._work, name="espanso-restart", daemon=False).start()
+        return handle
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                handle = self._running
+            handle._run()
+            with self._lock:
+                self._running, self._queued = self._queued, None
+                if self._running is None:
+                    return
+
+
+_RESTART_READY_TIMEOUT_SECONDS = 15.0
+_RESTART_POLL_INITIAL_SECONDS = 0.25
+_RESTART_POLL_MAX_SECONDS = 2.0
+_restart_coordinator = _RestartCoordinator()
+
+
+def request_restart(
+    action: Optional[Callable[[], bool]] = None,
+    *,
+    ready_timeout: float = _RESTART_READY_TIMEOUT_SECONDS,
+    poll_interval: float = _RESTART_POLL_INITIAL_SECONDS,
+) -> RestartHandle:
+    """Restart Espanso in the background and return a handle to wait on.
+
+    Requests arriving while a restart is in flight are coalesced into one
+    follow-up restart. After the restart command succeeds, readiness is
+    polled with backoff against ``espanso status``.
+
+    Args:
+        action: Callable performing the restart and returning success.
+            Defaults to the platform's restart (PowerShell bridge on WSL2).
+        ready_timeout: Seconds to wait for Espanso to report running.
+        poll_interval: First delay between status polls; doubles up to 2s.
+    """
+    if action is None:
+        action = _restart_espanso_wsl2 if is_wsl2() else restart_espanso
+    return _restart_coordinator.request(RestartHandle(action, ready_timeout, poll_interval))
+
+
+def _request_publish_restart() -> Optional[RestartHandle]:
+    """Request the restart that makes freshly published triggers active.
+
+    WSL2: file writes via /mnt/c/ bypass the Windows file watcher. Windows
+    native: file-watcher polling is unreliable for newly added template files.
+    Other platforms rely on Espanso's file watcher and are not restarted.
+    """
+    if is_wsl2():
+        return request_restart(_restart_espanso_wsl2)
+    if not is_windows():
+        return None
+    restart = restart_espanso
+
+    def restart_and_report() -> bool:
+        if restart():
+            print("Espanso restarted successfully.")
+            return True
+        print("Note: Run 'espanso restart' from a new PowerShell window to reload triggers.")
+        return False
+
+    return request_restart(restart_and_report)
+
+
 # ── Section 6: Remote-desktop (RustDesk/RDP) reliability ──────────────────────
 # Over RustDesk/RDP the keys you type are *software-injected* on the host with no
 # physical HID source. Espanso's default `win32_exclude_orphan_events: true`
@@ -9,18 +9,22 @@ a JSON status helper. espansr never imports or depends on orchestratr code.
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from espansr import __version__
 from espansr.core.config import get_config, get_config_dir, get_templates_dir
 from espansr.core.platform import get_platform, get_windows_username
-from espansr.integrations.espanso import get_espanso_config_dir
+from espansr.core.spans import span
+from espansr.core.status_record import load_status_record, write_status_record
 
 MANIFEST_FILENAME = "espansr.yml"
 
+# Seconds a live Espanso probe may take inside ``status --json``. orchestratr
+# allows the whole command 3s (``ready_timeout_ms``), interpreter start included.
+STATUS_PROBE_BUDGET_SECONDS = 1.0
+
 # Required top-level keys for a valid flat manifest.
 _FLAT_SCHEMA_KEYS = {
     "name",
@@ -101,6 +105,8 @@ def generate_manifest(apps_dir: Path) -> Path:
         "ready_timeout_ms": 3000,
     }
 
+    import yaml
+
     apps_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = apps_dir / MANIFEST_FILENAME
     with open(manifest_path, "w", encoding="utf-8") as f:
@@ -121,6 +127,8 @@ def manifest_needs_update(apps_dir: Path) -> bool:
     Returns:
         True if the manifest should be regenerated.
     """
+    import yaml
+
     manifest_path = apps_dir / MANIFEST_FILENAME
     if not manifest_path.exists():
         return True
@@ -150,28 +158,85 @@ def manifest_needs_update(apps_dir: Path) -> bool:
         return True
 
 
-def get_status_json() -> str:
+def get_espanso_config_dir() -> Optional[Path]:
+    """Lazy alias for :func:`espansr.integrations.espanso.get_espanso_config_dir`.
+
+    Importing the Espanso integration pulls in PyYAML and the template store,
+    which a cached ``status --json`` answer never needs.
+    """
+    from espansr.integrations import espanso
+
+    return espanso.get_espanso_config_dir()
+
+
+def _probe_espanso_dir(budget: float) -> tuple[bool, Optional[Path]]:
+    """Detect the Espanso config dir on a worker thread, waiting at most *budget* seconds.
+
+    Returns:
+        ``(finished, path)``. When the probe overruns, ``finished`` is False
+        and the daemon thread is abandoned; the process exits without it.
+    """
+    result: list[Optional[Path]] = []
+
+    def probe() -> None:
+        try:
+            result.append(get_espanso_config_dir())
+        except Exception:
+            result.append(None)
+
+    worker = threading.Thread(target=probe, name="espanso-status-probe", daemon=True)
+    worker.start()
+    with span("espanso probe"):
+        worker.join(budget)
+    if not result:
+        return False, None
+    return True, result[0]
+
+
+def get_status_json(*, live: bool = False, budget: float = STATUS_PROBE_BUDGET_SECONDS) -> str:
     """Build a JSON status string for orchestratr health checks.
 
     Collects current espansr state — version, config path, template count,
     sync status — and returns a stable JSON contract.
 
+    Espanso detection is answered from the status record written by
+    ``publish`` and ``setup`` when it holds a detected directory. Otherwise
+    (or with *live*) it is probed under *budget* seconds and a successful
+    probe refreshes the record. The ``sources`` object says, per value,
+    whether it is ``"cached"``, ``"live"``, or ``"timeout"`` (the probe
+    overran its budget).
+
+    Args:
+        live: Probe Espanso even when the status record has an answer.
+        budget: Seconds the live Espanso probe may take.
+
     Returns:
         A JSON string with status information.
     """
     config_dir = get_config_dir()
     templates_dir = get_templates_dir()
-    espanso_dir = get_espanso_config_dir()
     config = get_config()
 
+    record = None if live else load_status_record(config_dir)
+    if record is not None and record.espanso_config_dir:
+        espanso_synced = True
+        espanso_source = "cached"
+    else:
+        finished, espanso_dir = _probe_espanso_dir(budget)
+        espanso_synced = espanso_dir is not None
+        espanso_source = "live" if finished else "timeout"
+        if finished:
+            write_status_record(config_dir, espanso_dir)
+
     template_count = len(list(templates_dir.glob("*.json")))
-    espanso_synced = espanso_dir is not None
     last_sync = config.espanso.last_sync or ""
 
     errors: list[str] = []
     if template_count == 0:
         errors.append("No templates found")
-    if not espanso_synced:
+    if espanso_source == "timeout":
+        errors.append(f"Espanso detection exceeded the {budget:g}s status budget")
+    elif not espanso_synced:
         errors.append("Espanso not detected")
 
     status = "ok" if not errors else "degraded"
@@ -183,7 +248,14 @@ def get_status_json() -> str:
         "espanso_synced": espanso_synced,
         "template_count": template_count,
         "last_sync": last_sync,
+        "sources": {
+            "espanso_synced": espanso_source,
+            "template_count": "live",
+            "last_sync": "live",
+        },
     }
+    if espanso_source == "cached":
+        data["cached_at"] = record.recorded_at
 
     if errors:
         data["errors"] = errors
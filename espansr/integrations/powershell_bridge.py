@@ -0,0 +1,277 @@
+"""Resident PowerShell bridge for controlling Windows-side Espanso from WSL2.
+
+Starting ``powershell.exe`` from WSL2 costs one to three seconds, and an
+Espanso restart used to start it two or three times. The bridge keeps one
+PowerShell process alive and sends it commands over stdin, so only the first
+command in a burst pays the startup cost. The process is closed after
+``idle_timeout`` seconds without a command and is started again on demand.
+
+Line protocol (one request and one response per line):
+
+* Request: ``<id>\\t<base64 of the UTF-8 script>``. Base64 keeps multi-line
+  scripts and quotes on a single line.
+* Response: a compact JSON object ``{"id", "exit", "output", "error"}``.
+  ``exit`` is ``$LASTEXITCODE`` after the script, or 1 when it threw or
+  reported an error.
+
+Anything that speaks this protocol can stand in for PowerShell; the tests use
+a small Python script.
+"""
+
+import atexit
+import base64
+import itertools
+import json
+import queue
+import subprocess
+import threading
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+DEFAULT_IDLE_TIMEOUT = 120.0
+DEFAULT_COMMAND_TIMEOUT = 10.0
+
+# Read request lines until stdin closes; run each script and answer with one
+# JSON line. Errors are reported in-band so the loop never dies on a bad script.
+_SERVER_SCRIPT = r"""
+$ErrorActionPreference = 'Continue'
+$ProgressPreference = 'SilentlyContinue'
+[Console]::InputEncoding = [Text.Encoding]::UTF8
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
+while ($null -ne ($line = [Console]::In.ReadLine())) {
+    $id, $payload = $line.Split("`t", 2)
+    $output = ''
+    $err = ''
+    $code = 0
+    try {
+        $script = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($payload))
+        $global:LASTEXITCODE = 0
+        $Error.Clear()
+        $output = (& ([ScriptBlock]::Create($script)) 2>&1 | Out-String)
+        if ($null -ne $global:LASTEXITCODE) { $code = [int]$global:LASTEXITCODE }
+        if ($code -eq 0 -and $Error.Count -gt 0) { $code = 1 }
+    } catch {
+        $err = $_.ToString()
+        $code = 1
+    }
+    $reply = @{ id = [int]$id; exit = $code; output = $output; error = $err }
+    [Console]::Out.WriteLine(($reply | ConvertTo-Json -Compress))
+    [Console]::Out.Flush()
+}
+"""
+
+
+def _powershell_argv() -> list[str]:
+    """Return the argv that starts PowerShell running the bridge loop."""
+    encoded = base64.b64encode(_SERVER_SCRIPT.encode("utf-16-le")).decode("ascii")
+    return [
+        "powershell.exe",
+        "-NoLogo",
+        "-NoProfile",
+        "-NonInteractive",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-EncodedCommand",
+        encoded,
+    ]
+
+
+class BridgeError(Exception):
+    """The bridge process could not be started, timed out, or broke the protocol."""
+
+
+@dataclass
+class BridgeResult:
+    """Outcome of one script run through the bridge.
+
+    Attributes:
+        exit_code: ``$LASTEXITCODE`` after the script, or 1 when it failed.
+        output: Combined output and error stream text.
+        error: Exception text when the script threw, else empty.
+    """
+
+    exit_code: int
+    output: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True when the script finished with exit code 0."""
+        return self.exit_code == 0
+
+
+class PowerShellBridge:
+    """A long-lived PowerShell process that runs scripts sent over stdin.
+
+    Thread-safe: commands are serialized, one at a time. The process starts on
+    the first :meth:`run` and closes after *idle_timeout* seconds without one.
+    """
+
+    def __init__(
+        self,
+        argv: Optional[Sequence[str]] = None,
+        *,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """Initialize without starting a process.
+
+        Args:
+            argv: Command that starts a process speaking the line protocol.
+                Defaults to ``powershell.exe`` running the bridge loop.
+            idle_timeout: Seconds of inactivity before the process is closed.
+        """
+        self._argv = list(argv) if argv is not None else _powershell_argv()
+        self._idle_timeout = idle_timeout
+        self._lock = threading.RLock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._idle_timer: Optional[threading.Timer] = None
+        self._ids = itertools.count(1)
+        self.starts = 0
+
+    @property
+    def running(self) -> bool:
+        """True while the bridge process is alive."""
+        with self._lock:
+            return self._proc is not None and self._proc.poll() is None
+
+    def run(self, script: str, *, timeout: float = DEFAULT_COMMAND_TIMEOUT) -> BridgeResult:
+        """Run *script* in the resident process and return its result.
+
+        Raises:
+            BridgeError: When the process cannot start, exits, or does not
+                answer within *timeout* seconds. The process is discarded so
+                the next call starts a fresh one.
+        """
+        with self._lock:
+            self._cancel_idle_timer()
+            try:
+                proc = self._ensure_started()
+                request_id = next(self._ids)
+                payload = base64.b64encode(script.encode("utf-8")).decode("ascii")
+                try:
+                    proc.stdin.write(f"{request_id}\t{payload}\n")
+                    proc.stdin.flush()
+                except (OSError, ValueError) as exc:
+                    raise BridgeError(f"PowerShell bridge closed: {exc}") from exc
+                return self._read_reply(request_id, timeout)
+            except BridgeError:
+                self._stop()
+                raise
+            finally:
+                self._schedule_idle_close()
+
+    def close(self) -> None:
+        """Stop the process now; the next :meth:`run` starts a new one."""
+        with self._lock:
+            self._cancel_idle_timer()
+            self._stop()
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        self._stop()
+        try:
+            proc = subprocess.Popen(
+                self._argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        except OSError as exc:
+            raise BridgeError(f"Could not start PowerShell: {exc}") from exc
+        self._proc = proc
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=_pump_lines,
+            args=(proc.stdout, self._lines),
+            name="powershell-bridge-reader",
+            daemon=True,
+        ).start()
+        self.starts += 1
+        return proc
+
+    def _read_reply(self, request_id: int, timeout: float) -> BridgeResult:
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise BridgeError(f"PowerShell did not answer within {timeout:g}s") from None
+        if line is None:
+            raise BridgeError("PowerShell bridge exited unexpectedly")
+        try:
+            reply = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise BridgeError(f"Malformed PowerShell bridge reply: {line[:80]!r}") from exc
+        if not isinstance(reply, dict) or reply.get("id") != request_id:
+            raise BridgeError("PowerShell bridge reply did not match the request")
+        return BridgeResult(
+            exit_code=int(reply.get("exit") or 0),
+            output=str(reply.get("output") or ""),
+            error=str(reply.get("error") or ""),
+        )
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def _schedule_idle_close(self) -> None:
+        if self._proc is None or self._idle_timeout <= 0:
+            return
+        timer = threading.Timer(self._idle_timeout, self._close_if_idle)
+        timer.daemon = True
+        self._idle_timer = timer
+        timer.start()
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _close_if_idle(self) -> None:
+        with self._lock:
+            if self._idle_timer is not None and self._idle_timer is threading.current_thread():
+                self._idle_timer = None
+                self._stop()
+
+
+def _pump_lines(stream, lines: "queue.Queue[Optional[str]]") -> None:
+    """Forward non-empty lines from *stream* to *lines*; ``None`` marks EOF."""
+    try:
+        for raw in stream:
+            line = raw.strip()
+            if line:
+                lines.put(line)
+    except (OSError, ValueError):
+        pass
+    lines.put(None)
+
+
+# Global instance
+_bridge: Optional[PowerShellBridge] = None
+_bridge_lock = threading.Lock()
+
+
+def get_powershell_bridge() -> PowerShellBridge:
+    """Get the global PowerShellBridge instance, closed at interpreter exit."""
+    global _bridge
+    with _bridge_lock:
+        if _bridge is None:
+            _bridge = PowerShellBridge()
+            atexit.register(_bridge.close)
+        return _bridge
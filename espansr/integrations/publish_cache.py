@@ -0,0 +1,201 @@
+"""Incremental Espanso publish backed by a per-template render cache.
+
+The cache lives at ``_meta/publish_cache.json`` in the live templates directory
+and maps each triggered template's relative path to its stat key and its
+rendered Espanso match. Per-template validation issues come from the
+content-hash-keyed :class:`~espansr.integrations.validation_cache.ValidationCache`
+that ``espansr validate`` also uses, so both share one result per template. An
+incremental publish refreshes the
+:class:`~espansr.core.template_index.TemplateIndex`, re-parses only the
+templates that changed (plus any paths the caller names explicitly), and runs
+the cross-template trigger checks against the index instead of loading every
+template.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from espansr.core.template_index import TemplateIndex
+from espansr.core.templates import _DIGEST_CACHE_MIN_AGE_NS, Template
+from espansr.integrations.validate import (
+    ValidationWarning,
+    _index_sort_key,
+    validate_template,
+    validate_trigger_index,
+)
+from espansr.integrations.validation_cache import ValidationCache, validation_digest
+
+PUBLISH_CACHE_FILENAME = "publish_cache.json"
+_PUBLISH_CACHE_VERSION = 3
+
+
+@dataclass
+class IncrementalPublish:
+    """Matches and validation issues produced by an incremental publish.
+
+    Attributes:
+        matches: Espanso match entries in publish order.
+        warnings: Validation issues in the same order ``validate_all()`` reports them.
+        reparsed: Number of templates rendered during this run.
+    """
+
+    matches: List[dict] = field(default_factory=list)
+    warnings: List[ValidationWarning] = field(default_factory=list)
+    reparsed: int = 0
+
+
+class PublishCache:
+    """Stat-keyed cache of rendered Espanso matches, one entry per template."""
+
+    def __init__(self, templates_dir: Path):
+        """Initialize and load any persisted cache for *templates_dir*."""
+        self._path = templates_dir / "_meta" / PUBLISH_CACHE_FILENAME
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        from espansr import __version__
+
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _PUBLISH_CACHE_VERSION
+            or data.get("espansr") != __version__
+        ):
+            # Rendering rules may change between releases; start cold.
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = {rel: raw for rel, raw in entries.items() if isinstance(raw, dict)}
+
+    def get(self, rel: str, stat: tuple[int, int]) -> Optional[dict]:
+        """Return the cached match for *rel* when it was recorded for *stat*."""
+        entry = self._entries.get(rel)
+        if entry is None or entry.get("stat") != list(stat):
+            return None
+        match = entry.get("match")
+        return match if isinstance(match, dict) else None
+
+    def put(self, rel: str, stat: tuple[int, int], match: dict) -> None:
+        """Record a freshly rendered template.
+
+        Files modified within the timestamp-granularity window are not cached,
+        because a second write in the same tick would keep the same stat key.
+        """
+        if time.time_ns() - stat[0] < _DIGEST_CACHE_MIN_AGE_NS:
+            if self._entries.pop(rel, None) is not None:
+                self._dirty = True
+            return
+        self._entries[rel] = {"stat": list(stat), "match": match}
+        self._dirty = True
+
+    def prune(self, live: Iterable[str]) -> None:
+        """Drop entries for paths that are no longer live triggered templates."""
+        stale = set(self._entries) - set(live)
+        for rel in stale:
+            del self._entries[rel]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache when it changed; failures are silently ignored."""
+        from espansr import __version__
+
+        if not self._dirty:
+            return
+        payload = {
+            "version": _PUBLISH_CACHE_VERSION,
+            "espansr": __version__,
+            "entries": dict(sorted(self._entries.items())),
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+def _load_template(path: Path) -> Optional[Template]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return Template.from_dict(json.load(f), path=path)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Error loading template {path}: {e}")
+        return None
+
+
+def build_incremental_publish(
+    templates_dir: Path,
+    changed_paths: Iterable[str],
+    render: Callable[[Template], dict],
+) -> IncrementalPublish:
+    """Render the Espanso matches for *templates_dir*, re-parsing only what changed.
+
+    Args:
+        templates_dir: Live templates directory.
+        changed_paths: Paths relative to *templates_dir* that must be re-parsed
+            even if their stat key looks unchanged (e.g. a pull's changed files).
+            Entries that are not live template JSON files are ignored.
+        render: Converts one template to its Espanso match entry.
+
+    Returns:
+        The matches and validation issues for the whole store.
+    """
+    forced = set(changed_paths)
+    index = TemplateIndex(templates_dir)
+    index.refresh(force=forced)
+    cache = PublishCache(templates_dir)
+    validation = ValidationCache(templates_dir)
+    result = IncrementalPublish()
+
+    triggered = [
+        (rel, entry)
+        for rel, entry in sorted(index.entries.items(), key=_index_sort_key)
+        if entry.trigger and entry.name is not None
+    ]
+    for rel, entry in triggered:
+        match = None if rel in forced else cache.get(rel, entry.stat)
+        digest = None if rel in forced else validation.digest_for(rel, entry.stat)
+        issues = validation.results(digest) if digest else None
+        if match is None or issues is None:
+            template = _load_template(templates_dir / rel)
+            if template is None or not template.trigger:
+                continue
+            if match is None:
+                match = render(template)
+                cache.put(rel, entry.stat, match)
+                result.reparsed += 1
+            if issues is None:
+                digest = validation_digest(template)
+                issues = validation.results(digest)
+                if issues is None:
+                    issues = [[w.severity, w.message, w.check] for w in validate_template(template)]
+                validation.put(rel, entry.stat, digest, issues)
+
+        result.matches.append(match)
+        result.warnings.extend(
+            ValidationWarning(
+                severity=severity, message=message, template_name=entry.name, check=check
+            )
+            for severity, message, check in issues
+        )
+
+    result.warnings.extend(validate_trigger_index(index))
+    live = [rel for rel, _ in triggered]
+    cache.prune(live)
+    cache.save()
+    validation.prune(live)
+    validation.save()
+    index.save()
+    return result
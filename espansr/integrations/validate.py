@@ -1,16 +1,24 @@
 """Espanso config validation for espansr.
 
 Validates templates for Espanso-incompatible patterns before syncing.
-Checks trigger format, variable references, and cross-template uniqueness.
+Checks trigger format, variable references, cross-template uniqueness, and
+triggers shadowed by a shorter trigger that is their prefix.
 """
 
 import re
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from espansr.core.command_catalog import COMMANDS_POPUP_TRIGGER
 from espansr.core.config import get_config
-from espansr.core.templates import Template, get_template_manager
+from espansr.core.template_index import IndexEntry, TemplateIndex
+from espansr.core.templates import Template, TemplateManager, get_template_manager
+from espansr.integrations.validation_cache import (
+    ValidationCache,
+    cross_check_key,
+    validation_digest,
+)
 
 # Regex to find {{var}} placeholders in template content
 _PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
@@ -24,11 +32,18 @@ class ValidationWarning:
         severity: "error" (blocks sync) or "warning" (informational).
         message: Human-readable description of the issue.
         template_name: Name of the template with the issue.
+        check: Stable identifier of the check that raised it
+            (e.g. "duplicate-trigger"), used by machine-readable output.
+        path: Template file relative to the templates directory, when known.
+            Not part of equality, so the same issue compares equal wherever
+            the file lives.
     """
 
     severity: str
     message: str
     template_name: str
+    check: str = ""
+    path: Optional[str] = field(default=None, compare=False)
 
 
 def validate_template(template: Template) -> List[ValidationWarning]:
@@ -59,6 +74,7 @@ def validate_template(template: Template) -> List[ValidationWarning]:
                 severity="error",
                 message="Trigger is empty",
                 template_name=name,
+                check="empty-trigger",
             )
         )
     else:
@@ -68,6 +84,7 @@ def validate_template(template: Template) -> List[ValidationWarning]:
                     severity="error",
                     message=f"Trigger '{trigger}' is too short (minimum 2 characters)",
                     template_name=name,
+                    check="short-trigger",
                 )
             )
 
@@ -80,6 +97,7 @@ def validate_template(template: Template) -> List[ValidationWarning]:
                         "Espanso keyword triggers conventionally start with ':'"
                     ),
                     template_name=name,
+                    check="trigger-prefix",
                 )
             )
 
@@ -98,6 +116,7 @@ def validate_template(template: Template) -> List[ValidationWarning]:
                     "matching variable defined"
                 ),
                 template_name=name,
+                check="undefined-placeholder",
             )
         )
 
@@ -108,37 +127,251 @@ def validate_template(template: Template) -> List[ValidationWarning]:
                 severity="warning",
                 message=f"Variable '{var_name}' is defined but never referenced in content",
                 template_name=name,
+                check="unused-variable",
             )
         )
 
     return warnings
 
 
-def validate_all() -> List[ValidationWarning]:
+def validate_all(only: Optional[Set[str]] = None) -> List[ValidationWarning]:
     """Validate all triggered templates, including cross-template checks.
 
     Runs validate_template() on each template and additionally checks
-    for duplicate triggers across templates and non-blocking collisions with
-    espansr-managed system triggers.
+    for duplicate triggers across templates, non-blocking collisions with
+    espansr-managed system triggers, and triggers shadowed by a prefix.
+
+    A store on disk is validated through :func:`validate_store`, which only
+    re-checks templates whose validated fields changed.
+
+    Args:
+        only: Limit per-template checks to these relative template paths;
+            see :func:`iter_validate_all`.
 
     Returns:
         List of all ValidationWarning objects found.
     """
+    return list(iter_validate_all(only))
+
+
+def iter_validate_all(only: Optional[Set[str]] = None) -> Iterator[ValidationWarning]:
+    """Yield :func:`validate_all`'s warnings one at a time, as they are found.
+
+    Per-template warnings come first, in template order, followed by the
+    cross-template warnings, so a caller can report progress on a large store
+    before the whole store has been checked.
+
+    Args:
+        only: Template paths relative to the templates directory (``/``
+            separated). When given, per-template checks run only for these
+            files; cross-template checks still cover the whole store, because
+            a changed trigger can collide with an unchanged one.
+
+    Yields:
+        ValidationWarning objects, in ``validate_all()`` order.
+    """
     manager = get_template_manager()
-    templates = list(manager.iter_with_triggers())
+    if isinstance(manager, TemplateManager):
+        yield from iter_validate_store(manager, only)
+        return
 
-    warnings: List[ValidationWarning] = []
+    templates = list(manager.iter_with_triggers())
 
     # Per-template validation
     for template in templates:
-        warnings.extend(validate_template(template))
+        rel = _relative_path(manager, template)
+        if only is not None and rel not in only:
+            continue
+        for warning in validate_template(template):
+            warning.path = rel
+            yield warning
+
+    # Cross-template: duplicates, system-trigger collisions, prefix shadowing
+    pairs = [(template.trigger, template.name) for template in templates]
+    yield from _cross_template_warnings(pairs)
+
+
+def validate_store(manager: TemplateManager) -> List[ValidationWarning]:
+    """Validate *manager*'s store like :func:`validate_all`, using the validation cache.
+
+    See :func:`iter_validate_store`.
+
+    Args:
+        manager: TemplateManager whose ``templates_dir`` is validated.
+
+    Returns:
+        List of all ValidationWarning objects found, in ``validate_all()`` order.
+    """
+    return list(iter_validate_store(manager))
+
+
+def iter_validate_store(
+    manager: TemplateManager, only: Optional[Set[str]] = None
+) -> Iterator[ValidationWarning]:
+    """Yield the validation warnings for *manager*'s store, using the validation cache.
+
+    The template index is refreshed with one stat per file. A template whose
+    stat key is unchanged is not opened: its hash, and the issues recorded for
+    that hash, come from ``_meta/validation_cache.json``. Changed templates are
+    parsed once (the index keeps what it read) and only re-validated when
+    their hash is new. Cross-template checks run on the index's
+    ``(trigger, name)`` pairs and are reused while those pairs and the system
+    triggers stay the same.
+
+    The cache is saved once the cross-template warnings have been yielded; a
+    caller that stops early leaves it as it was.
+
+    Args:
+        manager: TemplateManager whose ``templates_dir`` is validated.
+        only: Relative template paths to run per-template checks for; see
+            :func:`iter_validate_all`.
+
+    Yields:
+        ValidationWarning objects, in ``validate_all()`` order.
+    """
+    templates_dir = manager.templates_dir
+    loaded: Dict[Path, Optional[Template]] = {}
+
+    def read(path: Path) -> Tuple[Optional[str], str]:
+        template = _load_template(manager, path)
+        loaded[path] = template
+        if template is None:
+            return None, ""
+        trigger = template.trigger if isinstance(template.trigger, str) else ""
+        return str(template.name), trigger
+
+    index = TemplateIndex(templates_dir)
+    index.refresh(reader=read)
+    cache = ValidationCache(templates_dir)
+
+    triggered = []
+    for rel, entry in sorted(index.entries.items(), key=_index_sort_key):
+        selected = only is None or rel in only
+        if entry.name is None:
+            path = templates_dir / rel
+            if selected and path not in loaded:
+                _load_template(manager, path)  # report the unreadable file again
+            continue
+        if not entry.trigger:
+            continue
+        if not selected:
+            triggered.append((rel, entry))
+            continue
+
+        digest = cache.digest_for(rel, entry.stat)
+        issues = cache.results(digest) if digest else None
+        if issues is None:
+            path = templates_dir / rel
+            template = loaded[path] if path in loaded else _load_template(manager, path)
+            if template is None or not template.trigger:
+                continue
+            digest = validation_digest(template)
+            issues = cache.results(digest)
+            if issues is None:
+                issues = [[w.severity, w.message, w.check] for w in validate_template(template)]
+            cache.put(rel, entry.stat, digest, issues)
+
+        triggered.append((rel, entry))
+        for severity, message, check in issues:
+            yield ValidationWarning(
+                severity=severity,
+                message=message,
+                template_name=entry.name,
+                check=check,
+                path=rel,
+            )
+
+    # Cross-template warnings name templates; give them a path where the name is unique.
+    rel_by_name: Dict[str, Optional[str]] = {}
+    for rel, entry in triggered:
+        rel_by_name[entry.name] = None if entry.name in rel_by_name else rel
+
+    pairs = [(entry.trigger, entry.name) for _, entry in triggered]
+    key = cross_check_key(pairs, _system_triggers(get_config()))
+    cross = cache.cross(key)
+    if cross is None:
+        cross_warnings = _cross_template_warnings(pairs)
+        cache.put_cross(
+            key,
+            [[w.severity, w.message, w.template_name, w.check] for w in cross_warnings],
+        )
+    else:
+        cross_warnings = [
+            ValidationWarning(severity=severity, message=message, template_name=name, check=check)
+            for severity, message, name, check in cross
+        ]
+    for warning in cross_warnings:
+        warning.path = rel_by_name.get(warning.template_name)
+        yield warning
+
+    cache.prune(rel for rel, _ in triggered)
+    cache.save()
+    index.save()
+
+
+def _relative_path(manager, template: Template) -> Optional[str]:
+    """Return *template*'s file path relative to *manager*'s store, when known."""
+    try:
+        return Path(template._path).relative_to(manager.templates_dir).as_posix()
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_template(manager: TemplateManager, path: Path) -> Optional[Template]:
+    """Load *path* through *manager*, reporting failures like ``list_all()`` does."""
+    try:
+        return manager.load(path)
+    except Exception as e:
+        print(f"Warning: Failed to load {path}: {e}")
+        return None
+
+
+def validate_trigger_index(index: TemplateIndex) -> List[ValidationWarning]:
+    """Run the cross-template checks against an indexed store without parsing it.
+
+    Produces the duplicate-trigger errors, system-trigger collision warnings,
+    and prefix-shadowing warnings :func:`validate_all` would report, in the
+    same order, from the index's ``(trigger, name)`` facts. Per-template
+    checks are not included.
+
+    Args:
+        index: A refreshed template index.
+
+    Returns:
+        List of cross-template ValidationWarning objects.
+    """
+    triggered = [
+        (entry.trigger, entry.name)
+        for _, entry in sorted(index.entries.items(), key=_index_sort_key)
+        if entry.trigger and entry.name is not None
+    ]
+    return _cross_template_warnings(triggered)
+
 
-    # Cross-template: duplicate triggers
+def _cross_template_warnings(pairs: List[Tuple[str, str]]) -> List[ValidationWarning]:
+    """Run every check that compares triggers across templates."""
+    config = get_config()
+    return (
+        _duplicate_trigger_warnings(pairs)
+        + _system_trigger_collision_warnings(pairs)
+        + _prefix_shadow_warnings(pairs, _system_triggers(config))
+    )
+
+
+def _index_sort_key(item: Tuple[str, IndexEntry]) -> Tuple[str, str]:
+    """Order index entries like ``list_all()``: by name, then by path for ties."""
+    rel, entry = item
+    return ((entry.name or "").lower(), rel)
+
+
+def _duplicate_trigger_warnings(pairs: List[Tuple[str, str]]) -> List[ValidationWarning]:
+    """Return one error per template whose trigger is shared with another template."""
     trigger_map: dict[str, list[str]] = {}
-    for template in templates:
-        if template.trigger:
-            trigger_map.setdefault(template.trigger, []).append(template.name)
+    for trigger, name in pairs:
+        if trigger:
+            trigger_map.setdefault(trigger, []).append(name)
 
+    warnings: List[ValidationWarning] = []
     for trigger, names in trigger_map.items():
         if len(names) > 1:
             for template_name in names:
@@ -150,28 +383,39 @@ def validate_all() -> List[ValidationWarning]:
                             f"{', '.join(n for n in names if n != template_name)}"
                         ),
                         template_name=template_name,
+                        check="duplicate-trigger",
                     )
                 )
-
-    warnings.extend(_system_trigger_collision_warnings(templates))
-
     return warnings
 
 
-def _system_trigger_collision_warnings(templates: list[Template]) -> List[ValidationWarning]:
-    """Return warning-only issues for collisions with generated system triggers."""
-    config = get_config()
-    if config.espanso.allow_system_trigger_collisions:
-        return []
+def _system_triggers(config) -> dict[str, str]:
+    """Return ``{trigger: role}`` for espansr-generated triggers.
 
+    Empty when ``espanso.allow_system_trigger_collisions`` is set.
+    """
+    if config.espanso.allow_system_trigger_collisions:
+        return {}
     launcher_trigger = config.espanso.launcher_trigger or ":aopen"
     sync_trigger = getattr(config.espanso, "sync_trigger", "") or ":sync"
-    system_triggers = {
+    return {
         launcher_trigger: "generated launcher trigger",
         COMMANDS_POPUP_TRIGGER: "generated commands popup trigger",
         sync_trigger: "generated sync trigger",
     }
 
+
+def _system_trigger_collision_warnings(
+    pairs: List[Tuple[str, str]],
+) -> List[ValidationWarning]:
+    """Return warning-only issues for collisions with generated system triggers."""
+    config = get_config()
+    if config.espanso.allow_system_trigger_collisions:
+        return []
+
+    launcher_trigger = config.espanso.launcher_trigger or ":aopen"
+    system_triggers = _system_triggers(config)
+
     warnings: List[ValidationWarning] = []
     if launcher_trigger == COMMANDS_POPUP_TRIGGER:
         warnings.append(
@@ -183,21 +427,101 @@ def _system_trigger_collision_warnings(templates: list[Template]) -> List[Valida
                     "espanso.allow_system_trigger_collisions to true to acknowledge"
                 ),
                 template_name="system",
+                check="system-trigger-collision",
             )
         )
 
-    for template in templates:
-        system_role = system_triggers.get(template.trigger)
+    for trigger, template_name in pairs:
+        system_role = system_triggers.get(trigger)
         if system_role:
             warnings.append(
                 ValidationWarning(
                     severity="warning",
                     message=(
-                        f"Trigger '{template.trigger}' collides with the {system_role}; set "
+                        f"Trigger '{trigger}' collides with the {system_role}; set "
                         "espanso.allow_system_trigger_collisions to true to acknowledge"
                     ),
-                    template_name=template.name,
+                    template_name=template_name,
+                    check="system-trigger-collision",
                 )
             )
 
     return warnings
+
+
+def _prefix_shadow_warnings(
+    pairs: List[Tuple[str, str]],
+    system_triggers: dict[str, str],
+) -> List[ValidationWarning]:
+    """Return one warning per trigger made unreachable by a shorter trigger.
+
+    Espanso expands a trigger as soon as it has been typed, so when one trigger
+    is a strict prefix of another (``:rev`` and ``:review``) the longer one can
+    never fire. Every trigger goes into a trie once; walking each trigger's path
+    then meets every shorter trigger that ends on it, so the whole check is
+    linear in the total trigger length (plus one warning per shadowed pair).
+
+    Template triggers are reported in *pairs* order, then system triggers a
+    template shadows. Exact duplicates are left to the duplicate check.
+    """
+    owners: dict[str, list[str]] = {}
+    for trigger, name in pairs:
+        if trigger:
+            owners.setdefault(trigger, []).append(name)
+
+    # Nested dicts keyed by character; the None key marks a trigger's end.
+    trie: dict = {}
+    for trigger in [*owners, *system_triggers]:
+        node = trie
+        for char in trigger:
+            node = node.setdefault(char, {})
+        node[None] = trigger
+
+    def shorter_triggers(trigger: str) -> List[str]:
+        found = []
+        node = trie
+        for char in trigger[:-1]:
+            node = node[char]
+            if None in node:
+                found.append(node[None])
+        return found
+
+    escape = "set espanso.allow_system_trigger_collisions to true to acknowledge"
+    warnings: List[ValidationWarning] = []
+    for trigger, names in owners.items():
+        for prefix in shorter_triggers(trigger):
+            if prefix in owners:
+                shadow = f"'{prefix}' ({', '.join(owners[prefix])})"
+                suffix = ""
+            else:
+                shadow = f"the {system_triggers[prefix]} '{prefix}'"
+                suffix = f"; {escape}"
+            for template_name in names:
+                warnings.append(
+                    ValidationWarning(
+                        severity="warning",
+                        message=(
+                            f"Trigger '{trigger}' is shadowed by {shadow}: Espanso expands "
+                            f"'{prefix}' first, so '{trigger}' never fires{suffix}"
+                        ),
+                        template_name=template_name,
+                        check="prefix-shadow",
+                    )
+                )
+
+    for trigger, role in system_triggers.items():
+        for prefix in shorter_triggers(trigger):
+            for template_name in owners.get(prefix, ["system"]):
+                warnings.append(
+                    ValidationWarning(
+                        severity="warning",
+                        message=(
+                            f"Trigger '{prefix}' shadows the {role} '{trigger}', which "
+                            f"then never fires; {escape}"
+                        ),
+                        template_name=template_name,
+                        check="prefix-shadow",
+                    )
+                )
+
+    return warnings
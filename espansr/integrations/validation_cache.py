@@ -0,0 +1,164 @@
+"""Persistent cache of template validation results.
+
+The cache lives at ``_meta/validation_cache.json`` in the live templates
+directory and holds three things:
+
+- per-template issues keyed by a SHA-256 of the fields validation reads
+  (trigger, content, and variables), so an edit that leaves those alone, a
+  renamed or moved file, or two identical templates share one result;
+- for each live file, its stat key and the hash it had, so unchanged files
+  are looked up without being opened;
+- the cross-template issues (duplicate triggers, system collisions, prefix
+  shadowing) keyed by a hash of every ``(trigger, name)`` pair and the system
+  triggers they were checked against.
+
+Results are tied to the espansr version, because validation rules may change
+between releases.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from espansr.core.templates import _DIGEST_CACHE_MIN_AGE_NS, Template
+
+VALIDATION_CACHE_FILENAME = "validation_cache.json"
+_VALIDATION_CACHE_VERSION = 2
+
+
+def validation_digest(template: Template) -> str:
+    """Return the hash of the template fields per-template validation reads."""
+    payload = {
+        "trigger": template.trigger,
+        "content": template.content,
+        "variables": [var.to_dict() for var in template.variables or []],
+    }
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cross_check_key(pairs: List[tuple[str, str]], system_triggers: Dict[str, str]) -> str:
+    """Return the hash identifying one set of cross-template check inputs."""
+    text = json.dumps([pairs, sorted(system_triggers.items())], ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """Content-hash-keyed validation results for one live templates directory.
+
+    Issues are stored as ``[severity, message, check]`` lists (cross-template
+    issues add the template name before the check) so this module does not
+    depend on the validator.
+    """
+
+    def __init__(self, templates_dir: Path):
+        """Initialize and load any persisted cache for *templates_dir*."""
+        self._path = templates_dir / "_meta" / VALIDATION_CACHE_FILENAME
+        self._paths: Dict[str, dict] = {}
+        self._results: Dict[str, list] = {}
+        self._cross: dict = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        from espansr import __version__
+
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _VALIDATION_CACHE_VERSION
+            or data.get("espansr") != __version__
+        ):
+            return
+        paths, results, cross = data.get("paths"), data.get("results"), data.get("cross")
+        if isinstance(paths, dict):
+            self._paths = {rel: raw for rel, raw in paths.items() if isinstance(raw, dict)}
+        if isinstance(results, dict):
+            self._results = {h: raw for h, raw in results.items() if isinstance(raw, list)}
+        if isinstance(cross, dict) and isinstance(cross.get("warnings"), list):
+            self._cross = cross
+
+    def digest_for(self, rel: str, stat: tuple[int, int]) -> Optional[str]:
+        """Return the hash recorded for *rel* when its stat key is unchanged."""
+        entry = self._paths.get(rel)
+        if entry is None or entry.get("stat") != list(stat):
+            return None
+        digest = entry.get("hash")
+        return digest if isinstance(digest, str) else None
+
+    def results(self, digest: str) -> Optional[List[list]]:
+        """Return the cached ``[severity, message, check]`` issues for *digest*."""
+        return self._results.get(digest)
+
+    def put(self, rel: str, stat: tuple[int, int], digest: str, issues: List[list]) -> None:
+        """Record the issues for *digest* and remember *rel*'s hash.
+
+        The stat-to-hash entry is skipped for files modified within the
+        timestamp-granularity window, because a second write in the same tick
+        would keep the same stat key. The hash-keyed issues are always safe.
+        """
+        if self._results.get(digest) != issues:
+            self._results[digest] = issues
+            self._dirty = True
+        if time.time_ns() - stat[0] < _DIGEST_CACHE_MIN_AGE_NS:
+            if self._paths.pop(rel, None) is not None:
+                self._dirty = True
+            return
+        entry = {"stat": list(stat), "hash": digest}
+        if self._paths.get(rel) != entry:
+            self._paths[rel] = entry
+            self._dirty = True
+
+    def cross(self, key: str) -> Optional[List[list]]:
+        """Return cached ``[severity, message, name, check]`` cross-template issues for *key*."""
+        if self._cross.get("key") != key:
+            return None
+        return self._cross["warnings"]
+
+    def put_cross(self, key: str, issues: List[list]) -> None:
+        """Record the cross-template issues computed for *key*."""
+        self._cross = {"key": key, "warnings": issues}
+        self._dirty = True
+
+    def prune(self, live: Iterable[str]) -> None:
+        """Drop paths that are no longer live and results no live path uses."""
+        live = set(live)
+        stale = set(self._paths) - live
+        for rel in stale:
+            del self._paths[rel]
+        used = {entry.get("hash") for entry in self._paths.values()}
+        unused = [digest for digest in self._results if digest not in used]
+        # Results for files inside the granularity window have no path entry
+        # yet; keep them until the store has settled rather than thrash.
+        if stale or len(unused) > len(self._paths):
+            for digest in unused:
+                del self._results[digest]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache when it changed; failures are silently ignored."""
+        from espansr import __version__
+
+        if not self._dirty:
+            return
+        payload = {
+            "version": _VALIDATION_CACHE_VERSION,
+            "espansr": __version__,
+            "paths": dict(sorted(self._paths.items())),
+            "results": dict(sorted(self._results.items())),
+            "cross": self._cross,
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        except OSError:
+            return
+        self._dirty = False
@@ -0,0 +1,149 @@
+"""Machine-readable output for ``espansr validate``.
+
+Warnings are written as they arrive from
+:func:`espansr.integrations.validate.iter_validate_all`, so a consumer sees
+the first result before the whole store has been checked and the writer holds
+at most one warning at a time. Three formats are supported:
+
+- ``ndjson``: one JSON object per warning, one per line;
+- ``json``: a single document with a ``warnings`` array and a ``summary``;
+- ``sarif``: a SARIF 2.1.0 log, for code-scanning tools.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Iterable, Optional
+from urllib.parse import quote
+
+from espansr.integrations.validate import ValidationWarning
+
+REPORT_FORMATS = ("ndjson", "json", "sarif")
+
+# Every check validate.py can raise, for the SARIF rule table.
+CHECKS = {
+    "empty-trigger": "Trigger is empty",
+    "short-trigger": "Trigger is shorter than 2 characters",
+    "trigger-prefix": "Trigger does not start with ':' or '/'",
+    "undefined-placeholder": "Content placeholder has no matching variable",
+    "unused-variable": "Variable is never referenced in content",
+    "duplicate-trigger": "Trigger is used by more than one template",
+    "system-trigger-collision": "Trigger collides with a generated system trigger",
+    "prefix-shadow": "Trigger is shadowed by a shorter trigger that is its prefix",
+}
+
+_SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+def warning_record(warning: ValidationWarning) -> dict:
+    """Return the JSON object written for *warning* by ``ndjson`` and ``json``."""
+    return {
+        "severity": warning.severity,
+        "check": warning.check,
+        "template": warning.template_name,
+        "path": warning.path,
+        "message": warning.message,
+    }
+
+
+def sarif_result(warning: ValidationWarning) -> dict:
+    """Return the SARIF ``result`` object for *warning*.
+
+    The location is a relative URI reference, so the template path is
+    percent-encoded (spaces, ``#``, non-ASCII names) and keeps its ``/``.
+    """
+    result = {
+        "ruleId": warning.check,
+        "level": "error" if warning.severity == "error" else "warning",
+        "message": {"text": f"[{warning.template_name}]: {warning.message}"},
+        "properties": {"template": warning.template_name},
+    }
+    if warning.path:
+        result["locations"] = [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": quote(warning.path), "uriBaseId": "TEMPLATES"}
+                }
+            }
+        ]
+    return result
+
+
+def write_report(
+    warnings: Iterable[ValidationWarning],
+    fmt: str,
+    out: IO[str],
+    templates_dir: Optional[Path] = None,
+) -> int:
+    """Stream *warnings* to *out* in *fmt* and return how many were errors.
+
+    Each warning is written and flushed as soon as it is produced. The ``json``
+    and ``sarif`` documents are opened before the first warning and closed
+    after the last, so the output is only complete once this returns.
+
+    Args:
+        warnings: Warnings in the order to report them; typically a generator.
+        fmt: One of :data:`REPORT_FORMATS`.
+        out: Text stream to write to.
+        templates_dir: Directory template paths are relative to; recorded as
+            the SARIF ``TEMPLATES`` base URI when given.
+
+    Returns:
+        The number of warnings with severity ``"error"``.
+    """
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format: {fmt}")
+
+    errors = total = 0
+    if fmt == "json":
+        out.write('{"warnings": [')
+    elif fmt == "sarif":
+        out.write(_sarif_prefix(templates_dir))
+    out.flush()
+
+    for warning in warnings:
+        if fmt == "ndjson":
+            out.write(json.dumps(warning_record(warning), ensure_ascii=False) + "\n")
+        else:
+            record = warning_record(warning) if fmt == "json" else sarif_result(warning)
+            out.write(("," if total else "") + "\n  " + json.dumps(record, ensure_ascii=False))
+        out.flush()
+        total += 1
+        errors += warning.severity == "error"
+
+    tail = "\n" if total else ""
+    if fmt == "json":
+        summary = {"errors": errors, "warnings": total - errors}
+        out.write(f'{tail}], "summary": {json.dumps(summary)}}}\n')
+    elif fmt == "sarif":
+        out.write(f"{tail}]}}]}}\n")
+    out.flush()
+    return errors
+
+
+def _sarif_prefix(templates_dir: Optional[Path]) -> str:
+    """Return the SARIF log text up to and including the run's ``"results": [``.
+
+    The log and its run are written as explicit fragments, so the results
+    array can be left open for streaming and closed with ``]}]}``.
+    """
+    from espansr import __version__
+
+    run: dict = {
+        "tool": {
+            "driver": {
+                "name": "espansr",
+                "version": __version__,
+                "rules": [
+                    {"id": check, "shortDescription": {"text": text}}
+                    for check, text in CHECKS.items()
+                ],
+            }
+        },
+    }
+    if templates_dir is not None:
+        run["originalUriBaseIds"] = {"TEMPLATES": {"uri": Path(templates_dir).as_uri() + "/"}}
+    run_fields = ", ".join(f"{json.dumps(key)}: {json.dumps(value)}" for key, value in run.items())
+    return (
+        f'{{"$schema": {json.dumps(_SARIF_SCHEMA)}, "version": "2.1.0", '
+        f'"runs": [{{{run_fields}, "results": ['
+    )
@@ -200,6 +200,22 @@ class CommandsPopupDialog(QDialog):
         # Focus the scratchpad so a command can be typed or pasted immediately.
         self._scratchpad.setFocus()
 
+    def refresh(self) -> None:
+        """Re-apply the current theme and rebuild the catalog from disk.
+
+        Used when a pre-built popup is shown later, after templates or the
+        config may have changed.
+        """
+        config = get_config()
+        self.setStyleSheet(
+            get_theme_stylesheet(
+                theme=config.ui.theme,
+                font_size=config.ui.font_size,
+            )
+        )
+        self._entries = build_command_catalog(config=config)
+        self._populate_entries(self._entries)
+
     def _populate_entries(self, entries: list[CommandCatalogEntry]) -> None:
         """Populate the scrollable list from command catalog entries."""
         fixed_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
@@ -1,9 +1,11 @@
 """Main window for espansr."""
 
 import base64
+import itertools
 import sys
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 from PyQt6.QtCore import QByteArray, QObject, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut
@@ -44,6 +46,43 @@ class _RepoSyncWorker(QObject):
         self.finished.emit(rc)
 
 
+class _RemoteWorker(QObject):
+    """Runs one remote git task off the UI thread, with cancellation.
+
+    The task is called as ``task(cancel, progress)``: *cancel* is a
+    ``threading.Event`` to hand to cancellable git calls, and *progress* emits a
+    status-bar message.
+    """
+
+    progress = pyqtSignal(str)
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    done = pyqtSignal()
+
+    def __init__(self, task: Callable[[threading.Event, Callable[[str], None]], object]):
+        super().__init__()
+        self._task = task
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation; safe to call from the UI thread."""
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        """Return True once cancellation was requested."""
+        return self._cancel.is_set()
+
+    def run(self) -> None:
+        """Run the task and emit its result or exception."""
+        try:
+            result = self._task(self._cancel, self.progress.emit)
+        except Exception as exc:
+            self.failed.emit(exc)
+        else:
+            self.succeeded.emit(result)
+        self.done.emit()
+
+
 class MainWindow(QMainWindow):
     """Main application window for espansr."""
 
@@ -78,6 +117,11 @@ class MainWindow(QMainWindow):
         self._pull_latest_btn.clicked.connect(self._do_pull_latest)
         toolbar.addWidget(self._pull_latest_btn)
 
+        self._push_btn = QPushButton("Push")
+        self._push_btn.setToolTip("Commit and push local template changes to the remote")
+        self._push_btn.clicked.connect(self._do_push)
+        toolbar.addWidget(self._push_btn)
+
         self._sync_repo_btn = QPushButton("Sync")
         self._sync_repo_btn.setToolTip(
             "Pull the latest version, push local changes if clean, then reinstall locally"
@@ -139,10 +183,31 @@ class MainWindow(QMainWindow):
         status_bar = QStatusBar()
         self.setStatusBar(status_bar)
 
+        # Remote operation controls: cancel button and "remote has updates" flag
+        self._remote_thread: Optional[QThread] = None
+        self._remote_worker: Optional[_RemoteWorker] = None
+        self._pending_remote_action: Optional[Callable[[], None]] = None
+        self._remote_updates = QLabel()
+        self._remote_updates.hide()
+        status_bar.addPermanentWidget(self._remote_updates)
+        self._cancel_remote_btn = QPushButton("Cancel")
+        self._cancel_remote_btn.setToolTip("Cancel the running pull or push")
+        self._cancel_remote_btn.clicked.connect(self._cancel_remote_task)
+        self._cancel_remote_btn.hide()
+        status_bar.addPermanentWidget(self._cancel_remote_btn)
+
         # Permanent Espanso status indicator
         self._espanso_status = QLabel()
         status_bar.addPermanentWidget(self._espanso_status)
 
+        # Optional periodic remote check (fetch only; never pulls)
+        self._remote_check_timer = QTimer(self)
+        self._remote_check_timer.timeout.connect(self._check_remote_updates)
+        check_minutes = self._config.remote.check_interval_minutes
+        if self._config.remote.url and isinstance(check_minutes, int) and check_minutes > 0:
+            self._remote_check_timer.setInterval(check_minutes * 60 * 1000)
+            self._remote_check_timer.start()
+
         # Wire signals
         self._browser.template_selected.connect(self._editor.load_template)
         self._browser.new_template_requested.connect(self._editor.clear)
@@ -317,59 +382,210 @@ class MainWindow(QMainWindow):
             self._sync_btn.setEnabled(True)
             self._update_espanso_status()
 
+    # ── Remote pull / push ──────────────────────────────────────────────────
+
+    def _start_remote_task(
+        self,
+        task: Callable[[threading.Event, Callable[[str], None]], object],
+        on_success: Callable[[object], None],
+        on_failure: Callable[[Exception], None],
+        *,
+        background: bool = False,
+    ) -> bool:
+        """Run *task* on a worker thread; return False if another task is running.
+
+        Foreground tasks (pull, push) disable the remote buttons and show a
+        Cancel button; background checks run silently.
+        """
+        if self._remote_worker is not None:
+            return False
+
+        self._remote_thread = QThread(self)
+        self._remote_worker = _RemoteWorker(task)
+        self._remote_worker.moveToThread(self._remote_thread)
+        self._remote_thread.started.connect(self._remote_worker.run)
+        self._remote_worker.succeeded.connect(on_success)
+        self._remote_worker.failed.connect(on_failure)
+        self._remote_worker.done.connect(self._on_remote_task_done)
+        self._remote_worker.done.connect(self._remote_thread.quit)
+        self._remote_worker.done.connect(self._remote_worker.deleteLater)
+        self._remote_thread.finished.connect(self._remote_thread.deleteLater)
+        if not background:
+            self._remote_worker.progress.connect(lambda msg: self.statusBar().showMessage(msg, 0))
+            self._pull_latest_btn.setEnabled(False)
+            self._push_btn.setEnabled(False)
+            self._cancel_remote_btn.show()
+        self._remote_thread.start()
+        return True
+
+    def _run_remote_action(self, action: Callable[[], None]) -> None:
+        """Start a user-requested remote action, pre-empting a background check."""
+        if self._remote_worker is None:
+            action()
+            return
+        # A background check is running: cancel it and start once it stops.
+        self._pending_remote_action = action
+        self._remote_worker.cancel()
+
+    def _on_remote_task_done(self) -> None:
+        """Reset remote controls and start any action that was waiting."""
+        self._remote_worker = None
+        self._remote_thread = None
+        self._pull_latest_btn.setEnabled(True)
+        self._push_btn.setEnabled(True)
+        self._cancel_remote_btn.hide()
+        self._cancel_remote_btn.setEnabled(True)
+        action, self._pending_remote_action = self._pending_remote_action, None
+        if action is not None:
+            action()
+
+    def _cancel_remote_task(self) -> None:
+        """Cancel the running pull or push."""
+        if self._remote_worker is not None:
+            self._remote_worker.cancel()
+            self._cancel_remote_btn.setEnabled(False)
+            self.statusBar().showMessage("Cancelling…", 0)
+
     def _do_pull_latest(self) -> None:
-        """Pull remote templates, refresh the browser, and regenerate Espanso output."""
+        """Pull remote templates and regenerate Espanso output on a worker thread."""
         if self._editor.has_unsaved_changes():
             self.statusBar().showMessage(
                 "Pull latest blocked: save or discard current changes first",
                 8000,
             )
             return
+        self._run_remote_action(self._start_pull)
+
+    def _start_pull(self) -> None:
+        from espansr.core.remote import RemoteCancelledError, RemoteManager
+        from espansr.integrations.espanso import sync_to_espanso
+
+        def task(cancel: threading.Event, progress: Callable[[str], None]):
+            rm = RemoteManager()
+            progress("Pull latest: fetching from remote…")
+            rm.fetch(cancel=cancel)
+            # Cancellation stops here: once remote changes are applied locally,
+            # Espanso output must be regenerated to match them.
+            if cancel.is_set():
+                raise RemoteCancelledError("Pull cancelled")
+            progress("Pull latest: applying remote changes…")
+            outcome = rm.pull_with_result(fetch=False)
+            progress("Pull latest: publishing to Espanso…")
+            synced = sync_to_espanso(update_bundled=False, changed_paths=outcome.changed_files)
+            return outcome, synced
+
+        self._start_remote_task(task, self._on_pull_done, self._on_pull_failed)
+
+    def _on_pull_done(self, result) -> None:
+        """Refresh the browser and report a finished pull."""
+        outcome, synced = result
+        self._remote_updates.hide()
+        if outcome.status == "changed":
+            self._browser.refresh()
+        self._update_espanso_status()
 
-        self._pull_latest_btn.setEnabled(False)
-        try:
-            from espansr.core.remote import (
-                GitNotFoundError,
-                RemoteConflictError,
-                RemoteError,
-                RemoteManager,
+        if not synced:
+            self.statusBar().showMessage(
+                "Pulled remote templates, but Espanso sync failed",
+                8000,
             )
-            from espansr.integrations.espanso import sync_to_espanso
+        elif outcome.status == "changed":
+            count = len(outcome.changed_files)
+            suffix = "file" if count == 1 else "files"
+            self.statusBar().showMessage(
+                f"Pulled latest templates ({count} {suffix} updated)",
+                5000,
+            )
+        elif outcome.status == "up_to_date":
+            self.statusBar().showMessage("Templates already up to date", 5000)
+        elif outcome.status == "empty_remote":
+            self.statusBar().showMessage("Remote is empty; nothing to pull", 8000)
+        else:
+            self.statusBar().showMessage(f"Pull latest completed: {outcome.status}", 5000)
+
+    def _on_pull_failed(self, error: Exception) -> None:
+        """Report a pull failure in the status bar."""
+        from espansr.core.remote import (
+            GitNotFoundError,
+            RemoteCancelledError,
+            RemoteConflictError,
+            RemoteError,
+        )
 
-            outcome = RemoteManager().pull_with_result()
-            self._browser.refresh()
+        if isinstance(error, RemoteCancelledError):
+            self.statusBar().showMessage("Pull latest cancelled", 5000)
+        elif isinstance(error, RemoteConflictError):
+            self.statusBar().showMessage(f"Pull latest conflict: {error}", 0)
+        elif isinstance(error, GitNotFoundError):
+            self.statusBar().showMessage(str(error), 8000)
+        elif isinstance(error, RemoteError):
+            self.statusBar().showMessage(f"Pull latest failed: {error}", 8000)
+        else:
+            self.statusBar().showMessage(f"Pull latest error: {error}", 8000)
 
-            if not sync_to_espanso(update_bundled=False):
-                self.statusBar().showMessage(
-                    "Pulled remote templates, but Espanso sync failed",
-                    8000,
-                )
-                return
+    def _do_push(self) -> None:
+        """Commit and push local template changes on a worker thread."""
+        if self._editor.has_unsaved_changes():
+            self.statusBar().showMessage(
+                "Push blocked: save or discard current changes first",
+                8000,
+            )
+            return
+        self._run_remote_action(self._start_push)
 
-            if outcome.status == "changed":
-                count = len(outcome.changed_files)
-                suffix = "file" if count == 1 else "files"
-                self.statusBar().showMessage(
-                    f"Pulled latest templates ({count} {suffix} updated)",
-                    5000,
-                )
-            elif outcome.status == "up_to_date":
-                self.statusBar().showMessage("Templates already up to date", 5000)
-            elif outcome.status == "empty_remote":
-                self.statusBar().showMessage("Remote is empty; nothing to pull", 8000)
-            else:
-                self.statusBar().showMessage(f"Pull latest completed: {outcome.status}", 5000)
-        except RemoteConflictError as e:
-            self.statusBar().showMessage(f"Pull latest conflict: {e}", 0)
-        except GitNotFoundError as e:
-            self.statusBar().showMessage(str(e), 8000)
-        except RemoteError as e:
-            self.statusBar().showMessage(f"Pull latest failed: {e}", 8000)
-        except Exception as e:
-            self.statusBar().showMessage(f"Pull latest error: {e}", 8000)
-        finally:
-            self._pull_latest_btn.setEnabled(True)
-            self._update_espanso_status()
+    def _start_push(self) -> None:
+        from espansr.core.remote import RemoteManager
+
+        def task(cancel: threading.Event, progress: Callable[[str], None]):
+            progress("Push: committing and pushing local changes…")
+            return RemoteManager().push(cancel=cancel)
+
+        self._start_remote_task(task, self._on_push_done, self._on_push_failed)
+
+    def _on_push_done(self, _result) -> None:
+        """Report a finished push."""
+        self.statusBar().showMessage("Pushed local templates to remote", 5000)
+
+    def _on_push_failed(self, error: Exception) -> None:
+        """Report a push failure in the status bar."""
+        from espansr.core.remote import GitNotFoundError, RemoteCancelledError
+
+        if isinstance(error, RemoteCancelledError):
+            self.statusBar().showMessage(
+                "Push cancelled; committed changes will be pushed next time", 5000
+            )
+        elif isinstance(error, GitNotFoundError):
+            self.statusBar().showMessage(str(error), 8000)
+        else:
+            self.statusBar().showMessage(f"Push failed: {error}", 8000)
+
+    def _check_remote_updates(self) -> None:
+        """Fetch in the background and flag remote updates without pulling."""
+        from espansr.core.remote import RemoteManager
+
+        def task(cancel: threading.Event, progress: Callable[[str], None]):
+            rm = RemoteManager()
+            rm.fetch(cancel=cancel)
+            return rm.ahead_behind()
+
+        self._start_remote_task(task, self._on_remote_checked, lambda _error: None, background=True)
+
+    def _on_remote_checked(self, counts) -> None:
+        """Show or hide the "remote has updates" flag from ahead/behind counts."""
+        ahead, behind = counts
+        parts = []
+        if behind:
+            parts.append(f"{behind} new on remote")
+        if ahead:
+            parts.append(f"{ahead} to push")
+        if parts:
+            self._remote_updates.setText(f"Remote: {', '.join(parts)}")
+            self._remote_updates.setToolTip(
+                "Use Pull Latest to apply remote changes and Push to share local commits"
+            )
+            self._remote_updates.show()
+        else:
+            self._remote_updates.hide()
 
     def _do_repo_sync(self) -> None:
         """Pull latest, push local changes if clean, then reinstall — off the UI thread.
@@ -431,15 +647,17 @@ class MainWindow(QMainWindow):
     # ── Callbacks ───────────────────────────────────────────────────────────
 
     def _do_import(self) -> None:
-        """Open a file dialog and import selected template JSON file(s)."""
+        """Open a file dialog and import selected template files or archives."""
         from PyQt6.QtWidgets import QFileDialog
 
-        from espansr.core.templates import import_template
+        from espansr.core.bundle import is_bundle_path, iter_import_bundle
+        from espansr.core.templates import iter_import_templates
 
         paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Import Templates",
             "",
+            "Template Files (*.json *.yml *.yaml *.zip *.tar.gz *.tgz *.jsonl *.jsonl.gz);;"
             "JSON Files (*.json);;All Files (*)",
         )
         if not paths:
@@ -449,14 +667,24 @@ class MainWindow(QMainWindow):
 
         succeeded = 0
         failed = 0
+        warned = 0
         last_name = ""
-        for p in paths:
-            result = import_template(Path(p))
+        sources = [Path(p) for p in paths]
+        bundles = [p for p in sources if is_bundle_path(p)]
+        results = itertools.chain(
+            iter_import_templates(p for p in sources if p not in bundles),
+            *(iter_import_bundle(p) for p in bundles),
+        )
+        for done, result in enumerate(results, start=1):
             if result.template:
                 succeeded += 1
+                warned += result.warning is not None
                 last_name = result.template.name
             else:
                 failed += 1
+            # YAML files and archives yield one result per match or member.
+            self.statusBar().showMessage(f"Importing... {done} processed")
+            QApplication.processEvents()
 
         self._browser.refresh()
         if last_name:
@@ -465,6 +693,8 @@ class MainWindow(QMainWindow):
         parts = []
         if succeeded:
             parts.append(f"Imported {succeeded} template(s)")
+        if warned:
+            parts.append(f"{warned} with dropped triggers")
         if failed:
             parts.append(f"{failed} failed")
         self.statusBar().showMessage(", ".join(parts), 5000)
@@ -498,6 +728,11 @@ class MainWindow(QMainWindow):
         t = self._browser.get_current_template()
         ui.last_template = t.name if t else ""
         save_config(self._config)
+        self._remote_check_timer.stop()
+        if self._remote_worker is not None and self._remote_thread is not None:
+            self._remote_worker.cancel()
+            self._remote_thread.quit()
+            self._remote_thread.wait(5000)
         super().closeEvent(event)
 
 
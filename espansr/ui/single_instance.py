@@ -0,0 +1,251 @@
+"""Single-instance GUI: later launches hand their view to the running process.
+
+The ``:aopen`` and ``:coms`` triggers each run ``espansr gui``, and starting
+Python plus PyQt6 takes a second or more. The first GUI process therefore
+listens on a per-user ``QLocalServer``. A later ``espansr gui`` connects,
+sends the view it was asked for, and exits. The running instance raises its
+main window or shows its pre-built commands popup.
+
+An instance started by a trigger (``espansr gui --resident``) stays resident
+for ``ui.resident_minutes`` after its last window closes, so the next trigger
+opens near-instantly, then quits. A plain ``espansr gui`` exits with its last
+window, so a terminal that launched it is not held.
+The main window and popup modules are imported only when a window is built,
+so the hand-off path stays cheap.
+"""
+
+import getpass
+import re
+import sys
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from PyQt6.QtWidgets import QApplication, QWidget
+
+VIEWS = ("main", "commands")
+
+# How long a second launch waits to reach the running instance.
+HANDOFF_TIMEOUT_MS = 500
+
+
+def get_server_name() -> str:
+    """Return the per-user local server name the GUI instance listens on."""
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = "user"
+    return "espansr-gui-" + re.sub(r"[^A-Za-z0-9_.-]", "_", user)
+
+
+def send_to_running_instance(
+    view: str,
+    *,
+    server_name: Optional[str] = None,
+    timeout_ms: int = HANDOFF_TIMEOUT_MS,
+) -> bool:
+    """Ask a running GUI instance to show *view*.
+
+    Returns:
+        True when an instance accepted the request, False when none is
+        listening (the caller should start the GUI itself).
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(server_name or get_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+
+    socket.write(f"{view}\n".encode("utf-8"))
+    if not socket.waitForBytesWritten(timeout_ms):
+        socket.abort()
+        return False
+    # The request is delivered even if the instance is too busy to ack in
+    # time; waiting only keeps the socket open until it has been read.
+    socket.waitForReadyRead(timeout_ms)
+    socket.disconnectFromServer()
+    return True
+
+
+class InstanceServer(QObject):
+    """Local server that receives view requests from later launches."""
+
+    view_requested = pyqtSignal(str)
+
+    def __init__(self, server_name: Optional[str] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._name = server_name or get_server_name()
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+
+    @property
+    def name(self) -> str:
+        """The local server name."""
+        return self._name
+
+    def listen(self) -> bool:
+        """Start listening; returns False when another instance already is.
+
+        A crashed instance can leave a stale socket file behind, and on some
+        platforms listening would silently take over a live one, so the name
+        is probed first and only reclaimed when nothing answers.
+        """
+        probe = QLocalSocket()
+        probe.connectToServer(self._name)
+        if probe.waitForConnected(HANDOFF_TIMEOUT_MS):
+            probe.abort()
+            return False
+        QLocalServer.removeServer(self._name)
+        return self._server.listen(self._name)
+
+    def close(self) -> None:
+        """Stop listening."""
+        self._server.close()
+
+    def _on_new_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.readyRead.connect(lambda s=socket: self._read_request(s))
+            socket.disconnected.connect(socket.deleteLater)
+            self._read_request(socket)
+
+    def _read_request(self, socket: QLocalSocket) -> None:
+        if not socket.canReadLine():
+            return
+        view = bytes(socket.readLine()).decode("utf-8", errors="replace").strip()
+        socket.write(b"ok\n")
+        socket.flush()
+        socket.disconnectFromServer()
+        if view in VIEWS:
+            self.view_requested.emit(view)
+
+
+class GuiInstance(QObject):
+    """Owns the windows of a resident GUI process and shows views on request.
+
+    The commands popup is rebuilt hidden after each use, so the next
+    ``:coms`` only has to refresh its catalog and show it.
+    """
+
+    def __init__(self, app: QApplication, *, resident_minutes: int = 0):
+        super().__init__()
+        self._app = app
+        self._resident_ms = max(resident_minutes, 0) * 60 * 1000
+        self._main_window: Optional[QWidget] = None
+        self._popup: Optional[QWidget] = None
+
+        # Window lifetime is managed here: hiding the popup does not count as
+        # closing a window, and the resident period outlives the last one.
+        app.setQuitOnLastWindowClosed(False)
+        app.lastWindowClosed.connect(self._schedule_exit)
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._quit_if_idle)
+
+    @property
+    def main_window(self) -> Optional[QWidget]:
+        """The current main window, if one was built."""
+        return self._main_window
+
+    @property
+    def popup(self) -> Optional[QWidget]:
+        """The current (possibly hidden) commands popup, if one was built."""
+        return self._popup
+
+    def show_view(self, view: str) -> None:
+        """Show *view* (``"main"`` or ``"commands"``), reusing open windows."""
+        self._idle_timer.stop()
+        window = self._show_popup() if view == "commands" else self._show_main()
+        if window.isMinimized():
+            window.showNormal()
+        window.raise_()
+        window.activateWindow()
+        if self._resident_ms and self._popup is None:
+            QTimer.singleShot(0, self._prebuild_popup)
+
+    def _show_main(self) -> QWidget:
+        window = self._main_window
+        if window is None or not window.isVisible():
+            from espansr.core.config import get_config_manager
+            from espansr.ui.main_window import MainWindow
+
+            if window is not None:
+                window.deleteLater()
+            # Another process may have changed the config while we idled.
+            get_config_manager().reload()
+            window = self._main_window = MainWindow()
+            window.show()
+        return window
+
+    def _show_popup(self) -> QWidget:
+        from espansr.core.config import get_config_manager
+
+        # Another process may have changed the config or templates while we idled.
+        get_config_manager().reload()
+        popup = self._popup
+        if popup is None:
+            popup = self._prebuild_popup()
+        else:
+            popup.refresh()
+        popup.show()
+        return popup
+
+    def _prebuild_popup(self) -> QWidget:
+        if self._popup is None:
+            from espansr.ui.commands_popup import CommandsPopupDialog
+
+            self._popup = CommandsPopupDialog()
+            self._popup.finished.connect(self._on_popup_finished)
+        return self._popup
+
+    def _on_popup_finished(self, _result: int) -> None:
+        # Discard the used popup (and its scratchpad) and build a fresh one
+        # against the current templates for the next request.
+        if self._popup is not None:
+            self._popup.deleteLater()
+            self._popup = None
+        if self._resident_ms:
+            QTimer.singleShot(0, self._prebuild_popup)
+        self._schedule_exit()
+
+    def _has_visible_window(self) -> bool:
+        return any(w.isVisible() for w in (self._main_window, self._popup) if w is not None)
+
+    def _schedule_exit(self) -> None:
+        if self._has_visible_window():
+            return
+        if self._resident_ms:
+            self._idle_timer.start(self._resident_ms)
+        else:
+            self._app.quit()
+
+    def _quit_if_idle(self) -> None:
+        if not self._has_visible_window():
+            self._app.quit()
+
+
+def run_gui(view: str = "main", *, resident: bool = False) -> int:
+    """Run the GUI as the single instance, showing *view* first.
+
+    When another instance started listening in the meantime, the view is
+    handed to it instead. With *resident*, the process outlives its last
+    window by ``ui.resident_minutes``; otherwise it exits with it.
+    """
+    from espansr.core.config import get_config
+
+    app: Optional[QApplication] = QApplication.instance()  # type: ignore[assignment]
+    if app is None:
+        app = QApplication(sys.argv)
+
+    server = InstanceServer()
+    if not server.listen() and send_to_running_instance(view, server_name=server.name):
+        return 0
+
+    resident_minutes = get_config().ui.resident_minutes if resident else 0
+    instance = GuiInstance(app, resident_minutes=resident_minutes)
+    server.view_requested.connect(instance.show_view)
+    instance.show_view(view)
+    try:
+        return app.exec()
+    finally:
+        server.close()
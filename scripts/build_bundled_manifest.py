@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Regenerate the bundled starter manifest from ``templates/*.json``.
+
+``templates/bundled.sha256`` records the normalized-content hash of every
+bundled starter so publish-time reconciliation can compare hashes instead of
+re-parsing each starter. Rerun this after adding, removing, or editing one.
+
+Usage::
+
+    python scripts/build_bundled_manifest.py            # rewrite the manifest
+    python scripts/build_bundled_manifest.py --check     # exit 1 if it is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from espansr.core.templates import BUNDLED_MANIFEST_FILENAME, render_bundled_manifest
+
+ROOT = Path(__file__).resolve().parents[1]
+TEMPLATES_DIR = ROOT / "templates"
+MANIFEST_PATH = TEMPLATES_DIR / BUNDLED_MANIFEST_FILENAME
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Report drift and exit non-zero instead of rewriting the manifest.",
+    )
+    args = parser.parse_args()
+
+    expected = render_bundled_manifest(TEMPLATES_DIR)
+    current = MANIFEST_PATH.read_text(encoding="utf-8") if MANIFEST_PATH.exists() else ""
+
+    if args.check:
+        if current != expected:
+            print(f"{MANIFEST_PATH.relative_to(ROOT)} is out of date.")
+            print("Run: python scripts/build_bundled_manifest.py")
+            return 1
+        print("Bundled manifest is up to date.")
+        return 0
+
+    MANIFEST_PATH.write_text(expected, encoding="utf-8")
+    print("Regenerated:", MANIFEST_PATH.relative_to(ROOT) if current != expected else "no changes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
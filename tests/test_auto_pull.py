@@ -0,0 +1,156 @@
+"""Tests for throttled, background auto-pull."""
+
+import json
+import os
+import subprocess
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.config import Config, ConfigManager
+from espansr.core.remote import _BACKGROUND_FETCH_STAMP, RemoteManager
+
+# ─── Fixtures ────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture()
+def bare_remote(tmp_path):
+    """Create a bare git repo that acts as a remote."""
+    remote_dir = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "--bare", str(remote_dir)], capture_output=True, check=True)
+    return remote_dir
+
+
+def _clone(tmp_path, bare_remote, name: str) -> RemoteManager:
+    templates_dir = tmp_path / name
+    templates_dir.mkdir()
+    mgr = ConfigManager(config_path=tmp_path / f"{name}.json")
+    mgr.save(Config())
+    rm = RemoteManager(templates_dir=templates_dir, config_manager=mgr)
+    rm.set_remote(str(bare_remote))
+    return rm
+
+
+def _push_template(rm: RemoteManager, filename: str, trigger: str) -> None:
+    data = {"name": filename, "content": "x", "trigger": trigger}
+    (rm.templates_dir / filename).write_text(json.dumps(data, indent=2))
+    rm.push()
+
+
+def _set_last_pull(rm: RemoteManager, age: timedelta) -> None:
+    config = rm._config_manager.config
+    config.remote.last_pull = (datetime.now() - age).isoformat()
+    rm._config_manager.save(config)
+
+
+# ─── Throttling ──────────────────────────────────────────────────────────────
+
+
+def test_recent_pull_skips_background_fetch(tmp_path, bare_remote):
+    """No fetch is scheduled while last_pull is inside the interval."""
+    rm = _clone(tmp_path, bare_remote, "a")
+    _set_last_pull(rm, timedelta(minutes=1))
+
+    with patch.object(RemoteManager, "_spawn_background_fetch") as spawn:
+        assert rm.auto_pull() is True
+
+    spawn.assert_not_called()
+
+
+def test_stale_pull_starts_detached_fetch_without_waiting(tmp_path, bare_remote):
+    """A stale last_pull starts a detached fetch; the caller never fetches itself."""
+    rm = _clone(tmp_path, bare_remote, "a")
+    _set_last_pull(rm, timedelta(hours=1))
+
+    with (
+        patch("espansr.core.remote.subprocess.Popen") as popen,
+        patch.object(RemoteManager, "_git", wraps=rm._git) as git,
+    ):
+        assert rm.auto_pull() is True
+
+    popen.assert_called_once()
+    assert popen.call_args.args[0][-3:] == ["fetch", "--quiet", "origin"]
+    assert popen.call_args.kwargs.get("start_new_session") or popen.call_args.kwargs.get(
+        "creationflags"
+    )
+    assert not any("fetch" in call.args or "pull" in call.args for call in git.call_args_list)
+    assert (rm.templates_dir / ".git" / _BACKGROUND_FETCH_STAMP).exists()
+
+
+def test_fetch_in_progress_is_not_duplicated(tmp_path, bare_remote):
+    """A recently started background fetch suppresses another one."""
+    rm = _clone(tmp_path, bare_remote, "a")
+    _set_last_pull(rm, timedelta(hours=1))
+    with patch("espansr.core.remote.subprocess.Popen"):
+        rm.auto_pull()
+
+    with patch.object(RemoteManager, "_spawn_background_fetch") as spawn:
+        rm.auto_pull()
+
+    spawn.assert_not_called()
+
+
+def test_interval_is_configurable(tmp_path, bare_remote):
+    """auto_pull_interval_minutes controls how stale last_pull must be."""
+    rm = _clone(tmp_path, bare_remote, "a")
+    config = rm._config_manager.config
+    config.remote.auto_pull_interval_minutes = 120
+    rm._config_manager.save(config)
+    _set_last_pull(rm, timedelta(hours=1))
+
+    with patch.object(RemoteManager, "_spawn_background_fetch") as spawn:
+        rm.auto_pull()
+
+    spawn.assert_not_called()
+
+
+# ─── Applying background fetches ─────────────────────────────────────────────
+
+
+def test_finished_background_fetch_is_applied_locally(tmp_path, bare_remote):
+    """Refs fetched in the background are rebased onto without network access."""
+    rm_a = _clone(tmp_path, bare_remote, "a")
+    _push_template(rm_a, "one.json", ":one")
+    rm_b = _clone(tmp_path, bare_remote, "b")
+    rm_b.pull()
+    _push_template(rm_a, "two.json", ":two")
+
+    # Simulate a background fetch that started a moment ago and has finished.
+    stamp = rm_b.templates_dir / ".git" / _BACKGROUND_FETCH_STAMP
+    stamp.touch()
+    past = time.time() - 5
+    os.utime(stamp, (past, past))
+    subprocess.run(
+        ["git", "-C", str(rm_b.templates_dir), "fetch", "origin"], capture_output=True, check=True
+    )
+    assert not (rm_b.templates_dir / "two.json").exists()
+
+    with (
+        patch.object(RemoteManager, "_spawn_background_fetch") as spawn,
+        patch.object(RemoteManager, "_git", wraps=rm_b._git) as git,
+    ):
+        assert rm_b.auto_pull() is True
+
+    assert (rm_b.templates_dir / "two.json").exists()
+    assert not any("fetch" in call.args or "pull" in call.args for call in git.call_args_list)
+    assert not stamp.exists()
+    spawn.assert_not_called()  # last_pull was just refreshed
+
+
+def test_unfinished_background_fetch_is_not_applied(tmp_path, bare_remote):
+    """A stamp newer than FETCH_HEAD means the fetch has not completed yet."""
+    rm = _clone(tmp_path, bare_remote, "a")
+    _push_template(rm, "one.json", ":one")
+    rm.pull()
+    _set_last_pull(rm, timedelta(minutes=1))
+    (rm.templates_dir / ".git" / _BACKGROUND_FETCH_STAMP).touch()
+    fetch_head = rm.templates_dir / ".git" / "FETCH_HEAD"
+    past = time.time() - 60
+    os.utime(fetch_head, (past, past))
+
+    with patch.object(RemoteManager, "pull_with_result") as pull:
+        rm.auto_pull()
+
+    pull.assert_not_called()
@@ -0,0 +1,143 @@
+"""Tests for the bulk import pipeline (iter_import_templates)."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from espansr.core.template_index import TemplateIndex
+from espansr.core.templates import (
+    TemplateManager,
+    import_template,
+    import_templates,
+    iter_import_templates,
+)
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+
+def _write_json(path: Path, data) -> Path:
+    """Write JSON data and return the path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+# ─── Streaming and ordering ──────────────────────────────────────────────────
+
+
+def test_results_stream_in_input_order(tmp_path):
+    """One ImportResult is yielded per source, in the order given."""
+    src = tmp_path / "src"
+    paths = [
+        _write_json(src / f"t{i:03d}.json", {"name": f"T{i}", "content": "x"}) for i in range(20)
+    ]
+    paths.insert(5, _write_json(src / "bad.json", [1, 2]))
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    results = list(iter_import_templates(paths, mgr, workers=4))
+
+    assert len(results) == 21
+    assert results[5].template is None
+    assert "expected a JSON object" in results[5].error
+    names = [r.template.name for r in results if r.template]
+    assert names == [f"T{i}" for i in range(20)]
+
+
+def test_results_are_yielded_before_the_batch_finishes(tmp_path):
+    """Callers can consume results (e.g. for progress) while import runs."""
+    src = tmp_path / "src"
+    paths = [_write_json(src / f"{i}.json", {"name": f"N{i}", "content": "c"}) for i in range(3)]
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    stream = iter_import_templates(paths, mgr)
+    first = next(stream)
+
+    assert first.template.name == "N0"
+    assert (tmp_path / "templates" / "n0.json").exists()
+    stream.close()
+
+
+# ─── De-duplication ──────────────────────────────────────────────────────────
+
+
+def test_bulk_renames_match_single_import(tmp_path):
+    """Collisions with the store and within the batch get numeric suffixes."""
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+    mgr.create("Greeting", "existing")
+    nested = tmp_path / "templates" / "team"
+    _write_json(nested / "reply.json", {"name": "Reply", "content": "nested"})
+    src = tmp_path / "src"
+    paths = [
+        _write_json(src / "a.json", {"name": "Greeting", "content": "1"}),
+        _write_json(src / "b.json", {"name": "greeting", "content": "2"}),
+        _write_json(src / "c.json", {"name": "Reply", "content": "3"}),
+    ]
+
+    results = list(iter_import_templates(paths, mgr))
+
+    assert [(r.template.name, r.renamed) for r in results] == [
+        ("Greeting (2)", True),
+        ("greeting (3)", True),
+        ("Reply (2)", True),
+    ]
+
+
+def test_bulk_import_does_not_scan_store_per_file(tmp_path):
+    """Names are checked against an in-memory set, not TemplateManager.get."""
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+    src = tmp_path / "src"
+    paths = [_write_json(src / f"{i}.json", {"name": "Same", "content": "c"}) for i in range(5)]
+
+    with patch.object(TemplateManager, "get", side_effect=AssertionError("full scan")):
+        results = list(iter_import_templates(paths, mgr))
+
+    assert [r.template.name for r in results] == [
+        "Same",
+        "Same (2)",
+        "Same (3)",
+        "Same (4)",
+        "Same (5)",
+    ]
+
+
+def test_single_import_sees_bulk_imported_names(tmp_path):
+    """A later single-file import still de-duplicates against bulk results."""
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+    src = tmp_path / "src"
+    list(iter_import_templates([_write_json(src / "a.json", {"name": "X", "content": "1"})], mgr))
+
+    result = import_template(_write_json(src / "b.json", {"name": "X", "content": "2"}), mgr)
+
+    assert result.template.name == "X (2)"
+
+
+# ─── Template index ──────────────────────────────────────────────────────────
+
+
+def test_index_is_saved_once_per_import(tmp_path):
+    """The template index is persisted once for the whole batch."""
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+    src_dir = tmp_path / "src"
+    for i in range(10):
+        _write_json(src_dir / f"{i}.json", {"name": f"N{i}", "content": "c", "trigger": f":n{i}"})
+
+    with patch.object(TemplateIndex, "save", autospec=True, side_effect=TemplateIndex.save) as save:
+        summary = import_templates(src_dir, mgr)
+
+    assert summary.succeeded == 10
+    assert save.call_count == 1
+    index = TemplateIndex(tmp_path / "templates")
+    assert index.entries["n3.json"].trigger == ":n3"
+
+
+def test_index_is_saved_when_iteration_stops_early(tmp_path):
+    """Closing the stream still records the files written so far."""
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+    src = tmp_path / "src"
+    paths = [_write_json(src / f"{i}.json", {"name": f"N{i}", "content": "c"}) for i in range(3)]
+
+    stream = iter_import_templates(paths, mgr)
+    next(stream)
+    stream.close()
+
+    assert set(TemplateIndex(tmp_path / "templates").entries) == {"n0.json"}
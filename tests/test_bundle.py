@@ -0,0 +1,242 @@
+"""Tests for single-file JSONL export/import bundles."""
+
+import argparse
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.bundle import (
+    BundleFormatError,
+    export_bundle,
+    iter_bundle_records,
+    iter_import_bundle,
+)
+from espansr.core.templates import Template, TemplateManager, Variable
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+
+def _snapshot(root: Path) -> dict:
+    """Return {relative_path: bytes} for every file except _meta/ caches."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and "_meta" not in path.relative_to(root).parts
+    }
+
+
+def _populated_store(root: Path) -> TemplateManager:
+    mgr = TemplateManager(templates_dir=root)
+    greeting = Template(
+        name="Greeting",
+        content="Hi {{who}}",
+        trigger=":hi",
+        variables=[Variable(name="who", default="there")],
+    )
+    mgr.save(greeting)
+    mgr.create_version(greeting, note="first")
+    mgr.save_to_folder(Template(name="Review", content="r", trigger=":rev"), "team")
+    # Hand-named file whose name does not match its filename.
+    (root / "team" / "odd-file.json").write_text(
+        json.dumps({"name": "Odd", "content": "o", "extra": 1}, indent=2), encoding="utf-8"
+    )
+    (root / "_versions" / "gone").mkdir(parents=True)
+    (root / "_versions" / "gone" / "backup-1.json").write_text("{ broken", encoding="utf-8")
+    return mgr
+
+
+# ─── Round trip ──────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("bundle_name", ["store.jsonl", "store.jsonl.gz"])
+def test_bundle_round_trips_store_exactly(tmp_path, bundle_name):
+    """Export + import into an empty store reproduces every file byte for byte."""
+    source = tmp_path / "source"
+    _populated_store(source)
+    bundle = tmp_path / bundle_name
+
+    exported = export_bundle(bundle, source, include_history=True)
+    target_mgr = TemplateManager(templates_dir=tmp_path / "target")
+    results = list(iter_import_bundle(bundle, target_mgr))
+
+    assert exported.templates == 3
+    assert exported.versions == 2
+    assert all(r.template is not None for r in results)
+    assert _snapshot(tmp_path / "target") == _snapshot(source)
+
+
+def test_history_is_optional(tmp_path):
+    """Without --history only live templates are written."""
+    source = tmp_path / "source"
+    _populated_store(source)
+    bundle = tmp_path / "store.jsonl"
+
+    export_bundle(bundle, source)
+
+    types = {record["type"] for record in iter_bundle_records(bundle)}
+    assert types == {"template"}
+
+
+def test_reimport_into_same_store_is_a_no_op(tmp_path):
+    """Importing a bundle over identical files neither renames nor duplicates."""
+    source = tmp_path / "source"
+    _populated_store(source)
+    bundle = tmp_path / "store.jsonl"
+    export_bundle(bundle, source, include_history=True)
+    before = _snapshot(source)
+
+    results = list(iter_import_bundle(bundle, TemplateManager(templates_dir=source)))
+
+    assert not any(r.renamed for r in results)
+    assert _snapshot(source) == before
+
+
+def test_conflicting_template_is_renamed(tmp_path):
+    """A different template already at the recorded path gets a suffixed name."""
+    source = tmp_path / "source"
+    TemplateManager(templates_dir=source).create("Greeting", "from bundle")
+    bundle = tmp_path / "store.jsonl"
+    export_bundle(bundle, source)
+    target_mgr = TemplateManager(templates_dir=tmp_path / "target")
+    target_mgr.create("Greeting", "already here")
+
+    results = list(iter_import_bundle(bundle, target_mgr))
+
+    assert [(r.template.name, r.renamed) for r in results] == [("Greeting (2)", True)]
+    assert target_mgr.get("Greeting").content == "already here"
+    assert target_mgr.get("Greeting (2)").content == "from bundle"
+
+
+def test_same_name_in_two_folders_round_trips_unrenamed(tmp_path):
+    """Same-named templates in different folders keep their names and paths."""
+    source = tmp_path / "source"
+    mgr = TemplateManager(templates_dir=source)
+    mgr.save_to_folder(Template(name="Review", content="a", trigger=":ra"), "team")
+    mgr.save_to_folder(Template(name="Review", content="b", trigger=":rb"), "personal")
+    bundle = tmp_path / "store.jsonl"
+    export_bundle(bundle, source)
+
+    target_mgr = TemplateManager(templates_dir=tmp_path / "target")
+    results = list(iter_import_bundle(bundle, target_mgr))
+
+    assert [(r.template.name, r.renamed) for r in results] == [("Review", False)] * 2
+    assert _snapshot(tmp_path / "target") == _snapshot(source)
+
+
+def test_renamed_template_history_follows_the_new_name(tmp_path):
+    """History of a template renamed on import lands under its new slug."""
+    source = tmp_path / "source"
+    source_mgr = TemplateManager(templates_dir=source)
+    greeting = source_mgr.create("Greeting", "from bundle")
+    source_mgr.create_version(greeting, note="bundled")
+    bundle = tmp_path / "store.jsonl"
+    export_bundle(bundle, source, include_history=True)
+    target_mgr = TemplateManager(templates_dir=tmp_path / "target")
+    existing = target_mgr.create("Greeting", "already here")
+    target_mgr.create_version(existing, note="local")
+
+    list(iter_import_bundle(bundle, target_mgr))
+
+    local = target_mgr.list_versions(target_mgr.get("Greeting"))
+    moved = target_mgr.list_versions(target_mgr.get("Greeting (2)"))
+    assert [v.note for v in local] == ["local"]
+    assert [v.note for v in moved] == ["bundled"]
+    assert moved[0].template_data["name"] == "Greeting (2)"
+
+
+# ─── Malformed bundles ───────────────────────────────────────────────────────
+
+
+def test_missing_header_is_rejected(tmp_path):
+    """Files without the bundle header are not read as bundles."""
+    bundle = tmp_path / "x.jsonl"
+    bundle.write_text('{"type": "template"}\n', encoding="utf-8")
+
+    with pytest.raises(BundleFormatError):
+        list(iter_bundle_records(bundle))
+
+    results = list(iter_import_bundle(bundle, TemplateManager(templates_dir=tmp_path / "t")))
+    assert len(results) == 1
+    assert "not an espansr bundle" in results[0].error
+
+
+def test_paths_outside_the_store_are_rejected(tmp_path):
+    """Records cannot write outside the templates directory or into _meta/."""
+    bundle = tmp_path / "evil.jsonl"
+    lines = [
+        {"format": "espansr-bundle", "version": 1},
+        {"type": "template", "path": "../escape.json", "data": {"name": "E", "content": ""}},
+        {"type": "template", "path": "_meta/index.json", "data": {"name": "M", "content": ""}},
+        {"type": "version", "path": "../../v1.json", "data": {}},
+    ]
+    bundle.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+
+    results = list(iter_import_bundle(bundle, TemplateManager(templates_dir=tmp_path / "t")))
+
+    assert [r.template for r in results] == [None, None]
+    assert not (tmp_path / "escape.json").exists()
+    assert not (tmp_path.parent / "v1.json").exists()
+
+
+def test_windows_style_paths_are_rejected(tmp_path):
+    """Backslashes and drive letters, which escape the store on Windows, are refused."""
+    bundle = tmp_path / "evil.jsonl"
+    lines = [
+        {"format": "espansr-bundle", "version": 1},
+        {"type": "template", "path": "..\\..\\evil.json", "data": {"name": "B", "content": ""}},
+        {"type": "template", "path": "C:/x/evil.json", "data": {"name": "D", "content": ""}},
+        {"type": "template", "path": "C:evil.json", "data": {"name": "R", "content": ""}},
+        {"type": "version", "path": "_versions\\..\\..\\v1.json", "data": {}},
+        {"type": "version", "path": "_versions/C:/v1.json", "data": {}},
+    ]
+    bundle.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+    templates_dir = tmp_path / "t"
+
+    results = list(iter_import_bundle(bundle, TemplateManager(templates_dir=templates_dir)))
+
+    assert [r.template for r in results] == [None, None, None]
+    assert all("invalid template path" in r.error for r in results)
+    written = [p for p in templates_dir.rglob("*") if p.is_file() and "_meta" not in p.parts]
+    assert written == []
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+
+def test_cli_export_and_import_bundle(tmp_path, capsys):
+    """`espansr export --bundle` and `espansr import <bundle>` round-trip."""
+    import espansr.core.templates as _tmod
+    from espansr.__main__ import cmd_export, cmd_import
+
+    source = tmp_path / "source"
+    _populated_store(source)
+    bundle = tmp_path / "out.jsonl.gz"
+
+    with patch("espansr.__main__.get_templates_dir", return_value=source):
+        code = cmd_export(argparse.Namespace(bundle=str(bundle), history=False))
+    assert code == 0
+    assert "Exported 3 template(s)" in capsys.readouterr().out
+
+    old_mgr = _tmod._template_manager
+    _tmod._template_manager = None
+    try:
+        with patch("espansr.core.templates.get_templates_dir", return_value=tmp_path / "t"):
+            code = cmd_import(argparse.Namespace(path=str(bundle)))
+    finally:
+        _tmod._template_manager = old_mgr
+
+    assert code == 0
+    assert "Imported 3 template(s), 0 failed." in capsys.readouterr().out
+    assert (tmp_path / "t" / "team" / "odd-file.json").exists()
+
+
+def test_cli_export_rejects_other_suffixes(tmp_path, capsys):
+    """Only .jsonl and .jsonl.gz bundle paths are accepted."""
+    from espansr.__main__ import cmd_export
+
+    code = cmd_export(argparse.Namespace(bundle=str(tmp_path / "out.json"), history=False))
+
+    assert code == 2
+    assert not (tmp_path / "out.json").exists()
@@ -0,0 +1,239 @@
+"""Tests for the bundled starter hash manifest, digest cache, and reconciliation stamp."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from espansr.core import templates as templates_mod
+from espansr.core.templates import (
+    BUNDLED_MANIFEST_FILENAME,
+    build_bundled_template_report,
+    bundled_reconciliation_is_current,
+    load_bundled_manifest,
+    render_bundled_manifest,
+    sync_bundled_templates_to_live,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write JSON with stable formatting for tests."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path* so the digest cache is allowed to trust it."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _setup(tmp_path: Path) -> tuple[Path, Path]:
+    bundled_dir = tmp_path / "bundled"
+    local_dir = tmp_path / "local"
+    _write_json(bundled_dir / "alpha.json", {"name": "Alpha", "content": "A", "trigger": ":alpha"})
+    _write_json(bundled_dir / "beta.json", {"name": "Beta", "content": "B", "trigger": ":beta"})
+    _write_json(local_dir / "alpha.json", {"trigger": ":alpha", "content": "A", "name": "Alpha"})
+    _write_json(local_dir / "beta.json", {"name": "Beta", "content": "mine", "trigger": ":beta"})
+    (bundled_dir / BUNDLED_MANIFEST_FILENAME).write_text(
+        render_bundled_manifest(bundled_dir), encoding="utf-8"
+    )
+    for path in local_dir.glob("*.json"):
+        _age(path)
+    return bundled_dir, local_dir
+
+
+def test_shipped_manifest_matches_bundled_templates():
+    """templates/bundled.sha256 is regenerated whenever a starter changes."""
+    manifest_path = ROOT / "templates" / BUNDLED_MANIFEST_FILENAME
+    assert manifest_path.read_text(encoding="utf-8") == render_bundled_manifest(
+        ROOT / "templates"
+    ), "Bundled manifest is stale. Run: python scripts/build_bundled_manifest.py"
+
+
+def test_manifest_is_not_treated_as_a_template():
+    """The manifest never shows up as a bundled starter."""
+    paths = templates_mod.get_bundled_template_paths(ROOT / "templates")
+    assert BUNDLED_MANIFEST_FILENAME not in paths
+    assert set(load_bundled_manifest(ROOT / "templates")) == set(paths)
+
+
+def test_report_uses_hashes_without_parsing_unchanged_files(tmp_path):
+    """A warm report parses nothing when the manifest and cache are current."""
+    bundled_dir, local_dir = _setup(tmp_path)
+
+    first = build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+    with patch.object(
+        templates_mod, "_load_template_object", wraps=templates_mod._load_template_object
+    ) as load:
+        second = build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    assert load.call_count == 0
+    statuses = {entry.filename: entry.status for entry in second.entries}
+    assert statuses == {"alpha.json": "up_to_date", "beta.json": "changed_local"}
+    assert [(e.filename, e.status) for e in first.entries] == [
+        (e.filename, e.status) for e in second.entries
+    ]
+
+
+def test_edited_local_file_is_reparsed(tmp_path):
+    """Changing a local file's stat key invalidates its cached hash."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    _write_json(local_dir / "beta.json", {"name": "Beta", "content": "B", "trigger": ":beta"})
+    report = build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    statuses = {entry.filename: entry.status for entry in report.entries}
+    assert statuses["beta.json"] == "up_to_date"
+
+
+def test_stale_manifest_entry_falls_back_to_parsing(tmp_path):
+    """A starter edited without regenerating the manifest is still compared correctly."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    _write_json(
+        bundled_dir / "alpha.json", {"name": "Alpha", "content": "new", "trigger": ":alpha"}
+    )
+
+    report = build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    statuses = {entry.filename: entry.status for entry in report.entries}
+    assert statuses["alpha.json"] == "changed_local"
+
+
+def test_cached_invalid_local_keeps_error_detail(tmp_path):
+    """Invalid local JSON is reported with the same detail on warm runs."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    (local_dir / "alpha.json").write_text("{ not json", encoding="utf-8")
+    _age(local_dir / "alpha.json")
+
+    cold = build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+    warm = build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    cold_alpha = next(e for e in cold.entries if e.filename == "alpha.json")
+    warm_alpha = next(e for e in warm.entries if e.filename == "alpha.json")
+    assert cold_alpha.status == warm_alpha.status == "invalid_local"
+    assert "Invalid JSON in alpha.json" in warm_alpha.detail
+    assert cold_alpha.detail == warm_alpha.detail
+
+
+def test_digest_cache_lives_under_meta(tmp_path):
+    """The local hash cache is stored in _meta/ so it is ignored by listing and git."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    cache = json.loads((local_dir / "_meta" / "template_digests.json").read_text())
+    assert set(cache) == {"alpha.json", "beta.json"}
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    """Files inside the timestamp-granularity window are always re-parsed."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    _write_json(local_dir / "gamma.json", {"name": "Gamma", "content": "G"})
+
+    build_bundled_template_report(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    cache = json.loads((local_dir / "_meta" / "template_digests.json").read_text())
+    assert "gamma.json" not in cache
+
+
+# ─── Reconciliation stamp ────────────────────────────────────────────────────
+
+
+def _age_store(local_dir: Path) -> None:
+    for path in local_dir.glob("*.json"):
+        _age(path)
+
+
+def test_clean_sync_records_stamp_and_next_sync_skips_report(tmp_path):
+    """A clean apply records a stamp so the next publish skips the report entirely."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    _, result = sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    assert result.updated == 1
+    _age_store(local_dir)
+
+    # Stamps are recorded only for trusted (not just-written) files; re-record now.
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    assert bundled_reconciliation_is_current(local_dir, bundled_dir)
+
+    with patch.object(templates_mod, "build_bundled_template_report") as build:
+        report, result = sync_bundled_templates_to_live(
+            templates_dir=local_dir, bundled_dir=bundled_dir
+        )
+
+    build.assert_not_called()
+    assert report.entries == []
+    assert result.copied == result.updated == 0
+
+
+def test_stamp_is_invalidated_by_local_edits(tmp_path):
+    """Editing, adding, or removing a top-level template forces a full report."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    _age_store(local_dir)
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    assert bundled_reconciliation_is_current(local_dir, bundled_dir)
+
+    _write_json(local_dir / "beta.json", {"name": "Beta", "content": "edit", "trigger": ":beta"})
+    _age(local_dir / "beta.json", seconds=30)
+
+    assert not bundled_reconciliation_is_current(local_dir, bundled_dir)
+    _, result = sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    assert result.updated == 1
+
+
+def test_stamp_is_invalidated_by_version_and_bundled_changes(tmp_path):
+    """A new espansr version or a changed bundled set forces a full report."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    _age_store(local_dir)
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    assert bundled_reconciliation_is_current(local_dir, bundled_dir)
+
+    with patch("espansr.__version__", "99.0.0"):
+        assert not bundled_reconciliation_is_current(local_dir, bundled_dir)
+
+    _write_json(bundled_dir / "gamma.json", {"name": "Gamma", "content": "G", "trigger": ":g"})
+    (bundled_dir / BUNDLED_MANIFEST_FILENAME).write_text(
+        render_bundled_manifest(bundled_dir), encoding="utf-8"
+    )
+    assert not bundled_reconciliation_is_current(local_dir, bundled_dir)
+
+
+def test_skipped_invalid_local_does_not_record_stamp(tmp_path):
+    """A reconciliation that left invalid local files behind is not stamped."""
+    bundled_dir, local_dir = _setup(tmp_path)
+    (local_dir / "alpha.json").write_text("{ not json", encoding="utf-8")
+    _age_store(local_dir)
+
+    _, result = sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+
+    assert result.skipped_invalid
+    assert not (local_dir / "_meta" / "bundled_stamp.json").exists()
+
+
+def test_starters_check_answers_from_stamp(tmp_path, capsys):
+    """`espansr starters --check` reports in sync from a current stamp without a report."""
+    import argparse
+
+    from espansr.__main__ import cmd_sync_bundled
+
+    bundled_dir, local_dir = _setup(tmp_path)
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    _age_store(local_dir)
+    sync_bundled_templates_to_live(templates_dir=local_dir, bundled_dir=bundled_dir)
+    args = argparse.Namespace(apply=False, check=True, dry_run=False, force=False, verbose=False)
+
+    with (
+        patch("espansr.__main__.get_templates_dir", return_value=local_dir),
+        patch("espansr.__main__._get_bundled_dir", return_value=bundled_dir),
+        patch("espansr.core.templates.build_bundled_template_report") as build,
+    ):
+        exit_code = cmd_sync_bundled(args)
+
+    build.assert_not_called()
+    assert exit_code == 0
+    assert "already in sync" in capsys.readouterr().out.lower()
@@ -226,19 +226,20 @@ def test_commands_popup_dialog_closes_on_escape(qtbot):
 
 
 def test_cmd_gui_commands_view_launches_popup():
-    """cmd_gui routes commands view to the popup launcher."""
+    """cmd_gui starts the GUI on the commands view when no instance is running."""
     from espansr.__main__ import cmd_gui
 
     args = argparse.Namespace(view="commands")
 
     with (
         patch("espansr.__main__._auto_pull_if_configured"),
-        patch("espansr.ui.commands_popup.launch_commands_popup") as mock_popup,
+        patch("espansr.ui.single_instance.send_to_running_instance", return_value=False),
+        patch("espansr.ui.single_instance.run_gui", return_value=0) as mock_run,
     ):
         result = cmd_gui(args)
 
     assert result == 0
-    mock_popup.assert_called_once()
+    mock_run.assert_called_once_with("commands", resident=False)
 
 
 def test_cmd_gui_main_view_launches_editor():
@@ -249,12 +250,13 @@ def test_cmd_gui_main_view_launches_editor():
 
     with (
         patch("espansr.__main__._auto_pull_if_configured"),
-        patch("espansr.ui.main_window.launch") as mock_launch,
+        patch("espansr.ui.single_instance.send_to_running_instance", return_value=False),
+        patch("espansr.ui.single_instance.run_gui", return_value=0) as mock_run,
     ):
         result = cmd_gui(args)
 
     assert result == 0
-    mock_launch.assert_called_once()
+    mock_run.assert_called_once_with("main", resident=False)
 
 
 def test_launch_commands_popup_uses_dialog_exec_when_owning_app():
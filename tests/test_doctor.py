@@ -4,7 +4,10 @@ Covers: cmd_doctor() — diagnostic checks, status indicators, exit codes,
 reuse of existing functions, and argparse registration.
 """
 
+import argparse
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -46,6 +49,8 @@ def _run_doctor(capsys, **overrides):
     """
     from espansr.__main__ import cmd_doctor
 
+    args = overrides.pop("args", None)
+
     # Create real temp dirs so is_dir() calls work
     _tmp = tempfile.mkdtemp()
     _tmp_path = Path(_tmp)
@@ -132,7 +137,7 @@ def _run_doctor(capsys, **overrides):
             return_value=_ManagerStub(),
         ),
     ):
-        exit_code = cmd_doctor(None)
+        exit_code = cmd_doctor(args)
 
     output = capsys.readouterr().out
     return exit_code, output
@@ -405,3 +410,97 @@ def test_doctor_reports_command_availability(capsys):
     # Both lines should appear: the shim status line and the PATH warning.
     assert "[warn] Command availability" in output
     assert "is not on PATH" in output
+
+
+# ─── Check registry ────────────────────────────────────────────────────────
+
+
+def test_checks_run_concurrently_but_report_in_order():
+    """Slow and fast checks overlap, and results keep registration order."""
+    from espansr.core.doctor import DoctorCheck, run_checks
+
+    def sleeper(name):
+        def check(report):
+            time.sleep(0.2)
+            report.ok(name)
+
+        return check
+
+    checks = [DoctorCheck(f"c{i}", sleeper(f"c{i}")) for i in range(4)]
+    checks.insert(0, DoctorCheck("slowest", lambda r: (time.sleep(0.3), r.ok("slowest"))))
+
+    started = time.perf_counter()
+    results = list(run_checks(checks))
+    elapsed = time.perf_counter() - started
+
+    assert [r.name for r in results] == ["slowest", "c0", "c1", "c2", "c3"]
+    assert [r.lines[0].message for r in results] == ["slowest", "c0", "c1", "c2", "c3"]
+    assert elapsed < 0.9  # sequential would take 1.1s
+
+
+def test_check_timeout_fails_required_and_warns_optional():
+    """An overrunning check is abandoned: FAIL when required, warn otherwise."""
+    from espansr.core.doctor import DoctorCheck, run_checks
+
+    release = threading.Event()
+    try:
+        results = list(
+            run_checks(
+                [
+                    DoctorCheck("stuck", lambda r: release.wait(5), timeout=0.1),
+                    DoctorCheck("optional", lambda r: release.wait(5), timeout=0.1, required=False),
+                ]
+            )
+        )
+    finally:
+        release.set()
+
+    assert all(r.timed_out for r in results)
+    assert [line.level for r in results for line in r.lines] == ["fail", "warn"]
+    assert "timed out after 0.1s" in results[0].lines[0].message
+
+
+def test_crashing_check_is_reported_not_raised():
+    """An exception inside a check becomes a FAIL line for that check only."""
+    from espansr.core.doctor import DoctorCheck, run_checks
+
+    def boom(report):
+        report.ok("partial")
+        raise RuntimeError("no access")
+
+    (result,) = run_checks([DoctorCheck("boom", boom)])
+    assert result.failed
+    assert [line.message for line in result.lines] == ["partial", "boom: check crashed: no access"]
+
+
+def test_shared_probe_computes_once_across_threads():
+    """Concurrent checks share one detection instead of probing twice."""
+    from espansr.core.doctor import SharedProbe
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    probe = SharedProbe(compute)
+    threads = [threading.Thread(target=probe) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert probe() == "value"
+    assert len(calls) == 1
+
+
+def test_doctor_timings_lists_every_check(capsys):
+    """--timings prints one wall-time row per check plus a total."""
+    exit_code, output = _run_doctor(capsys, args=argparse.Namespace(timings=True))
+
+    assert exit_code == 0
+    timings = output.split("Timings:", 1)[1]
+    for name in ("python", "espanso-config", "launcher", "validation", "total"):
+        assert name in timings
+    assert " ms" in timings
@@ -302,9 +302,10 @@ def test_sync_restarts_espanso_on_windows_native(tmp_path):
         patch("espansr.integrations.espanso.restart_espanso", return_value=True) as mock_restart,
     ):
         mock_mgr.return_value = TemplateManager(templates_dir=templates_dir)
-        from espansr.integrations.espanso import sync_to_espanso
+        from espansr.integrations import espanso
 
-        result = sync_to_espanso()
+        result = espanso.sync_to_espanso()
+        espanso._last_restart.wait(5)  # the restart runs on a worker thread
 
     assert result is True
     mock_restart.assert_called_once()
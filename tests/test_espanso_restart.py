@@ -0,0 +1,136 @@
+"""Tests for background Espanso restarts with readiness polling and coalescing."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from espansr.integrations import espanso
+
+
+def _blocking_action(release: threading.Event, started: threading.Event, calls: list):
+    """A restart action that blocks until *release* is set."""
+
+    def action() -> bool:
+        calls.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+        return True
+
+    return action
+
+
+# ─── Handle ──────────────────────────────────────────────────────────────────
+
+
+def test_request_returns_before_restart_finishes():
+    """request_restart returns a pending handle while the restart still runs."""
+    release, started, calls = threading.Event(), threading.Event(), []
+    with patch.object(espanso, "espanso_status", return_value=True):
+        handle = espanso.request_restart(_blocking_action(release, started, calls))
+        assert started.wait(5)
+        assert not handle.done()
+
+        release.set()
+        assert handle.wait(5) is True
+
+    assert handle.restarted is True
+    assert calls == ["espanso-restart"]
+
+
+def test_failed_restart_skips_readiness_polling():
+    """A restart command that fails is reported without polling status."""
+    status = MagicMock(return_value=True)
+    with patch.object(espanso, "espanso_status", status):
+        handle = espanso.request_restart(lambda: False)
+        assert handle.wait(5) is None
+
+    assert handle.restarted is False
+    status.assert_not_called()
+
+
+# ─── Readiness ───────────────────────────────────────────────────────────────
+
+
+def test_readiness_is_polled_with_backoff_until_running():
+    """Status is polled until Espanso reports running, with growing delays."""
+    status = MagicMock(side_effect=[False, False, True])
+    with (
+        patch.object(espanso, "espanso_status", status),
+        patch.object(espanso.time, "sleep") as sleep,
+    ):
+        handle = espanso.request_restart(lambda: True, poll_interval=0.1)
+        assert handle.wait(5) is True
+
+    assert status.call_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2]
+
+
+def test_readiness_times_out_as_not_ready():
+    """Espanso that never reports running yields ready=False after the budget."""
+    with patch.object(espanso, "espanso_status", return_value=False):
+        handle = espanso.request_restart(lambda: True, ready_timeout=0.2, poll_interval=0.05)
+        assert handle.wait(5) is False
+
+
+def test_unknown_status_stops_polling():
+    """When status cannot be queried, readiness is unknown and polling stops."""
+    status = MagicMock(return_value=None)
+    with patch.object(espanso, "espanso_status", status):
+        handle = espanso.request_restart(lambda: True)
+        assert handle.wait(5) is None
+
+    status.assert_called_once()
+
+
+# ─── Coalescing ──────────────────────────────────────────────────────────────
+
+
+def test_burst_of_requests_coalesces_into_one_follow_up():
+    """Requests made during a running restart share a single follow-up restart."""
+    release, started, calls = threading.Event(), threading.Event(), []
+    action = _blocking_action(release, started, calls)
+    with patch.object(espanso, "espanso_status", return_value=True):
+        first = espanso.request_restart(action)
+        assert started.wait(5)
+        burst = [espanso.request_restart(action) for _ in range(4)]
+        release.set()
+        assert burst[-1].wait(5) is True
+        assert first.wait(5) is True
+
+    assert all(handle is burst[0] for handle in burst)
+    assert burst[0] is not first
+    assert burst[0].requests == 4
+    assert len(calls) == 2
+
+
+# ─── Publish ─────────────────────────────────────────────────────────────────
+
+
+def test_windows_publish_does_not_wait_for_restart(tmp_path):
+    """sync_to_espanso returns while the Windows restart is still running."""
+    from espansr.core.templates import TemplateManager
+
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "greet.json").write_text(
+        '{"name": "Greet", "content": "Hello!", "trigger": ":greet"}', encoding="utf-8"
+    )
+    match_dir = tmp_path / "match"
+    match_dir.mkdir()
+    release, started, calls = threading.Event(), threading.Event(), []
+
+    with (
+        patch.object(espanso, "get_match_dir", return_value=match_dir),
+        patch.object(espanso, "get_template_manager", return_value=TemplateManager(templates_dir)),
+        patch.object(espanso, "is_wsl2", return_value=False),
+        patch.object(espanso, "is_windows", return_value=True),
+        patch.object(espanso, "restart_espanso", _blocking_action(release, started, calls)),
+        patch.object(espanso, "espanso_status", return_value=True),
+    ):
+        assert espanso.sync_to_espanso() is True
+        handle = espanso._last_restart
+        assert handle is not None and not handle.done()
+
+        release.set()
+        assert handle.wait(5) is True
+
+    assert (match_dir / "espansr.yml").exists()
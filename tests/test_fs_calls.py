@@ -0,0 +1,211 @@
+"""Tests for filesystem call counting and per-command call budgets.
+
+The budget tests run commands against a synthetic store and bound how many
+filesystem calls they make below it. Calls that must scale with the store
+(one read per template) get a per-template allowance; everything else must
+stay constant, so a stray per-template ``stat`` or ``mkdir`` fails the test.
+"""
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core import fs_calls, spans
+from espansr.core.status_record import write_status_record
+from espansr.core.templates import TemplateManager
+
+_TEMPLATES = 60
+
+
+def _make_store(root, count=_TEMPLATES):
+    """Write *count* templates spread over four folders; return the templates dir."""
+    templates_dir = root / "templates"
+    for i in range(count):
+        folder = templates_dir / f"folder{i % 4}"
+        folder.mkdir(parents=True, exist_ok=True)
+        data = {
+            "name": f"Template {i}",
+            "trigger": f":t{i:03d}",
+            "content": f"Hello {{{{name}}}}, this is template {i}.",
+            "variables": [{"name": "name", "label": "Name"}],
+        }
+        (folder / f"template_{i}.json").write_text(json.dumps(data), encoding="utf-8")
+    return templates_dir
+
+
+def _age_store(templates_dir) -> None:
+    """Backdate every template so stat-keyed caches trust it."""
+    past = time.time() - 60
+    for path in templates_dir.rglob("*.json"):
+        os.utime(path, (past, past))
+
+
+def _template_opens(counter, templates_dir) -> int:
+    """File opens below *templates_dir*, not counting its ``_meta`` caches."""
+    return counter.total("open", under=templates_dir) - counter.total(
+        "open", under=templates_dir / "_meta"
+    )
+
+
+def _metadata_calls(counter, root) -> int:
+    """Calls below *root* that are not file opens."""
+    return counter.total(under=root) - counter.total("open", under=root)
+
+
+# ─── Counter ─────────────────────────────────────────────────────────────────
+
+
+def test_counts_operations_by_path(tmp_path):
+    """stat, mkdir, open and scandir below a root are each counted."""
+    with fs_calls.counting() as counter:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "f.txt").write_text("x")
+        (tmp_path / "a" / "f.txt").exists()
+        os.listdir(tmp_path / "a")
+
+    assert counter.by_operation(tmp_path) == {"listdir": 1, "mkdir": 1, "open": 1, "stat": 1}
+    assert counter.total("stat", under=tmp_path / "a") == 1
+    assert fs_calls.get_active() is None
+    assert os.stat is fs_calls._real_stat
+
+
+def test_calls_after_stop_are_not_counted(tmp_path):
+    """Once stopped, the audit hook and stat wrapper stay silent."""
+    with fs_calls.counting() as counter:
+        pass
+    (tmp_path / "late").mkdir()
+
+    assert counter.total(under=tmp_path) == 0
+
+
+def test_prefix_table_groups_paths(tmp_path):
+    """The report groups calls by leading path components."""
+    with fs_calls.counting() as counter:
+        for name in ("x", "y"):
+            (tmp_path / name).mkdir()
+
+    table = counter.format_table(depth=len(tmp_path.parts) - 1)
+    (row,) = [line for line in table.splitlines() if line.startswith(str(tmp_path))]
+    assert "mkdir=2" in row
+
+
+def test_calls_are_attributed_to_the_open_span(tmp_path):
+    """With --profile, each span shows the filesystem calls made inside it."""
+    spans.enable()
+    try:
+        with fs_calls.counting(), spans.span("write") as s:
+            (tmp_path / "f").write_text("x")
+    finally:
+        spans.disable()
+        spans.reset()
+
+    assert s.counts.get("fs.open") == 1
+
+
+# ─── Command budgets ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture()
+def store(tmp_path):
+    templates_dir = _make_store(tmp_path)
+    return tmp_path, templates_dir, TemplateManager(templates_dir)
+
+
+def test_list_call_budget(store, capsys):
+    """list reads each template once and does constant other work."""
+    from espansr.__main__ import cmd_list
+
+    root, _, manager = store
+    with (
+        patch("espansr.core.templates.get_template_manager", return_value=manager),
+        patch("espansr.__main__._auto_pull_if_configured"),
+        fs_calls.counting() as counter,
+    ):
+        assert cmd_list(None) == 0
+
+    assert counter.total("open", under=root) <= _TEMPLATES + 2
+    assert counter.total("mkdir", under=root) == 0
+    assert _metadata_calls(counter, root) <= 20
+
+
+def _publish(root, manager):
+    """Run sync_to_espanso against *manager* into a match dir below *root*."""
+    from espansr.integrations import espanso
+
+    match_dir = root / "espanso" / "match"
+    match_dir.mkdir(parents=True, exist_ok=True)
+    with (
+        patch.object(espanso, "get_match_dir", return_value=match_dir),
+        patch.object(espanso, "get_template_manager", return_value=manager),
+        patch("espansr.integrations.validate.get_template_manager", return_value=manager),
+        patch.object(espanso, "clean_stale_espanso_files"),
+        patch.object(espanso, "_request_publish_restart", return_value=None),
+        fs_calls.counting() as counter,
+    ):
+        assert espanso.sync_to_espanso() is True
+    return counter
+
+
+def test_publish_call_budget(store):
+    """A cold publish reads each template at most twice (validate, render).
+
+    On top of that it reads and writes the index and the validation cache,
+    and writes the Espanso file once.
+    """
+    root, _, manager = store
+    counter = _publish(root, manager)
+
+    assert counter.total("open", under=root) <= 2 * _TEMPLATES + 6
+    assert counter.total("mkdir", under=root) <= 2
+    assert _metadata_calls(counter, root) <= 40
+
+
+def test_warm_publish_reads_templates_only_to_render(store):
+    """With the validation cache warm, publish opens each template once."""
+    root, templates_dir, manager = store
+    _age_store(templates_dir)
+    _publish(root, manager)
+
+    counter = _publish(root, manager)
+
+    assert _template_opens(counter, templates_dir) <= _TEMPLATES
+    assert counter.total("mkdir", under=root) == 0
+
+
+def test_warm_validation_opens_no_templates(store, capsys):
+    """Warm validate_all only stats the store; no template file is opened."""
+    from espansr.integrations.validate import validate_all
+
+    _, templates_dir, manager = store
+    _age_store(templates_dir)
+    with patch("espansr.integrations.validate.get_template_manager", return_value=manager):
+        validate_all()
+        with fs_calls.counting() as counter:
+            assert validate_all() == []
+
+    assert _template_opens(counter, templates_dir) == 0
+    assert counter.total("open", under=templates_dir) <= 2
+    assert counter.total("mkdir", under=templates_dir) == 0
+
+
+def test_status_json_call_budget(store):
+    """A cached status --json answer never walks or opens the templates."""
+    from espansr.integrations.orchestratr import get_status_json
+
+    root, templates_dir, _ = store
+    config_dir = root
+    write_status_record(config_dir, root / "espanso")
+    with (
+        patch("espansr.integrations.orchestratr.get_config_dir", return_value=config_dir),
+        patch("espansr.integrations.orchestratr.get_templates_dir", return_value=templates_dir),
+        patch("espansr.integrations.orchestratr.get_espanso_config_dir") as probe,
+        fs_calls.counting() as counter,
+    ):
+        json.loads(get_status_json())
+
+    probe.assert_not_called()
+    assert counter.total("open", under=templates_dir) == 0
+    assert counter.total(under=root) <= 5
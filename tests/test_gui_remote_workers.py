@@ -0,0 +1,254 @@
+"""Tests for GUI pull/push on worker threads, cancellation, and remote checks."""
+
+import contextlib
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.config import Config
+from espansr.core.remote import RemoteCancelledError, RemotePullOutcome, _run_cancellable
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+def _make_window(qtbot, config, tmp_path):
+    """Create a patched MainWindow. Returns the window instance."""
+    from espansr.ui.main_window import MainWindow
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch("espansr.ui.main_window.get_config", return_value=config))
+        stack.enter_context(patch("espansr.ui.main_window.get_config_manager"))
+        stack.enter_context(patch("espansr.ui.template_browser.get_config"))
+        stack.enter_context(patch("espansr.ui.template_editor.get_config"))
+        stack.enter_context(patch("espansr.ui.template_browser.get_template_manager"))
+        stack.enter_context(
+            patch("espansr.integrations.espanso.get_espanso_config_dir", return_value=tmp_path)
+        )
+        stack.enter_context(
+            patch("espansr.integrations.espanso._get_candidate_paths", return_value=[])
+        )
+        window = MainWindow()
+        qtbot.addWidget(window)
+    return window
+
+
+def _wait_idle(qtbot, window) -> None:
+    qtbot.waitUntil(lambda: window._remote_worker is None, timeout=5000)
+
+
+def _blocking_fetch(started: threading.Event):
+    """A fetch stand-in that runs until its cancel event is set."""
+
+    def fetch(*, cancel=None):
+        started.set()
+        if not cancel.wait(5):
+            raise AssertionError("fetch was never cancelled")
+        raise RemoteCancelledError("Remote operation cancelled")
+
+    return fetch
+
+
+@pytest.fixture()
+def window(qtbot, tmp_path):
+    return _make_window(qtbot, Config(), tmp_path)
+
+
+# ── Pull ─────────────────────────────────────────────────────────────────────
+
+
+def test_pull_runs_off_the_ui_thread(qtbot, window):
+    """Fetch, pull, and publish run on a worker thread, not the UI thread."""
+    threads = []
+    with (
+        patch("espansr.core.remote.RemoteManager") as mock_manager_cls,
+        patch("espansr.integrations.espanso.sync_to_espanso", return_value=True),
+    ):
+        rm = mock_manager_cls.return_value
+        rm.fetch.side_effect = lambda **_: threads.append(threading.current_thread())
+        rm.pull_with_result.return_value = RemotePullOutcome(status="up_to_date")
+
+        window._pull_latest_btn.click()
+        assert not window._pull_latest_btn.isEnabled()
+        assert window._cancel_remote_btn.isVisibleTo(window)
+        _wait_idle(qtbot, window)
+
+    assert threads and threads[0] is not threading.main_thread()
+    rm.pull_with_result.assert_called_once_with(fetch=False)
+    assert window._pull_latest_btn.isEnabled()
+    assert not window._cancel_remote_btn.isVisibleTo(window)
+    assert "already up to date" in window.statusBar().currentMessage().lower()
+
+
+def test_cancel_stops_pull_before_changes_are_applied(qtbot, window):
+    """Cancelling during the fetch leaves the store and Espanso output untouched."""
+    started = threading.Event()
+    with (
+        patch("espansr.core.remote.RemoteManager") as mock_manager_cls,
+        patch("espansr.integrations.espanso.sync_to_espanso") as mock_sync,
+    ):
+        rm = mock_manager_cls.return_value
+        rm.fetch.side_effect = _blocking_fetch(started)
+
+        window._pull_latest_btn.click()
+        assert started.wait(5)
+        window._cancel_remote_btn.click()
+        _wait_idle(qtbot, window)
+
+    rm.pull_with_result.assert_not_called()
+    mock_sync.assert_not_called()
+    assert "cancelled" in window.statusBar().currentMessage().lower()
+
+
+# ── Push ─────────────────────────────────────────────────────────────────────
+
+
+def test_push_button_pushes_on_worker(qtbot, window):
+    """Push commits and pushes through RemoteManager.push with a cancel event."""
+    with patch("espansr.core.remote.RemoteManager") as mock_manager_cls:
+        window._push_btn.click()
+        _wait_idle(qtbot, window)
+
+    kwargs = mock_manager_cls.return_value.push.call_args.kwargs
+    assert isinstance(kwargs["cancel"], threading.Event)
+    assert "pushed" in window.statusBar().currentMessage().lower()
+
+
+# ── Background remote check ──────────────────────────────────────────────────
+
+
+def test_remote_check_flags_updates_without_pulling(qtbot, window):
+    """A background check fetches, shows ahead/behind counts, and never pulls."""
+    with patch("espansr.core.remote.RemoteManager") as mock_manager_cls:
+        rm = mock_manager_cls.return_value
+        rm.ahead_behind.return_value = (1, 3)
+
+        window._check_remote_updates()
+        _wait_idle(qtbot, window)
+
+    rm.fetch.assert_called_once()
+    rm.pull_with_result.assert_not_called()
+    assert window._remote_updates.isVisibleTo(window)
+    assert window._remote_updates.text() == "Remote: 3 new on remote, 1 to push"
+
+
+def test_user_pull_preempts_background_check(qtbot, window):
+    """Clicking Pull Latest during a background check cancels it and then pulls."""
+    started = threading.Event()
+    with (
+        patch("espansr.core.remote.RemoteManager") as mock_manager_cls,
+        patch("espansr.integrations.espanso.sync_to_espanso", return_value=True),
+    ):
+        rm = mock_manager_cls.return_value
+        rm.fetch.side_effect = _blocking_fetch(started)
+        window._check_remote_updates()
+        assert started.wait(5)
+
+        rm.fetch.side_effect = None
+        rm.pull_with_result.return_value = RemotePullOutcome(status="up_to_date")
+        window._pull_latest_btn.click()
+        qtbot.waitUntil(lambda: rm.pull_with_result.called, timeout=5000)
+        _wait_idle(qtbot, window)
+
+    rm.ahead_behind.assert_not_called()
+    assert "already up to date" in window.statusBar().currentMessage().lower()
+
+
+def test_remote_check_timer_follows_config(qtbot, tmp_path):
+    """The periodic check runs only with a remote URL and a positive interval."""
+    config = Config()
+    assert not _make_window(qtbot, config, tmp_path)._remote_check_timer.isActive()
+
+    config.remote.url = "git@example.com:team/prompts.git"
+    config.remote.check_interval_minutes = 10
+    timer = _make_window(qtbot, config, tmp_path)._remote_check_timer
+    assert timer.isActive()
+    assert timer.interval() == 10 * 60 * 1000
+
+
+# ── Cancellable git ──────────────────────────────────────────────────────────
+
+
+def test_cancellable_command_is_killed_when_cancelled():
+    """Setting the cancel event kills a running command promptly."""
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    started = time.monotonic()
+
+    with pytest.raises(RemoteCancelledError):
+        _run_cancellable(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            None,
+            30,
+            cancel,
+            check=False,
+        )
+
+    assert time.monotonic() - started < 5
+
+
+def test_cancellable_command_returns_output_like_run():
+    """Without cancellation the result matches subprocess.run's."""
+    result = _run_cancellable(
+        [sys.executable, "-c", "print('hi')"], None, 30, threading.Event(), check=False
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "hi"
+    with pytest.raises(subprocess.CalledProcessError):
+        _run_cancellable(
+            [sys.executable, "-c", "raise SystemExit(3)"], None, 30, threading.Event(), check=True
+        )
+
+
+def test_ahead_behind_counts_commits_against_fetched_remote(tmp_path):
+    """ahead_behind() compares HEAD with the fetched origin branch."""
+    import json
+
+    from espansr.core.config import ConfigManager
+    from espansr.core.remote import RemoteManager
+
+    remote_dir = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "--bare", str(remote_dir)], capture_output=True, check=True)
+    managers = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        mgr = ConfigManager(config_path=tmp_path / f"{name}.json")
+        mgr.save(Config())
+        rm = RemoteManager(templates_dir=tmp_path / name, config_manager=mgr)
+        rm.set_remote(str(remote_dir))
+        managers.append(rm)
+    rm_a, rm_b = managers
+    (rm_a.templates_dir / "one.json").write_text(json.dumps({"name": "One"}))
+    rm_a.push()
+    rm_b.pull_with_result()
+    (rm_a.templates_dir / "two.json").write_text(json.dumps({"name": "Two"}))
+    rm_a.push()
+
+    rm_b.fetch()
+
+    assert rm_b.ahead_behind() == (0, 1)
+
+
+def test_fetch_and_ahead_behind_require_the_store_to_be_a_repo(tmp_path):
+    """A store nested in another repo is refused, and a missing git is named."""
+    from espansr.core.config import ConfigManager
+    from espansr.core.remote import GitNotFoundError, RemoteError, RemoteManager
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], capture_output=True, check=True)
+    store = tmp_path / "templates"
+    store.mkdir()
+    rm = RemoteManager(templates_dir=store, config_manager=ConfigManager(tmp_path / "c.json"))
+
+    with patch.object(rm, "_git") as git:
+        with pytest.raises(RemoteError, match="not a git repository"):
+            rm.fetch()
+        with pytest.raises(RemoteError, match="not a git repository"):
+            rm.ahead_behind()
+        with patch("espansr.core.remote.shutil.which", return_value=None):
+            with pytest.raises(GitNotFoundError):
+                rm.fetch()
+    git.assert_not_called()
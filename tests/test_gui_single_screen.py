@@ -123,9 +123,10 @@ def test_pull_latest_calls_remote_and_sync(qtbot, tmp_path):
         )
 
         window._pull_latest_btn.click()
+        qtbot.waitUntil(lambda: window._remote_worker is None, timeout=5000)
 
     mock_manager_cls.return_value.pull_with_result.assert_called_once()
-    mock_sync.assert_called_once_with(update_bundled=False)
+    mock_sync.assert_called_once_with(update_bundled=False, changed_paths=["sig.json"])
     assert "pulled latest" in window.statusBar().currentMessage().lower()
 
 
@@ -144,6 +145,7 @@ def test_pull_latest_failure_shows_status_message(qtbot, tmp_path):
         )
 
         window._pull_latest_btn.click()
+        qtbot.waitUntil(lambda: window._remote_worker is None, timeout=5000)
 
     msg = window.statusBar().currentMessage().lower()
     assert "pull latest failed" in msg
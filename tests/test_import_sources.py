@@ -0,0 +1,226 @@
+"""Tests for streaming import of Espanso match YAML files and archives."""
+
+import io
+import json
+import tarfile
+import zipfile
+from pathlib import Path
+
+import yaml
+
+from espansr.core.import_sources import (
+    espanso_match_to_template_data,
+    iter_espanso_matches,
+)
+from espansr.core.templates import (
+    Template,
+    TemplateManager,
+    Variable,
+    import_templates,
+    iter_import_templates,
+)
+from espansr.integrations.espanso import (
+    _build_espanso_var_entry,
+    _convert_to_espanso_placeholders,
+)
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+
+def _espanso_match(template: Template) -> dict:
+    """Build the match entry sync_to_espanso would write for *template*."""
+    entry = {
+        "trigger": template.trigger,
+        "replace": _convert_to_espanso_placeholders(template.content, template.variables),
+    }
+    if template.variables:
+        entry["vars"] = [_build_espanso_var_entry(v) for v in template.variables]
+    return entry
+
+
+def _write_match_file(path: Path, matches: list) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"matches": matches}, sort_keys=False), encoding="utf-8")
+    return path
+
+
+# ─── Match conversion ────────────────────────────────────────────────────────
+
+
+def test_form_placeholders_map_back_to_template_placeholders():
+    """{{var.value}} in Espanso output becomes {{var}} again."""
+    template = Template(
+        name="Review",
+        content="Review {{file}} on {{today}}",
+        trigger=":review",
+        variables=[
+            Variable(name="file", label="File path", default="main.py"),
+            Variable(name="today", type="date", params={"format": "%Y-%m-%d"}),
+        ],
+    )
+
+    data, error = espanso_match_to_template_data(_espanso_match(template))
+
+    assert error == ""
+    assert data["content"] == "Review {{file}} on {{today}}"
+    assert data["trigger"] == ":review"
+    assert data["variables"] == [
+        {"name": "file", "label": "File path", "default": "main.py"},
+        {"name": "today", "type": "date", "params": {"format": "%Y-%m-%d"}},
+    ]
+
+
+def test_label_becomes_name_and_trigger_is_the_fallback():
+    """Matches without a label are named after their trigger."""
+    labelled, _ = espanso_match_to_template_data(
+        {"trigger": ":a", "replace": "x", "label": "Alpha"}
+    )
+    plain, _ = espanso_match_to_template_data({"triggers": [":b", ":bb"], "replace": "y"})
+
+    assert labelled["name"] == "Alpha"
+    assert plain["name"] == ":b"
+    assert plain["trigger"] == ":b"
+
+
+def test_unsupported_matches_report_errors():
+    """Matches a Template cannot represent are rejected with a reason."""
+    cases = [
+        {"regex": ":d(?P<n>\\d+)", "replace": "x"},
+        {"trigger": ":img", "image_path": "/tmp/a.png"},
+        {
+            "trigger": ":sh",
+            "replace": "{{out}}",
+            "vars": [{"name": "out", "type": "shell", "params": {"cmd": "date"}}],
+        },
+    ]
+    for match in cases:
+        data, error = espanso_match_to_template_data(match)
+        assert data is None
+        assert error
+
+
+# ─── Streaming YAML ──────────────────────────────────────────────────────────
+
+
+def test_match_stream_is_read_incrementally():
+    """The first match is available before the whole file has been read."""
+    matches = [{"trigger": f":t{i}", "replace": "x" * 200} for i in range(20000)]
+    text = yaml.safe_dump({"global_vars": [{"name": "g"}], "matches": matches})
+    stream = io.StringIO(text)
+
+    iterator = iter_espanso_matches(stream)
+    first = next(iterator)
+
+    assert first == {"trigger": ":t0", "replace": "x" * 200}
+    assert stream.tell() < len(text) // 10
+    assert sum(1 for _ in iterator) == 19999
+
+
+def test_import_yaml_file_creates_templates(tmp_path):
+    """Each importable match in a match file becomes a saved template."""
+    src = _write_match_file(
+        tmp_path / "match" / "base.yml",
+        [
+            {"trigger": ":hi", "replace": "Hello"},
+            {"trigger": ":sh", "replace": "x", "vars": [{"name": "o", "type": "shell"}]},
+            {"trigger": ":bye", "replace": "Bye", "label": "Farewell"},
+        ],
+    )
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    results = list(iter_import_templates([src], mgr))
+
+    assert [r.template.name if r.template else None for r in results] == [":hi", None, "Farewell"]
+    assert results[1].error.startswith("base.yml: match 2:")
+    assert mgr.get("Farewell").trigger == ":bye"
+
+
+def test_extra_triggers_are_reported_as_a_warning(tmp_path):
+    """A multi-trigger match keeps its first trigger and names the dropped ones."""
+    src = _write_match_file(
+        tmp_path / "base.yml",
+        [{"triggers": [":a", ":b", ":c"], "replace": "x"}, {"trigger": ":d", "replace": "y"}],
+    )
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    first, second = iter_import_templates([src], mgr)
+
+    assert first.template.trigger == ":a"
+    assert first.warning == "base.yml: match 1: kept trigger ':a', dropped ':b', ':c'"
+    assert second.warning is None
+
+
+def test_invalid_yaml_reports_error(tmp_path):
+    """Broken YAML yields an error result instead of raising."""
+    src = tmp_path / "broken.yml"
+    src.write_text("matches:\n  - trigger: ':a'\n    replace: [unclosed\n", encoding="utf-8")
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    results = list(iter_import_templates([src], mgr))
+
+    assert len(results) == 1
+    assert "Invalid YAML in broken.yml" in results[0].error
+
+
+def test_directory_import_includes_yaml_files(tmp_path):
+    """import_templates() reads .yml match files alongside JSON templates."""
+    src_dir = tmp_path / "src"
+    _write_match_file(src_dir / "base.yml", [{"trigger": ":y", "replace": "yaml"}])
+    (src_dir / "j.json").write_text(json.dumps({"name": "J", "content": "j"}), encoding="utf-8")
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    summary = import_templates(src_dir, mgr)
+
+    assert summary.succeeded == 2
+    assert {t.name for t in mgr.list_all()} == {":y", "J"}
+
+
+# ─── Archives ────────────────────────────────────────────────────────────────
+
+
+def test_zip_archive_is_imported_member_by_member(tmp_path):
+    """JSON and YAML members are imported; metadata and other files are skipped."""
+    archive_path = tmp_path / "pack.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("pack/one.json", json.dumps({"name": "One", "content": "1"}))
+        archive.writestr(
+            "pack/match/base.yml", yaml.safe_dump({"matches": [{"trigger": ":z", "replace": "z"}]})
+        )
+        archive.writestr("pack/_versions/one/v1.json", json.dumps({"version": 1}))
+        archive.writestr("pack/README.md", "docs")
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    results = list(iter_import_templates([archive_path], mgr))
+
+    assert [r.template.name for r in results] == ["One", ":z"]
+    assert not list((tmp_path).glob("pack"))
+
+
+def test_tar_gz_archive_is_imported(tmp_path):
+    """A .tar.gz archive is streamed without extracting to disk."""
+    archive_path = tmp_path / "pack.tar.gz"
+    payload = json.dumps({"content": "from tar"}).encode()
+    bad = b"{ nope"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        for name, data in (("my_tpl.json", payload), ("bad.json", bad)):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    results = list(iter_import_templates([archive_path], mgr))
+
+    assert results[0].template.name == "my tpl"
+    assert "Invalid JSON in pack.tar.gz:bad.json" in results[1].error
+
+
+def test_corrupt_archive_reports_error(tmp_path):
+    """An unreadable archive yields a single error result."""
+    archive_path = tmp_path / "broken.zip"
+    archive_path.write_bytes(b"not a zip")
+    mgr = TemplateManager(templates_dir=tmp_path / "templates")
+
+    results = list(iter_import_templates([archive_path], mgr))
+
+    assert len(results) == 1
+    assert results[0].error.startswith("Cannot read broken.zip")
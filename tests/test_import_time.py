@@ -0,0 +1,115 @@
+"""Cold-start regression tests for the CLI entry point.
+
+Each command runs in a fresh interpreter under ``python -X importtime``. The
+tests check which modules get imported and that the total import time after
+interpreter startup stays within a budget. The budgets leave several times
+the headroom measured on a developer laptop, so they catch a heavy import
+creeping back in without flaking on slow CI machines.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Total import time (ms) allowed after ``site`` for each command.
+_BUDGET_MS = {
+    "--version": 150,
+    "list": 300,
+    "status": 350,
+    "status --json": 250,
+}
+
+# Modules (and their submodules) each command must not import at all.
+_GUI = {"PyQt6", "espansr.ui"}
+_FORBIDDEN = {
+    "--version": _GUI
+    | {"yaml", "espansr.integrations", "espansr.core.templates", "espansr.core.remote"},
+    "list": _GUI | {"yaml", "espansr.integrations"},
+    "status": _GUI | {"espansr.core.remote"},
+    # Answered from the status record: no Espanso probe, no YAML.
+    "status --json": _GUI
+    | {"yaml", "espansr.integrations.espanso", "espansr.core.templates", "espansr.core.remote"},
+}
+
+
+def _import_profile(command: str, home) -> dict[str, int]:
+    """Run ``espansr <command>`` and return ``{module: cumulative µs}`` after ``site``.
+
+    Only top-level entries count toward the total, so nested imports are not
+    double counted; every module name is still recorded.
+    """
+    env = {**os.environ, "HOME": str(home), "USERPROFILE": str(home), "NO_COLOR": "1"}
+    env.pop("XDG_CONFIG_HOME", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "espansr", *command.split()],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    modules: dict[str, int] = {}
+    total = 0
+    after_site = False
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        if name.strip() == "site" and not name.startswith("  "):
+            after_site = True
+            continue
+        if not after_site:
+            continue
+        modules[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    modules["<total>"] = total
+    return modules
+
+
+@pytest.fixture(scope="module")
+def profiles(tmp_path_factory):
+    """Import profiles per command; the best of three runs after a warm-up."""
+    home = tmp_path_factory.mktemp("home")
+    config_dir = home / ".config" / "espansr"
+    config_dir.mkdir(parents=True)
+    (config_dir / "status.json").write_text(
+        json.dumps({"espanso_config_dir": str(home / "espanso")}),
+        encoding="utf-8",
+    )
+    result = {}
+    for command in _BUDGET_MS:
+        _import_profile(command, home)  # warm bytecode caches
+        runs = [_import_profile(command, home) for _ in range(3)]
+        result[command] = min(runs, key=lambda r: r["<total>"])
+    return result
+
+
+@pytest.mark.parametrize("command", list(_BUDGET_MS))
+def test_command_avoids_heavy_imports(profiles, command):
+    """Commands import only what they use; --version loads no integrations."""
+    loaded = set(profiles[command])
+    unexpected = {
+        name
+        for name in loaded
+        for banned in _FORBIDDEN[command]
+        if name == banned or name.startswith(banned + ".")
+    }
+    assert not unexpected, f"'espansr {command}' imported {sorted(unexpected)}"
+
+
+@pytest.mark.parametrize("command", list(_BUDGET_MS))
+def test_command_import_time_within_budget(profiles, command):
+    """Total import time after interpreter startup stays within the budget."""
+    total_ms = profiles[command]["<total>"] / 1000
+    assert total_ms <= _BUDGET_MS[command], (
+        f"'espansr {command}' spent {total_ms:.0f}ms importing modules "
+        f"(budget {_BUDGET_MS[command]}ms)"
+    )
@@ -0,0 +1,184 @@
+"""Tests for incremental Espanso publishing driven by a pull's changed files."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.templates import TemplateManager
+from espansr.integrations import espanso
+from espansr.integrations import publish_cache as publish_cache_mod
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path* so the publish cache is allowed to trust it."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A small aged template store plus an Espanso match directory."""
+    templates_dir = tmp_path / "templates"
+    _write_json(templates_dir / "greet.json", {"name": "Greet", "content": "Hi", "trigger": ":hi"})
+    _write_json(
+        templates_dir / "team" / "sig.json",
+        {
+            "name": "Signature",
+            "content": "Regards, {{who}}",
+            "trigger": ":sig",
+            "variables": [{"name": "who", "label": "Who"}],
+        },
+    )
+    _write_json(templates_dir / "notes.json", {"name": "Notes", "content": "no trigger"})
+    for path in templates_dir.rglob("*.json"):
+        _age(path)
+    match_dir = tmp_path / "match"
+    match_dir.mkdir()
+    return templates_dir, match_dir
+
+
+def _sync(templates_dir: Path, match_dir: Path, **kwargs) -> bool:
+    with (
+        patch("espansr.integrations.espanso.get_match_dir", return_value=match_dir),
+        patch("espansr.integrations.espanso.clean_stale_espanso_files"),
+        patch(
+            "espansr.integrations.espanso.get_template_manager",
+            return_value=TemplateManager(templates_dir=templates_dir),
+        ),
+        patch("espansr.integrations.espanso.is_wsl2", return_value=False),
+        patch("espansr.integrations.espanso.is_windows", return_value=True),
+    ):
+        return espanso.sync_to_espanso(**kwargs)
+
+
+# ─── Output parity ───────────────────────────────────────────────────────────
+
+
+def test_incremental_output_matches_full_publish(store, tmp_path):
+    """An incremental publish writes byte-identical YAML to a full publish."""
+    templates_dir, match_dir = store
+    assert _sync(templates_dir, match_dir)
+    full = (match_dir / "espansr.yml").read_text(encoding="utf-8")
+
+    (match_dir / "espansr.yml").unlink()
+    assert _sync(templates_dir, match_dir, changed_paths=[])
+
+    assert (match_dir / "espansr.yml").read_text(encoding="utf-8") == full
+
+
+# ─── Skipping unchanged output ───────────────────────────────────────────────
+
+
+def test_unchanged_pull_skips_parse_write_and_restart(store):
+    """A warm incremental publish with nothing changed parses, writes, and restarts nothing."""
+    templates_dir, match_dir = store
+    _sync(templates_dir, match_dir, changed_paths=[])
+    output = match_dir / "espansr.yml"
+    _age(output)
+    before = output.stat().st_mtime_ns
+
+    with (
+        patch.object(
+            publish_cache_mod, "_load_template", wraps=publish_cache_mod._load_template
+        ) as load,
+        patch("espansr.integrations.espanso.restart_espanso") as restart,
+    ):
+        assert _sync(templates_dir, match_dir, changed_paths=[".gitignore"])
+
+    load.assert_not_called()
+    restart.assert_not_called()
+    assert output.stat().st_mtime_ns == before
+    assert espanso.last_sync_unchanged() is True
+    assert espanso._last_sync_count == 2
+
+
+def test_changed_path_is_reparsed_even_with_identical_stat(store):
+    """Paths a pull reports are re-rendered even when size and mtime look unchanged."""
+    templates_dir, match_dir = store
+    _sync(templates_dir, match_dir, changed_paths=[])
+
+    greet = templates_dir / "greet.json"
+    st = greet.stat()
+    _write_json(greet, {"name": "Greet", "content": "Yo", "trigger": ":hi"})
+    os.utime(greet, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    with patch("espansr.integrations.espanso.restart_espanso", return_value=True) as restart:
+        assert _sync(templates_dir, match_dir, changed_paths=["greet.json"])
+        espanso._last_restart.wait(5)  # the restart runs on a worker thread
+
+    restart.assert_called_once()
+    assert espanso.last_sync_unchanged() is False
+    assert "replace: Yo" in (match_dir / "espansr.yml").read_text(encoding="utf-8")
+
+
+def test_validation_issues_come_from_the_validation_cache(store):
+    """The publish cache holds only matches; issues are shared with ``validate``."""
+    from espansr.integrations.validation_cache import ValidationCache
+
+    templates_dir, match_dir = store
+    _write_json(templates_dir / "todo.json", {"name": "Todo", "content": "{{x}}", "trigger": ":td"})
+    _age(templates_dir / "todo.json")
+    _sync(templates_dir, match_dir, changed_paths=[])
+
+    raw = json.loads((templates_dir / "_meta" / "publish_cache.json").read_text("utf-8"))
+    assert {key for entry in raw["entries"].values() for key in entry} == {"stat", "match"}
+    validation = ValidationCache(templates_dir)
+    stat = (templates_dir / "todo.json").stat()
+    digest = validation.digest_for("todo.json", (stat.st_mtime_ns, stat.st_size))
+    assert [check for _, _, check in validation.results(digest)] == ["undefined-placeholder"]
+
+    with patch.object(publish_cache_mod, "validate_template") as validate:
+        incremental = publish_cache_mod.build_incremental_publish(
+            templates_dir, [], espanso._render_match_entry
+        )
+
+    validate.assert_not_called()
+    assert [(w.template_name, w.check) for w in incremental.warnings] == [
+        ("Todo", "undefined-placeholder")
+    ]
+
+
+# ─── Cross-template checks ───────────────────────────────────────────────────
+
+
+def test_duplicate_trigger_against_cached_templates_blocks_publish(store, capsys):
+    """A pulled template that reuses a cached template's trigger aborts the publish."""
+    templates_dir, match_dir = store
+    _sync(templates_dir, match_dir, changed_paths=[])
+
+    _write_json(templates_dir / "hello.json", {"name": "Hello", "content": "x", "trigger": ":hi"})
+    assert not _sync(templates_dir, match_dir, changed_paths=["hello.json"])
+
+    out = capsys.readouterr().out
+    assert "Duplicate trigger ':hi'" in out
+    assert "Sync aborted" in out
+
+
+def test_changed_paths_may_be_a_generator(store):
+    """Any iterable of changed paths is accepted, not just sized collections."""
+    templates_dir, match_dir = store
+    _sync(templates_dir, match_dir, changed_paths=[])
+
+    assert _sync(templates_dir, match_dir, changed_paths=(p for p in ["greet.json"]))
+
+
+def test_deleted_template_is_dropped_from_output(store):
+    """A template removed by a pull disappears from the rewritten output."""
+    templates_dir, match_dir = store
+    _sync(templates_dir, match_dir, changed_paths=[])
+
+    (templates_dir / "team" / "sig.json").unlink()
+    assert _sync(templates_dir, match_dir, changed_paths=["team/sig.json"])
+
+    text = (match_dir / "espansr.yml").read_text(encoding="utf-8")
+    assert ":sig" not in text
+    assert ":hi" in text
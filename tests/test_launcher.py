@@ -54,7 +54,7 @@ def test_generate_launcher_creates_valid_yaml(tmp_path):
     assert len(match["vars"]) == 1
     assert match["vars"][0]["name"] == "output"
     assert match["vars"][0]["type"] == "shell"
-    assert "espansr gui" in match["vars"][0]["params"]["cmd"]
+    assert "espansr gui --resident" in match["vars"][0]["params"]["cmd"]
     assert " >/dev/null 2>&1 &" in match["vars"][0]["params"]["cmd"]
 
 
@@ -91,7 +91,7 @@ def test_generate_commands_popup_creates_valid_yaml(tmp_path):
     match = data["matches"][0]
     assert match["trigger"] == ":coms"
     assert match["replace"] == "{{output}}"
-    assert "espansr gui --view commands" in match["vars"][0]["params"]["cmd"]
+    assert "espansr gui --view commands --resident" in match["vars"][0]["params"]["cmd"]
 
 
 def test_generate_launcher_uses_config_trigger(tmp_path):
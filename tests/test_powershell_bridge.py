@@ -0,0 +1,164 @@
+"""Tests for the resident PowerShell bridge and its Espanso callers on WSL2."""
+
+import sys
+import textwrap
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from espansr.integrations import espanso
+from espansr.integrations.powershell_bridge import BridgeError, BridgeResult, PowerShellBridge
+
+# A stand-in for powershell.exe that speaks the bridge's line protocol.
+# Scripts: "fail" exits 1, "crash" kills the process, "sleep N" stalls, and
+# anything else echoes back with the process id.
+_STAND_IN = textwrap.dedent(
+    """
+    import base64, json, os, sys, time
+
+    for line in sys.stdin:
+        request_id, payload = line.rstrip("\\n").split("\\t", 1)
+        script = base64.b64decode(payload).decode("utf-8")
+        if script == "crash":
+            sys.exit(3)
+        if script.startswith("sleep "):
+            time.sleep(float(script.split()[1]))
+        code = 1 if script == "fail" else 0
+        output = f"{os.getpid()}:{script}"
+        print(json.dumps({"id": int(request_id), "exit": code, "output": output}), flush=True)
+    """
+)
+
+
+@pytest.fixture()
+def stand_in(tmp_path):
+    """argv for the stand-in bridge process."""
+    script = tmp_path / "stand_in.py"
+    script.write_text(_STAND_IN, encoding="utf-8")
+    return [sys.executable, str(script)]
+
+
+@pytest.fixture()
+def bridge(stand_in):
+    bridge = PowerShellBridge(stand_in, idle_timeout=30)
+    yield bridge
+    bridge.close()
+
+
+# ─── Line protocol ───────────────────────────────────────────────────────────
+
+
+def test_commands_share_one_resident_process(bridge):
+    """Several commands run in the same process; it is started only once."""
+    first = bridge.run("espanso status")
+    second = bridge.run("Write-Output 'multi\nline' \"quoted\"")
+
+    assert first.ok and second.ok
+    pid = first.output.split(":", 1)[0]
+    assert second.output == f"{pid}:Write-Output 'multi\nline' \"quoted\""
+    assert bridge.starts == 1
+    assert bridge.running
+
+
+def test_nonzero_exit_is_reported_in_result(bridge):
+    """A failing script yields ok=False without breaking the bridge."""
+    assert bridge.run("fail").exit_code == 1
+    assert bridge.run("again").ok
+    assert bridge.starts == 1
+
+
+# ─── Lifecycle ───────────────────────────────────────────────────────────────
+
+
+def test_idle_timeout_closes_and_next_run_restarts(stand_in):
+    """The process exits after the idle timeout and restarts on demand."""
+    bridge = PowerShellBridge(stand_in, idle_timeout=0.2)
+    try:
+        bridge.run("one")
+        deadline = time.monotonic() + 5
+        while bridge.running and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not bridge.running
+
+        assert bridge.run("two").ok
+        assert bridge.starts == 2
+    finally:
+        bridge.close()
+
+
+def test_timeout_discards_process_and_recovers(bridge):
+    """A command that does not answer in time raises and the next call starts fresh."""
+    with pytest.raises(BridgeError, match="did not answer"):
+        bridge.run("sleep 5", timeout=0.3)
+    assert not bridge.running
+
+    assert bridge.run("after").ok
+    assert bridge.starts == 2
+
+
+def test_crashed_process_raises_and_recovers(bridge):
+    """An unexpected exit surfaces as BridgeError, then the bridge restarts."""
+    with pytest.raises(BridgeError, match="exited"):
+        bridge.run("crash")
+    assert bridge.run("after").ok
+    assert bridge.starts == 2
+
+
+def test_missing_executable_raises_bridge_error(tmp_path):
+    """A bridge whose command cannot be started raises BridgeError."""
+    bridge = PowerShellBridge([str(tmp_path / "no-such-powershell.exe")])
+    with pytest.raises(BridgeError, match="Could not start"):
+        bridge.run("espanso status")
+
+
+# ─── Espanso on WSL2 ─────────────────────────────────────────────────────────
+
+
+def _fake_bridge(*results):
+    fake = MagicMock()
+    fake.run.side_effect = list(results)
+    return fake
+
+
+def test_wsl2_restart_sends_stop_and_start_through_bridge(capsys):
+    """The WSL2 restart reuses the bridge for both steps instead of new shells."""
+    fake = _fake_bridge(BridgeResult(0), BridgeResult(0))
+    with (
+        patch("espansr.integrations.powershell_bridge.get_powershell_bridge", return_value=fake),
+        patch("subprocess.run") as run,
+    ):
+        espanso._restart_espanso_wsl2()
+
+    scripts = [c.args[0] for c in fake.run.call_args_list]
+    assert scripts[0].endswith("espanso service stop")
+    assert "Start-Process espanso" in scripts[1]
+    assert all(s.startswith("Set-Location C:/;") for s in scripts)
+    run.assert_not_called()
+    assert "restarted successfully" in capsys.readouterr().out
+
+
+def test_wsl2_status_and_config_probes_use_bridge():
+    """espanso_status and the config probe parse the bridge's output."""
+    fake = _fake_bridge(
+        BridgeResult(0, output="espanso is running\r\n"),
+        BridgeResult(0, output="C:\\Users\\me\\AppData\\Roaming\\espanso\r\n"),
+    )
+    with (
+        patch("espansr.integrations.powershell_bridge.get_powershell_bridge", return_value=fake),
+        patch("espansr.integrations.espanso.is_wsl2", return_value=True),
+    ):
+        assert espanso.espanso_status() is True
+        assert (
+            espanso.get_windows_espanso_config_path() == "C:\\Users\\me\\AppData\\Roaming\\espanso"
+        )
+
+
+def test_wsl2_status_is_unknown_when_bridge_fails():
+    """A bridge failure maps to an unknown status rather than an exception."""
+    fake = _fake_bridge(BridgeError("PowerShell did not answer within 5s"))
+    with (
+        patch("espansr.integrations.powershell_bridge.get_powershell_bridge", return_value=fake),
+        patch("espansr.integrations.espanso.is_wsl2", return_value=True),
+    ):
+        assert espanso.espanso_status() is None
@@ -77,6 +77,47 @@ def test_infer_repo_dir_points_at_repository_root():
     assert (repo / "install.ps1").exists()
 
 
+def _fingerprint_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "espansr" / "core").mkdir(parents=True)
+    (repo / "pyproject.toml").write_text("[project]\nname = 'espansr'\n", encoding="utf-8")
+    (repo / "install.sh").write_text("#!/bin/bash\n", encoding="utf-8")
+    (repo / "espansr" / "__init__.py").write_text("", encoding="utf-8")
+    (repo / "espansr" / "core" / "a.py").write_text("x = 1\n", encoding="utf-8")
+    return repo
+
+
+def test_fingerprint_tracks_install_inputs_and_package_file_list(tmp_path):
+    repo = _fingerprint_repo(tmp_path)
+    base = install_meta.compute_install_fingerprint(repo)
+
+    # Editing an existing module or writing bytecode is not install-relevant.
+    (repo / "espansr" / "core" / "a.py").write_text("x = 2\n", encoding="utf-8")
+    (repo / "espansr" / "core" / "__pycache__").mkdir()
+    (repo / "espansr" / "core" / "__pycache__" / "a.cpython-312.pyc").write_bytes(b"\0")
+    assert install_meta.compute_install_fingerprint(repo) == base
+
+    (repo / "espansr" / "core" / "b.py").write_text("", encoding="utf-8")
+    added = install_meta.compute_install_fingerprint(repo)
+    assert added != base
+
+    (repo / "pyproject.toml").write_text("[project]\nname = 'other'\n", encoding="utf-8")
+    assert install_meta.compute_install_fingerprint(repo) != added
+
+
+def test_install_inputs_unchanged_compares_recorded_fingerprint(tmp_path):
+    repo = _fingerprint_repo(tmp_path)
+    with _patch_config_dir(tmp_path):
+        assert install_meta.install_inputs_unchanged(repo) is False  # nothing recorded
+
+        meta = install_meta.record_install_meta(repo, installer="install.sh", platform="linux")
+        assert meta.fingerprint == install_meta.compute_install_fingerprint(repo)
+        assert install_meta.install_inputs_unchanged(repo) is True
+
+        (repo / "install.ps1").write_text("# new installer\n", encoding="utf-8")
+        assert install_meta.install_inputs_unchanged(repo) is False
+
+
 # ─── record-install command ──────────────────────────────────────────────────
 
 
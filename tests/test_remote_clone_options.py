@@ -0,0 +1,138 @@
+"""Tests for partial-clone, shallow, and sparse-checkout remote options."""
+
+import json
+import subprocess
+
+import pytest
+
+from espansr.core.config import Config, ConfigManager
+from espansr.core.remote import RemoteManager, _in_sparse_cone
+
+# ─── Fixtures ────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture()
+def remote_url(tmp_path):
+    """A bare remote that serves filtered fetches, seeded with three commits."""
+    remote_dir = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "--bare", str(remote_dir)], capture_output=True, check=True)
+    subprocess.run(
+        ["git", "-C", str(remote_dir), "config", "uploadpack.allowFilter", "true"],
+        capture_output=True,
+        check=True,
+    )
+    url = remote_dir.as_uri()
+
+    writer = _manager(tmp_path, "writer")
+    writer.set_remote(url)
+    for rel, trigger in [("top.json", ":top"), ("team/a.json", ":a"), ("other/b.json", ":b")]:
+        path = writer.templates_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"name": rel, "content": "x", "trigger": trigger}))
+        writer.push()
+    return url
+
+
+def _manager(tmp_path, name: str) -> RemoteManager:
+    templates_dir = tmp_path / name
+    templates_dir.mkdir()
+    mgr = ConfigManager(config_path=tmp_path / f"{name}.json")
+    mgr.save(Config())
+    return RemoteManager(templates_dir=templates_dir, config_manager=mgr)
+
+
+def _git(rm: RemoteManager, *args: str) -> str:
+    return rm._git(*args).stdout.strip()
+
+
+# ─── Setup and persistence ───────────────────────────────────────────────────
+
+
+def test_options_are_persisted_in_remote_config(tmp_path, remote_url):
+    """Clone options survive a config reload and appear in remote status."""
+    rm = _manager(tmp_path, "reader")
+    rm.set_remote(remote_url, partial_clone=True, depth=1, sparse_paths=["team/"])
+
+    reloaded = ConfigManager(config_path=tmp_path / "reader.json").config.remote
+    assert reloaded.partial_clone is True
+    assert reloaded.depth == 1
+    assert reloaded.sparse_paths == ["team"]
+    assert _git(rm, "config", "remote.origin.partialclonefilter") == "blob:none"
+
+    status = rm.status()
+    assert status["sparse_paths"] == ["team"]
+    assert status["depth"] == 1
+
+
+def test_remove_remote_clears_clone_options(tmp_path, remote_url):
+    """Disconnecting drops the clone options with the rest of the remote config."""
+    rm = _manager(tmp_path, "reader")
+    rm.set_remote(remote_url, partial_clone=True, depth=2, sparse_paths=["team"])
+
+    rm.remove_remote()
+
+    remote = rm._config_manager.config.remote
+    assert (remote.partial_clone, remote.depth, remote.sparse_paths) == (False, 0, [])
+
+
+# ─── Pull ────────────────────────────────────────────────────────────────────
+
+
+def test_pull_checks_out_only_subscribed_folders(tmp_path, remote_url):
+    """A sparse, shallow, partial pull materializes only the subscribed folders."""
+    rm = _manager(tmp_path, "reader")
+    rm.set_remote(remote_url, partial_clone=True, depth=1, sparse_paths=["team"])
+
+    outcome = rm.pull_with_result()
+
+    assert (rm.templates_dir / "top.json").exists()
+    assert (rm.templates_dir / "team" / "a.json").exists()
+    assert not (rm.templates_dir / "other").exists()
+    assert "other/b.json" not in outcome.changed_files
+    assert _git(rm, "rev-parse", "--is-shallow-repository") == "true"
+    missing = _git(rm, "rev-list", "--objects", "--missing=print", "--all")
+    assert any(line.startswith("?") for line in missing.splitlines())
+
+
+def test_pull_reports_changes_outside_sparse_folders_as_unchanged(tmp_path, remote_url):
+    """Commits touching only unsubscribed folders do not report changed files."""
+    reader = _manager(tmp_path, "reader")
+    reader.set_remote(remote_url, sparse_paths=["team"])
+    reader.pull_with_result()
+
+    writer = _manager(tmp_path, "writer2")
+    writer.set_remote(remote_url)
+    writer.pull_with_result()
+    (writer.templates_dir / "other" / "c.json").write_text(json.dumps({"name": "c"}))
+    writer.push()
+
+    outcome = reader.pull_with_result()
+
+    assert outcome.status == "up_to_date"
+    assert outcome.changed_files == []
+
+
+# ─── Push ────────────────────────────────────────────────────────────────────
+
+
+def test_push_templates_skips_files_outside_sparse_folders(tmp_path, remote_url):
+    """push_templates stages only paths inside the sparse checkout."""
+    rm = _manager(tmp_path, "reader")
+    rm.set_remote(remote_url, sparse_paths=["team"])
+    rm.pull_with_result()
+    (rm.templates_dir / "team" / "a.json").write_text(json.dumps({"name": "edited"}))
+
+    assert rm.push_templates(["team/a.json", "other/b.json"]) is True
+
+    assert _git(rm, "log", "-1", "--name-only", "--format=") == "team/a.json"
+
+
+def test_sparse_cone_matches_git_cone_mode():
+    """Root files, ancestor-level files, and files below a folder are in the cone."""
+    folders = ["team/sales"]
+    assert _in_sparse_cone("top.json", folders)
+    assert _in_sparse_cone("team/readme.json", folders)
+    assert _in_sparse_cone("team/sales/deal.json", folders)
+    assert not _in_sparse_cone("team/eng/build.json", folders)
+    assert not _in_sparse_cone("other/b.json", folders)
+    assert _in_sparse_cone("other/b.json", [])
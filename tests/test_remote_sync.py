@@ -252,6 +252,60 @@ class TestPullOutcome:
         assert outcome.changed_files == []
 
 
+class TestPullRoundTrips:
+    """pull_with_result() keeps git process spawns to a minimum."""
+
+    def _clones(self, tmp_path, bare_remote):
+        from espansr.core.config import Config, ConfigManager
+        from espansr.core.remote import RemoteManager
+
+        managers = []
+        for name in ("clone_a", "clone_b"):
+            templates_dir = tmp_path / name
+            templates_dir.mkdir()
+            mgr = ConfigManager(config_path=tmp_path / f"{name}.json")
+            mgr.save(Config())
+            rm = RemoteManager(templates_dir=templates_dir, config_manager=mgr)
+            rm.set_remote(str(bare_remote))
+            managers.append(rm)
+        rm_a, rm_b = managers
+        (rm_a.templates_dir / "sig.json").write_text(json.dumps({"name": "Sig", "content": "1"}))
+        rm_a.push()
+        rm_b.pull_with_result()
+        return rm_a, rm_b
+
+    def _git_calls(self, rm):
+        from espansr.core.remote import RemoteManager
+
+        with patch.object(
+            RemoteManager, "_git", autospec=True, side_effect=RemoteManager._git
+        ) as git:
+            outcome = rm.pull_with_result()
+        return outcome, [call.args[1] for call in git.call_args_list]
+
+    def test_up_to_date_pull_uses_fetch_and_one_ref_lookup(self, tmp_path, bare_remote):
+        """An up-to-date pull runs only fetch and for-each-ref."""
+        _, rm_b = self._clones(tmp_path, bare_remote)
+
+        outcome, commands = self._git_calls(rm_b)
+
+        assert outcome.status == "up_to_date"
+        assert commands == ["fetch", "for-each-ref"]
+
+    def test_changed_pull_rebases_without_second_fetch(self, tmp_path, bare_remote):
+        """A changed pull rebases onto the fetched ref and diffs once."""
+        rm_a, rm_b = self._clones(tmp_path, bare_remote)
+        (rm_a.templates_dir / "sig.json").write_text(json.dumps({"name": "Sig", "content": "2"}))
+        rm_a.push()
+
+        outcome, commands = self._git_calls(rm_b)
+
+        assert outcome.status == "changed"
+        assert outcome.changed_files == ["sig.json"]
+        assert commands == ["fetch", "for-each-ref", "rebase", "diff"]
+        assert json.loads((rm_b.templates_dir / "sig.json").read_text())["content"] == "2"
+
+
 # ---------------------------------------------------------------------------
 # AC-5: Pull specific templates
 # ---------------------------------------------------------------------------
@@ -597,7 +651,7 @@ class TestSyncCommandLanes:
         assert code == 0
         assert "Pulled latest templates" in out
         assert "Espanso output refreshed" in out
-        mock_sync.assert_called_once_with(update_bundled=False)
+        mock_sync.assert_called_once_with(update_bundled=False, changed_paths=["sig.json"])
 
     def test_pull_reports_up_to_date_feedback(self, capsys):
         """pull reports already-up-to-date state clearly."""
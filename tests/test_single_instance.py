@@ -0,0 +1,151 @@
+"""Tests for the single-instance GUI hand-off between launches."""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from espansr.ui.single_instance import GuiInstance, InstanceServer, send_to_running_instance
+
+
+@pytest.fixture()
+def server_name():
+    """A local server name no other test or real instance uses."""
+    return f"espansr-test-{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture()
+def server(qtbot, server_name):
+    server = InstanceServer(server_name)
+    assert server.listen()
+    yield server
+    server.close()
+
+
+# ─── Hand-off ────────────────────────────────────────────────────────────────
+
+
+def test_second_launch_hands_view_to_running_instance(qtbot, server, server_name):
+    """A later launch delivers its view request to the listening instance."""
+    with qtbot.waitSignal(server.view_requested, timeout=2000) as blocker:
+        assert send_to_running_instance("commands", server_name=server_name, timeout_ms=100)
+
+    assert blocker.args == ["commands"]
+
+
+def test_no_running_instance_reports_false(qtbot, server_name):
+    """Without a listening instance the caller is told to start the GUI itself."""
+    assert send_to_running_instance("main", server_name=server_name, timeout_ms=100) is False
+
+
+def test_second_server_does_not_steal_live_name(qtbot, server, server_name):
+    """listen() refuses a name a live instance still answers on."""
+    other = InstanceServer(server_name)
+    assert other.listen() is False
+
+
+# ─── Window reuse ────────────────────────────────────────────────────────────
+
+
+def _instance(resident_minutes=10):
+    app = MagicMock()
+    return GuiInstance(app, resident_minutes=resident_minutes), app
+
+
+def test_main_view_raises_existing_window(qtbot):
+    """A second main-view request raises the open window instead of building one."""
+    instance, _ = _instance(resident_minutes=0)
+    window = MagicMock()
+    window.isVisible.return_value = True
+    window.isMinimized.return_value = False
+
+    with (
+        patch("espansr.ui.main_window.MainWindow", return_value=window) as window_cls,
+        patch("espansr.core.config.get_config_manager"),
+    ):
+        instance.show_view("main")
+        instance.show_view("main")
+
+    window_cls.assert_called_once()
+    assert window.raise_.call_count == 2
+
+
+def test_commands_popup_is_rebuilt_after_use(qtbot):
+    """Closing the popup discards it and pre-builds a fresh one for the next :coms."""
+    from espansr.ui.commands_popup import CommandsPopupDialog
+
+    instance, _ = _instance()
+    with (
+        patch("espansr.ui.commands_popup.build_command_catalog", return_value=[]),
+        patch("espansr.core.config.get_config_manager"),
+    ):
+        instance.show_view("commands")
+        first = instance.popup
+        assert isinstance(first, CommandsPopupDialog)
+        assert first.isVisible()
+
+        first.reject()
+        qtbot.waitUntil(lambda: instance.popup is not None and instance.popup is not first)
+
+    assert not instance.popup.isVisible()
+
+
+def test_prebuilt_popup_reloads_config_and_catalog_when_shown(qtbot):
+    """A popup built while idle shows templates added since, under the fresh config."""
+    from espansr.core.command_catalog import CommandCatalogEntry
+
+    entry = CommandCatalogEntry(":new", "New", "added later", "", "template")
+    instance, _ = _instance()
+    with (
+        patch("espansr.ui.commands_popup.build_command_catalog", return_value=[]),
+        patch("espansr.core.config.get_config_manager"),
+    ):
+        popup = instance._prebuild_popup()
+    assert popup._list.count() == 0
+
+    with (
+        patch("espansr.ui.commands_popup.build_command_catalog", return_value=[entry]),
+        patch("espansr.core.config.get_config_manager") as get_manager,
+    ):
+        instance.show_view("commands")
+
+    assert instance.popup is popup
+    assert popup._list.count() == 1
+    get_manager.return_value.reload.assert_called_once()
+
+
+def test_non_resident_instance_quits_when_popup_closes(qtbot):
+    """With resident_minutes=0 the process exits once its popup is dismissed."""
+    instance, app = _instance(resident_minutes=0)
+    with (
+        patch("espansr.ui.commands_popup.build_command_catalog", return_value=[]),
+        patch("espansr.core.config.get_config_manager"),
+    ):
+        instance.show_view("commands")
+        instance.popup.reject()
+
+    app.quit.assert_called_once()
+    assert instance.popup is None
+
+
+# ─── Residency ───────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(("resident", "minutes"), [(False, 0), (True, 10)])
+def test_only_resident_launches_outlive_their_last_window(resident, minutes):
+    """A plain launch exits with its last window; a --resident one uses the config."""
+    from espansr.core.config import Config
+    from espansr.ui.single_instance import run_gui
+
+    app = MagicMock()
+    app.exec.return_value = 0
+    with (
+        patch("espansr.ui.single_instance.QApplication.instance", return_value=app),
+        patch("espansr.ui.single_instance.InstanceServer") as server_cls,
+        patch("espansr.ui.single_instance.GuiInstance") as instance_cls,
+        patch("espansr.core.config.get_config", return_value=Config()),
+    ):
+        server_cls.return_value.listen.return_value = True
+        assert run_gui("main", resident=resident) == 0
+
+    instance_cls.assert_called_once_with(app, resident_minutes=minutes)
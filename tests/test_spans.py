@@ -0,0 +1,142 @@
+"""Tests for tracing spans and the global --profile flag."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core import spans
+
+
+@pytest.fixture(autouse=True)
+def _clean_spans():
+    """Each test starts and ends with recording disabled and empty."""
+    spans.disable()
+    spans.reset()
+    yield
+    spans.disable()
+    spans.reset()
+
+
+# ─── Recording ───────────────────────────────────────────────────────────────
+
+
+def test_disabled_spans_record_nothing():
+    """While disabled, span() is a shared no-op and nothing is kept."""
+    first = spans.span("a")
+    with first as s:
+        s.add("items", 3)
+
+    assert first is spans.span("b")
+    assert spans.get_roots() == []
+
+
+def test_spans_nest_and_count():
+    """Spans opened inside another become its children and keep their counts."""
+    spans.enable()
+    with spans.span("publish"):
+        with spans.span("validation", templates=2) as s:
+            s.add("warnings")
+            s.add("warnings", 2)
+        with spans.span("file write"):
+            pass
+
+    (root,) = spans.get_roots()
+    assert root.name == "publish"
+    assert [c.name for c in root.children] == ["validation", "file write"]
+    assert root.children[0].counts == {"templates": 2, "warnings": 3}
+    assert root.duration >= sum(c.duration for c in root.children)
+
+    tree = spans.format_tree().splitlines()
+    assert tree[0].startswith("publish ")
+    assert tree[1].startswith("  validation ")
+    assert tree[1].endswith("templates=2 warnings=3")
+
+
+def test_worker_thread_spans_are_separate_roots():
+    """A span opened on a worker thread is its own root, labelled with the thread."""
+
+    def restart():
+        with spans.span("restart"):
+            pass
+
+    spans.enable()
+    with spans.span("main"):
+        worker = threading.Thread(target=restart, name="w1")
+        worker.start()
+        worker.join()
+
+    assert [r.name for r in spans.get_roots()] == ["main", "restart"]
+    assert "restart [w1]" in spans.format_tree()
+
+
+def test_chrome_trace_has_complete_events_per_span():
+    """The Chrome trace holds one X event per span plus thread-name metadata."""
+    spans.enable()
+    with spans.span("outer"):
+        with spans.span("inner", n=1):
+            pass
+
+    trace = spans.to_chrome_trace()
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in complete] == ["outer", "inner"]
+    assert complete[1]["args"] == {"n": 1}
+    assert complete[1]["ts"] >= complete[0]["ts"]
+    assert any(e["ph"] == "M" for e in trace["traceEvents"])
+
+
+# ─── Instrumented stages ─────────────────────────────────────────────────────
+
+
+def test_publish_records_stage_spans(tmp_path):
+    """sync_to_espanso records validation, load, YAML and write stages."""
+    from espansr.core.templates import TemplateManager
+    from espansr.integrations import espanso
+
+    manager = TemplateManager(tmp_path / "templates")
+    manager.create(name="Greet", content="Hello", trigger=":greet")
+    match_dir = tmp_path / "match"
+    match_dir.mkdir()
+
+    spans.enable()
+    with (
+        patch.object(espanso, "get_match_dir", return_value=match_dir),
+        patch.object(espanso, "get_template_manager", return_value=manager),
+        patch("espansr.integrations.validate.get_template_manager", return_value=manager),
+        patch.object(espanso, "_request_publish_restart", return_value=None),
+        spans.span("publish"),
+    ):
+        assert espanso.sync_to_espanso() is True
+
+    (root,) = spans.get_roots()
+    names = [c.name for c in root.children]
+    assert names == ["validation", "template load", "yaml emit", "file write"]
+    assert root.children[1].counts == {"templates": 1}
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+
+def test_profile_flag_prints_tree_and_writes_trace(tmp_path, capsys):
+    """--profile prints the span tree to stderr; --profile-out writes the trace."""
+    from espansr.__main__ import main
+
+    def fake_list(args):
+        with spans.span("template load", templates=5):
+            pass
+        return 0
+
+    trace_path = tmp_path / "trace.json"
+    argv = ["espansr", "--profile", "--profile-out", str(trace_path), "list"]
+    with patch("sys.argv", argv), patch("espansr.__main__.cmd_list", fake_list):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    assert exc_info.value.code == 0
+    err = capsys.readouterr().err
+    assert "espansr list" in err
+    assert "  template load" in err
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert {"espansr list", "template load"} <= {e["name"] for e in events}
+    assert not spans.is_enabled()
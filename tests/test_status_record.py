@@ -0,0 +1,179 @@
+"""Tests for the cached status record behind ``espansr status --json``."""
+
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from espansr.core.status_record import (
+    get_status_record_path,
+    load_status_record,
+    write_status_record,
+)
+
+
+def _config_stub():
+    return SimpleNamespace(espanso=SimpleNamespace(last_sync=""))
+
+
+def _status(config_dir, templates_dir, probe, **kwargs) -> dict:
+    """Run get_status_json against tmp dirs with *probe* as Espanso detection."""
+    from espansr.integrations.orchestratr import get_status_json
+
+    with (
+        patch("espansr.integrations.orchestratr.get_config_dir", return_value=config_dir),
+        patch("espansr.integrations.orchestratr.get_templates_dir", return_value=templates_dir),
+        patch("espansr.integrations.orchestratr.get_espanso_config_dir", probe),
+        patch("espansr.integrations.orchestratr.get_config", return_value=_config_stub()),
+    ):
+        return json.loads(get_status_json(**kwargs))
+
+
+def _dirs(tmp_path):
+    config_dir = tmp_path / "espansr"
+    templates_dir = config_dir / "templates"
+    templates_dir.mkdir(parents=True)
+    (templates_dir / "a.json").write_text('{"name": "A", "trigger": ":a", "content": "A"}')
+    espanso_dir = tmp_path / "espanso"
+    espanso_dir.mkdir()
+    return config_dir, templates_dir, espanso_dir
+
+
+# ─── Record ──────────────────────────────────────────────────────────────────
+
+
+def test_record_round_trip(tmp_path):
+    """The latest write wins, and keys from older records are ignored."""
+    get_status_record_path(tmp_path).write_text(json.dumps({"published": 7}))
+    write_status_record(tmp_path, tmp_path / "espanso")
+    write_status_record(tmp_path, tmp_path / "espanso-moved")
+
+    record = load_status_record(tmp_path)
+    assert record.espanso_config_dir == str(tmp_path / "espanso-moved")
+    assert record.recorded_at
+    assert "published" not in json.loads(get_status_record_path(tmp_path).read_text())
+
+
+def test_unreadable_record_loads_as_none(tmp_path):
+    """A corrupt record is treated as missing rather than raising."""
+    get_status_record_path(tmp_path).write_text("{not json")
+    assert load_status_record(tmp_path) is None
+
+
+# ─── status --json ───────────────────────────────────────────────────────────
+
+
+def test_cached_record_answers_without_probing(tmp_path):
+    """With a recorded Espanso dir, status --json does not probe Espanso."""
+    config_dir, templates_dir, espanso_dir = _dirs(tmp_path)
+    record = write_status_record(config_dir, espanso_dir)
+    probe = MagicMock(return_value=espanso_dir)
+
+    data = _status(config_dir, templates_dir, probe)
+
+    probe.assert_not_called()
+    assert data["status"] == "ok"
+    assert data["espanso_synced"] is True
+    assert data["sources"]["espanso_synced"] == "cached"
+    assert data["cached_at"] == record.recorded_at
+
+
+def test_live_probe_refreshes_record(tmp_path):
+    """--live probes Espanso even with a record, and stores the answer."""
+    config_dir, templates_dir, espanso_dir = _dirs(tmp_path)
+    write_status_record(config_dir, tmp_path / "old-espanso")
+
+    data = _status(config_dir, templates_dir, MagicMock(return_value=espanso_dir), live=True)
+
+    assert data["sources"]["espanso_synced"] == "live"
+    assert "cached_at" not in data
+    assert load_status_record(config_dir).espanso_config_dir == str(espanso_dir)
+
+
+def test_slow_probe_reports_timeout_within_budget(tmp_path):
+    """A probe that overruns the budget degrades the status instead of blocking."""
+    config_dir, templates_dir, _ = _dirs(tmp_path)
+    release = threading.Event()
+
+    def slow_probe():
+        release.wait(5)
+        return None
+
+    try:
+        data = _status(config_dir, templates_dir, slow_probe, budget=0.1)
+    finally:
+        release.set()
+
+    assert data["status"] == "degraded"
+    assert data["sources"]["espanso_synced"] == "timeout"
+    assert any("0.1s status budget" in e for e in data["errors"])
+    assert load_status_record(config_dir) is None
+
+
+# ─── Writers ─────────────────────────────────────────────────────────────────
+
+
+def test_publish_records_status(tmp_path):
+    """cmd_publish records the Espanso dir it published to."""
+    from espansr.__main__ import cmd_publish
+    from espansr.integrations import espanso
+
+    config_dir = tmp_path / "espansr"
+
+    with (
+        patch("espansr.__main__.get_config_dir", return_value=config_dir),
+        patch("espansr.__main__.get_espanso_config_dir", return_value=tmp_path / "espanso"),
+        patch.object(espanso, "sync_to_espanso", return_value=True),
+    ):
+        assert cmd_publish(SimpleNamespace(dry_run=False)) == 0
+
+    record = load_status_record(config_dir)
+    assert record.espanso_config_dir == str(tmp_path / "espanso")
+
+
+def test_dry_run_publish_leaves_record_alone(tmp_path):
+    """A dry-run publish does not write the status record."""
+    from espansr.__main__ import cmd_publish
+    from espansr.integrations import espanso
+
+    config_dir = tmp_path / "espansr"
+    with (
+        patch("espansr.__main__.get_config_dir", return_value=config_dir),
+        patch.object(espanso, "sync_to_espanso", return_value=True),
+    ):
+        assert cmd_publish(SimpleNamespace(dry_run=True)) == 0
+
+    assert load_status_record(config_dir) is None
+
+
+def test_setup_records_detection_result(tmp_path):
+    """cmd_setup records what Espanso detection found, even when nothing."""
+    from espansr.__main__ import cmd_setup
+
+    config_dir = tmp_path / "espansr"
+    bundled_dir = tmp_path / "bundled"
+    bundled_dir.mkdir()
+    (bundled_dir / "starter.json").write_text(
+        '{"name": "Starter", "trigger": ":starter", "content": "Starter"}'
+    )
+    with (
+        patch("espansr.__main__.get_config_dir", return_value=config_dir),
+        patch("espansr.__main__.get_templates_dir", return_value=config_dir / "templates"),
+        patch("espansr.__main__._get_bundled_dir", return_value=bundled_dir),
+        patch("espansr.__main__.get_espanso_config_dir", return_value=None),
+        patch("espansr.integrations.orchestratr.resolve_orchestratr_apps_dir", return_value=None),
+    ):
+        cmd_setup(None)
+
+    record = load_status_record(config_dir)
+    assert record is not None
+    assert record.espanso_config_dir == ""
+
+
+def test_status_parser_accepts_live_flag():
+    """The status subcommand accepts --live alongside --json."""
+    from espansr.__main__ import _build_parser
+
+    args = _build_parser().parse_args(["status", "--json", "--live"])
+    assert args.live is True
+    assert _build_parser().parse_args(["status"]).live is False
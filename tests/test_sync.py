@@ -38,9 +38,20 @@ def _git_subcommands(mock):
 
 
 @contextmanager
-def _sync_env(repo, git, *, dirty=False, conflicts=(), ahead=True, worktree=True, installer_rc=0):
+def _sync_env(
+    repo,
+    git,
+    *,
+    dirty=False,
+    conflicts=(),
+    ahead=True,
+    worktree=True,
+    installer_rc=0,
+    unchanged=False,
+):
     """Patch _run_sync's collaborators; yields the run_installer mock."""
     patchers = [
+        patch("espansr.core.install_meta.install_inputs_unchanged", return_value=unchanged),
         patch.object(cli, "_resolve_install_target", return_value=(repo, "install.sh", "linux")),
         patch.object(cli.shutil, "which", return_value="git"),
         patch.object(cli, "_is_git_worktree", return_value=worktree),
@@ -62,6 +73,8 @@ def test_sync_parses_no_push():
     parser = cli._build_parser()
     assert parser.parse_args(["sync"]).no_push is False
     assert parser.parse_args(["sync", "--no-push"]).no_push is True
+    assert parser.parse_args(["sync"]).reinstall is False
+    assert parser.parse_args(["sync", "--reinstall"]).reinstall is True
 
 
 def test_configure_remote_desktop_parses_revert():
@@ -167,6 +180,45 @@ def test_sync_dirty_tree_stashes_and_pops(tmp_path):
     installer.assert_called_once()
 
 
+# ─── install fingerprint ─────────────────────────────────────────────────────
+
+
+def test_sync_unchanged_fingerprint_republishes_without_reinstall(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git = _git_in_mock()
+    with (
+        _sync_env(repo, git, unchanged=True) as installer,
+        patch.object(cli, "_republish", return_value=0) as republish,
+    ):
+        rc = cli._run_sync(no_push=False)
+
+    assert rc == 0
+    installer.assert_not_called()
+    republish.assert_called_once_with()
+    assert ("pull", "--rebase") in _git_subcommands(git)
+
+
+def test_sync_reinstall_flag_overrides_unchanged_fingerprint(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    with (
+        _sync_env(repo, _git_in_mock(), unchanged=True) as installer,
+        patch.object(cli, "_republish") as republish,
+    ):
+        rc = cli.cmd_sync(_args(no_push=True, reinstall=True))
+
+    assert rc == 0
+    installer.assert_called_once_with(repo, "install.sh", "linux")
+    republish.assert_not_called()
+
+
+def test_republish_runs_publish_in_a_fresh_interpreter():
+    with patch.object(cli.subprocess, "run", return_value=_cp(0)) as run:
+        assert cli._republish() == 0
+    assert run.call_args.args[0] == [cli.sys.executable, "-m", "espansr", "publish"]
+
+
 # ─── configure-remote-desktop command ────────────────────────────────────────
 
 
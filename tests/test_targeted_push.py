@@ -0,0 +1,135 @@
+"""Tests for push staging only the templates changed since the last push."""
+
+import json
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.config import Config, ConfigManager
+from espansr.core.remote import RemoteManager
+from espansr.core.template_index import TemplateIndex
+
+# ─── Fixtures ────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture()
+def rm(tmp_path):
+    """A templates repo with two templates already pushed once."""
+    remote_dir = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "--bare", str(remote_dir)], capture_output=True, check=True)
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    mgr = ConfigManager(config_path=tmp_path / "config.json")
+    mgr.save(Config())
+    manager = RemoteManager(templates_dir=templates_dir, config_manager=mgr)
+    manager.set_remote(str(remote_dir))
+    _write(manager, "greet.json", "Hi")
+    _write(manager, "team/sig.json", "Regards")
+    manager.push()
+    return manager
+
+
+def _write(rm: RemoteManager, rel: str, content: str) -> None:
+    path = rm.templates_dir / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"name": rel, "content": content}))
+
+
+def _push_recording_git(rm: RemoteManager) -> list[tuple]:
+    with patch.object(RemoteManager, "_git", autospec=True, side_effect=RemoteManager._git) as git:
+        rm.push()
+    return [call.args[1:] for call in git.call_args_list]
+
+
+def _last_commit(rm: RemoteManager) -> tuple[str, list[str]]:
+    message = rm._git("log", "-1", "--format=%B").stdout.strip()
+    files = rm._git("log", "-1", "--name-only", "--format=").stdout.split()
+    return message, files
+
+
+# ─── Targeted staging ────────────────────────────────────────────────────────
+
+
+def test_first_push_stages_everything_and_records_generation(rm):
+    """Without a recorded push the whole store is staged once, then the log takes over."""
+    index = TemplateIndex(rm.templates_dir)
+    assert index.pushed_generation == index.generation
+    assert sorted(_last_commit(rm)[1]) == ["greet.json", "team/sig.json"]
+
+
+def test_push_stages_only_changed_paths(rm):
+    """An edit is staged by path; the store is not walked with `git add .`."""
+    _write(rm, "team/sig.json", "Cheers")
+
+    commands = _push_recording_git(rm)
+
+    assert ("add", ".") not in commands
+    assert ("status", "--porcelain") not in commands
+    message, files = _last_commit(rm)
+    assert files == ["team/sig.json"]
+    assert message.startswith("espansr: sync 1 template(s)")
+    assert "- team/sig.json" in message
+
+
+def test_push_stages_removed_templates(rm):
+    """A template deleted since the last push is removed from the repo."""
+    (rm.templates_dir / "greet.json").unlink()
+
+    rm.push()
+
+    _, files = _last_commit(rm)
+    assert files == ["greet.json"]
+    tracked = rm._git("ls-files").stdout.split()
+    assert "greet.json" not in tracked
+
+
+def test_push_stages_glob_like_names_literally(rm):
+    """A template name containing glob characters stages only that file."""
+    _write(rm, "notes1.json", "One")
+    _write(rm, "notes[1].json", "Bracketed")
+    rm.push()
+    (rm.templates_dir / "notes[1].json").unlink()
+
+    rm.push()
+
+    _, files = _last_commit(rm)
+    assert files == ["notes[1].json"]
+    tracked = rm._git("ls-files").stdout.split()
+    assert "notes1.json" in tracked
+    assert "notes[1].json" not in tracked
+
+
+def test_push_stages_same_tick_edit_after_a_push(rm):
+    """An edit that keeps a young file's size and mtime is still staged and pushed."""
+    path = rm.templates_dir / "greet.json"
+    st = path.stat()
+    _write(rm, "greet.json", "Yo")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    rm.push()
+
+    _, files = _last_commit(rm)
+    assert files == ["greet.json"]
+    assert json.loads(rm._git("show", "HEAD:greet.json").stdout)["content"] == "Yo"
+
+
+def test_push_with_no_changes_makes_no_commit(rm):
+    """Nothing changed since the last push means nothing is committed."""
+    head = rm._git("rev-parse", "HEAD").stdout.strip()
+
+    rm.push()
+
+    assert rm._git("rev-parse", "HEAD").stdout.strip() == head
+
+
+def test_missing_change_log_falls_back_to_full_add(rm):
+    """Deleting the index forces a full `git add .` on the next push."""
+    (rm.templates_dir / "_meta" / "index.json").unlink()
+    _write(rm, "new.json", "New")
+
+    commands = _push_recording_git(rm)
+
+    assert ("add", ".") in commands
+    assert _last_commit(rm)[1] == ["new.json"]
@@ -0,0 +1,122 @@
+"""Tests for the persisted live template index."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from espansr.core import template_index as index_mod
+from espansr.core.template_index import TemplateIndex
+
+
+def _write_json(path: Path, data) -> None:
+    """Write JSON data, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_refresh_indexes_live_templates_only(tmp_path):
+    """Nested templates are indexed; _versions/ and _meta/ are not."""
+    _write_json(tmp_path / "a.json", {"name": "A", "content": "a", "trigger": ":a"})
+    _write_json(tmp_path / "team" / "b.json", {"name": "B", "content": "b"})
+    _write_json(tmp_path / "_versions" / "a" / "v1.json", {"version": 1})
+    _write_json(tmp_path / "_meta" / "other.json", {})
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+    index = TemplateIndex(tmp_path)
+    index.refresh()
+
+    assert set(index.entries) == {"a.json", "team/b.json", "broken.json"}
+    assert index.entries["a.json"].trigger == ":a"
+    assert index.entries["broken.json"].name is None
+    assert index.names() == {"a", "b"}
+    assert index.top_level_filenames() == {"a.json", "broken.json"}
+
+
+def test_refresh_reparses_only_changed_files(tmp_path):
+    """A persisted index re-reads only files whose stat key changed."""
+    _write_json(tmp_path / "a.json", {"name": "A", "content": "a"})
+    _write_json(tmp_path / "b.json", {"name": "B", "content": "b"})
+    first = TemplateIndex(tmp_path)
+    first.refresh()
+    assert first.save()
+
+    _write_json(tmp_path / "b.json", {"name": "Bee", "content": "changed"})
+    (tmp_path / "a.json").unlink()
+    second = TemplateIndex(tmp_path)
+    with patch.object(
+        index_mod, "_read_index_facts", wraps=index_mod._read_index_facts
+    ) as read_facts:
+        second.refresh()
+
+    assert [call.args[0].name for call in read_facts.call_args_list] == ["b.json"]
+    assert set(second.entries) == {"b.json"}
+    assert second.names() == {"bee"}
+
+
+def test_same_tick_rewrite_of_a_young_file_is_picked_up(tmp_path):
+    """A same-size rewrite that keeps the mtime is re-read while the file is young."""
+    path = tmp_path / "b.json"
+    _write_json(path, {"name": "B", "content": "b", "trigger": ":bb"})
+    first = TemplateIndex(tmp_path)
+    first.refresh()
+    assert first.save()
+    st = path.stat()
+
+    _write_json(path, {"name": "B", "content": "b", "trigger": ":aa"})
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    second = TemplateIndex(tmp_path)
+    second.refresh()
+
+    assert second.entries["b.json"].trigger == ":aa"
+    assert second.changed_since(first.generation) == ["b.json"]
+
+
+def test_settled_files_are_trusted_by_stat(tmp_path):
+    """Once a file is older than the granularity window, its stat key is trusted."""
+    path = tmp_path / "a.json"
+    _write_json(path, {"name": "A", "content": "a"})
+    past = time.time() - 60
+    os.utime(path, (past, past))
+    first = TemplateIndex(tmp_path)
+    first.refresh()
+
+    with patch.object(
+        index_mod, "_read_index_facts", wraps=index_mod._read_index_facts
+    ) as read_facts:
+        first.refresh()
+
+    assert not first.entries["a.json"].racy
+    read_facts.assert_not_called()
+
+
+def test_unknown_index_version_is_rebuilt(tmp_path):
+    """An index written by an incompatible version is ignored."""
+    _write_json(tmp_path / "a.json", {"name": "A", "content": "a"})
+    _write_json(tmp_path / "_meta" / "index.json", {"version": 999, "entries": {"x.json": {}}})
+
+    index = TemplateIndex(tmp_path)
+    assert index.entries == {}
+    index.refresh()
+    assert set(index.entries) == {"a.json"}
+
+
+def test_change_log_tracks_edits_and_removals_since_a_generation(tmp_path):
+    """changed_since() lists paths added, edited, or removed after a generation."""
+    _write_json(tmp_path / "a.json", {"name": "A"})
+    _write_json(tmp_path / "b.json", {"name": "B"})
+    index = TemplateIndex(tmp_path)
+    index.refresh()
+    index.mark_pushed(index.generation)
+    index.save()
+
+    _write_json(tmp_path / "a.json", {"name": "A edited"})
+    (tmp_path / "b.json").unlink()
+    _write_json(tmp_path / "c.json", {"name": "C"})
+    reloaded = TemplateIndex(tmp_path)
+    reloaded.refresh()
+
+    assert reloaded.changed_since(reloaded.pushed_generation) == ["a.json", "b.json", "c.json"]
+    reloaded.mark_pushed(reloaded.generation)
+    assert reloaded.changed_since(reloaded.pushed_generation) == []
@@ -297,6 +297,66 @@ def test_validate_all_system_trigger_collision_escape_hatch():
     assert result == []
 
 
+# ─── validate_all() — prefix shadowing ───────────────────────────────────────
+
+
+def _validate_triggers(triggers, config=None):
+    """Run validate_all() over templates named after their triggers."""
+    from espansr.core.config import Config
+    from espansr.integrations.validate import validate_all
+
+    templates = [Template(name=f"t{t}", content="x", trigger=t) for t in triggers]
+    with (
+        patch("espansr.integrations.validate.get_template_manager") as mock_mgr,
+        patch("espansr.integrations.validate.get_config", return_value=config or Config()),
+    ):
+        mock_mgr.return_value.iter_with_triggers.return_value = iter(templates)
+        return validate_all()
+
+
+def test_validate_all_warns_when_a_trigger_shadows_a_longer_one():
+    """A strict prefix makes the longer trigger unreachable; only the longer one is flagged."""
+    result = _validate_triggers([":review", ":rev", ":re2"])
+
+    assert [w.template_name for w in result] == ["t:review"]
+    assert result[0].severity == "warning"
+    assert "':rev' (t:rev)" in result[0].message
+
+
+def test_validate_all_reports_every_shadowing_prefix():
+    """Each shorter trigger on the path is reported, but equal triggers are not."""
+    result = _validate_triggers([":abc", ":a", ":ab", ":ab"])
+
+    shadowing = [w for w in result if "shadowed" in w.message]
+    assert [(w.template_name, w.message.split("'")[3]) for w in shadowing] == [
+        ("t:abc", ":a"),
+        ("t:abc", ":ab"),
+        ("t:ab", ":a"),
+        ("t:ab", ":a"),
+    ]
+
+
+def test_validate_all_warns_on_prefix_shadowing_with_system_triggers():
+    """Templates shadowing, or shadowed by, generated triggers are warned about."""
+    result = _validate_triggers([":sy", ":comsx"])
+
+    messages = {w.template_name: w.message for w in result}
+    assert "shadows the generated sync trigger ':sync'" in messages["t:sy"]
+    assert "shadowed by the generated commands popup trigger ':coms'" in messages["t:comsx"]
+    assert all(w.severity == "warning" for w in result)
+
+
+def test_prefix_shadowing_escape_hatch_covers_only_system_triggers():
+    """allow_system_trigger_collisions silences system shadowing, not template pairs."""
+    from espansr.core.config import Config
+
+    config = Config()
+    config.espanso.allow_system_trigger_collisions = True
+    result = _validate_triggers([":sy", ":comsx", ":go", ":gone"], config)
+
+    assert [w.template_name for w in result] == ["t:gone"]
+
+
 # ─── sync_to_espanso() integration ──────────────────────────────────────────
 
 
@@ -362,7 +422,7 @@ def test_cli_validate_returns_0_on_clean():
     with patch("espansr.integrations.validate.validate_all", return_value=[]):
         from espansr.__main__ import cmd_validate
 
-        result = cmd_validate(MagicMock())
+        result = cmd_validate(MagicMock(format="text", changed_since=None))
 
     assert result == 0
 
@@ -377,6 +437,6 @@ def test_cli_validate_returns_1_on_errors():
     with patch("espansr.integrations.validate.validate_all", return_value=errors):
         from espansr.__main__ import cmd_validate
 
-        result = cmd_validate(MagicMock())
+        result = cmd_validate(MagicMock(format="text", changed_since=None))
 
     assert result == 1
@@ -0,0 +1,186 @@
+"""Tests for the content-hash-keyed validation cache behind validate_all()."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.config import Config
+from espansr.core.templates import TemplateManager
+from espansr.integrations import validate as validate_mod
+from espansr.integrations.validation_cache import VALIDATION_CACHE_FILENAME
+
+
+def _write_json(path: Path, data: dict, *, age: int = 60) -> None:
+    """Write a template and backdate it so stat-keyed entries are trusted."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    past = time.time() - age
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store with a clean template, a per-template warning, and a prefix clash."""
+    templates_dir = tmp_path / "templates"
+    _write_json(templates_dir / "greet.json", {"name": "Greet", "content": "Hi", "trigger": ":hi"})
+    _write_json(
+        templates_dir / "team" / "sig.json",
+        {"name": "Signature", "content": "Regards, {{who}}", "trigger": ":sig"},
+    )
+    _write_json(templates_dir / "hint.json", {"name": "Hint", "content": "x", "trigger": ":hint"})
+    _write_json(templates_dir / "notes.json", {"name": "Notes", "content": "no trigger"})
+    return TemplateManager(templates_dir=templates_dir)
+
+
+def _validate(manager, config=None):
+    with (
+        patch("espansr.integrations.validate.get_template_manager", return_value=manager),
+        patch("espansr.integrations.validate.get_config", return_value=config or Config()),
+    ):
+        return validate_mod.validate_all()
+
+
+def _uncached(manager, config=None):
+    """What validate_all() reports without the cache, via a plain manager stand-in."""
+    templates = list(manager.iter_with_triggers())
+    with patch("espansr.integrations.validate.get_template_manager") as mock_mgr:
+        mock_mgr.return_value.iter_with_triggers.return_value = iter(templates)
+        return _validate(mock_mgr.return_value, config)
+
+
+def _counting(name):
+    """Patch validate.<name> with a call-counting wrapper around the real function."""
+    real = getattr(validate_mod, name)
+    return patch.object(validate_mod, name, side_effect=real)
+
+
+# ─── Results ─────────────────────────────────────────────────────────────────
+
+
+def test_cold_and_warm_results_match_uncached_validation(store):
+    """The cached path reports exactly what the uncached path does, in order."""
+    expected = _uncached(store)
+
+    assert _validate(store) == expected
+    assert _validate(store) == expected
+    assert {w.template_name for w in expected} == {"Hint", "Signature"}
+    assert (store.templates_dir / "_meta" / VALIDATION_CACHE_FILENAME).exists()
+
+
+def test_unreadable_template_is_reported_on_every_run(store, capsys):
+    """A broken file is skipped but still reported, also when the index is warm."""
+    _write_json(store.templates_dir / "ok.json", {"name": "Ok", "content": "y", "trigger": ":ok"})
+    (store.templates_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+    _validate(store)
+    _validate(store)
+
+    assert capsys.readouterr().out.count("broken.json") == 2
+
+
+# ─── Reuse ───────────────────────────────────────────────────────────────────
+
+
+def test_warm_run_revalidates_nothing(store):
+    """Unchanged templates are neither re-validated nor cross-checked again."""
+    _validate(store)
+
+    with (
+        _counting("validate_template") as per_template,
+        _counting("_cross_template_warnings") as cross,
+    ):
+        _validate(store)
+
+    assert per_template.call_count == 0
+    assert cross.call_count == 0
+
+
+def test_edit_to_validated_fields_revalidates_only_that_template(store):
+    """Changing content re-validates the edited template and picks up the new issue."""
+    _validate(store)
+    _write_json(
+        store.templates_dir / "greet.json",
+        {"name": "Greet", "content": "Hi {{name}}", "trigger": ":hi"},
+        age=0,
+    )
+
+    with _counting("validate_template") as per_template:
+        warnings = _validate(store)
+
+    assert per_template.call_count == 1
+    assert any(w.template_name == "Greet" and "{{name}}" in w.message for w in warnings)
+
+
+def test_edit_outside_validated_fields_reuses_the_hash(store):
+    """A description-only edit or a moved file hashes the same and is not re-validated."""
+    _validate(store)
+    _write_json(
+        store.templates_dir / "greet.json",
+        {"name": "Greet", "content": "Hi", "trigger": ":hi", "description": "new"},
+    )
+    (store.templates_dir / "team" / "sig.json").rename(store.templates_dir / "sig.json")
+
+    with _counting("validate_template") as per_template:
+        warnings = _validate(store)
+
+    assert per_template.call_count == 0
+    assert warnings == _uncached(store)
+
+
+def test_trigger_change_reruns_cross_checks(store):
+    """Cross-template checks rerun when a trigger changes, and not otherwise."""
+    _validate(store)
+    _write_json(
+        store.templates_dir / "hint.json", {"name": "Hint", "content": "x", "trigger": ":hx"}
+    )
+
+    with _counting("_cross_template_warnings") as cross:
+        warnings = _validate(store)
+
+    assert cross.call_count == 1
+    assert not any("shadowed" in w.message for w in warnings)
+
+
+def test_same_tick_trigger_rewrite_is_not_missed(tmp_path):
+    """A young file rewritten with the same size and mtime is validated afresh."""
+    templates_dir = tmp_path / "templates"
+    _write_json(templates_dir / "a.json", {"name": "A", "content": "x", "trigger": ":aa"}, age=0)
+    _write_json(templates_dir / "b.json", {"name": "B", "content": "x", "trigger": ":bb"}, age=0)
+    manager = TemplateManager(templates_dir=templates_dir)
+    assert _validate(manager) == []
+    path = templates_dir / "b.json"
+    st = path.stat()
+
+    path.write_text(json.dumps({"name": "B", "content": "x", "trigger": ":aa"}), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert any("Duplicate trigger ':aa'" in w.message for w in _validate(manager))
+
+
+def test_system_trigger_config_change_reruns_cross_checks(store):
+    """Changing a generated trigger invalidates the cached cross-template result."""
+    _validate(store)
+    config = Config()
+    config.espanso.sync_trigger = ":hi"
+
+    warnings = _validate(store, config)
+
+    assert any("generated sync trigger" in w.message for w in warnings)
+
+
+def test_cache_from_another_release_is_ignored(store):
+    """Results recorded by a different espansr version start cold."""
+    _validate(store)
+    cache_path = store.templates_dir / "_meta" / VALIDATION_CACHE_FILENAME
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    data["espansr"] = "0.0.0"
+    cache_path.write_text(json.dumps(data), encoding="utf-8")
+
+    with _counting("validate_template") as per_template:
+        _validate(store)
+
+    assert per_template.call_count == 3
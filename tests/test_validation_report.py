@@ -0,0 +1,214 @@
+"""Tests for ``espansr validate --format`` and ``--changed-since``."""
+
+import io
+import json
+import os
+import subprocess
+import time
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from espansr.core.templates import TemplateManager
+from espansr.integrations.validate import ValidationWarning
+from espansr.integrations.validation_report import CHECKS, write_report
+
+_WARNINGS = [
+    ValidationWarning(
+        "warning", "Placeholder '{{y}}' unused", "B", "undefined-placeholder", "b.json"
+    ),
+    ValidationWarning("error", "Duplicate trigger ':a'", "A", "duplicate-trigger", None),
+]
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write a template and backdate it so the validation cache trusts its stat."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run a git command in *cwd*, failing the test on error."""
+    subprocess.run(["git", "-C", str(cwd), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A committed store (a prefix clash) plus one untracked template with an issue."""
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    _git(templates_dir, "init", "-q")
+    _git(templates_dir, "config", "user.email", "test@example.com")
+    _git(templates_dir, "config", "user.name", "Test")
+    _write_json(templates_dir / "rev.json", {"name": "Rev", "content": "x", "trigger": ":rev"})
+    _write_json(
+        templates_dir / "review.json",
+        {"name": "Review", "content": "{{old}}", "trigger": ":review"},
+    )
+    _git(templates_dir, "add", ".")
+    _git(templates_dir, "commit", "-q", "-m", "init")
+    _write_json(templates_dir / "new.json", {"name": "New", "content": "{{new}}", "trigger": ":nw"})
+    return TemplateManager(templates_dir=templates_dir)
+
+
+def _cmd_validate(manager, capsys, fmt="text", changed_since=None):
+    """Run cmd_validate against *manager*; return (exit code, stdout, stderr)."""
+    from espansr.__main__ import cmd_validate
+
+    with (
+        patch("espansr.core.templates.get_template_manager", return_value=manager),
+        patch("espansr.integrations.validate.get_template_manager", return_value=manager),
+        patch("espansr.__main__._auto_pull_if_configured"),
+    ):
+        code = cmd_validate(Namespace(format=fmt, changed_since=changed_since))
+    captured = capsys.readouterr()
+    return code, captured.out, captured.err
+
+
+# ─── write_report() ──────────────────────────────────────────────────────────
+
+
+def test_ndjson_writes_each_warning_before_the_next_is_produced():
+    """Each record is on the stream before the generator is asked for the next one."""
+    out = io.StringIO()
+    seen = []
+
+    def produce():
+        for warning in _WARNINGS:
+            yield warning
+            seen.append(out.getvalue().count("\n"))
+
+    errors = write_report(produce(), "ndjson", out)
+
+    assert errors == 1
+    assert seen == [1, 2]
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[0] == {
+        "severity": "warning",
+        "check": "undefined-placeholder",
+        "template": "B",
+        "path": "b.json",
+        "message": "Placeholder '{{y}}' unused",
+    }
+    assert records[1]["path"] is None
+
+
+def test_json_document_has_warnings_and_summary():
+    """The json format is one valid document, also when there is nothing to report."""
+    out = io.StringIO()
+    write_report(iter(_WARNINGS), "json", out)
+    empty = io.StringIO()
+    write_report(iter([]), "json", empty)
+
+    document = json.loads(out.getvalue())
+    assert [w["check"] for w in document["warnings"]] == [
+        "undefined-placeholder",
+        "duplicate-trigger",
+    ]
+    assert document["summary"] == {"errors": 1, "warnings": 1}
+    assert json.loads(empty.getvalue()) == {"warnings": [], "summary": {"errors": 0, "warnings": 0}}
+
+
+def test_sarif_log_has_rules_levels_and_locations(tmp_path):
+    """SARIF results carry the check as ruleId and a location when the path is known."""
+    out = io.StringIO()
+    write_report(iter(_WARNINGS), "sarif", out, templates_dir=tmp_path)
+
+    log = json.loads(out.getvalue())
+    run = log["runs"][0]
+    assert log["version"] == "2.1.0"
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == list(CHECKS)
+    assert run["originalUriBaseIds"]["TEMPLATES"]["uri"] == tmp_path.as_uri() + "/"
+    first, second = run["results"]
+    assert (first["ruleId"], first["level"]) == ("undefined-placeholder", "warning")
+    location = first["locations"][0]["physicalLocation"]["artifactLocation"]
+    assert location == {"uri": "b.json", "uriBaseId": "TEMPLATES"}
+    assert (second["level"], "locations" in second) == ("error", False)
+
+
+def test_sarif_uris_are_percent_encoded():
+    """Spaces and non-ASCII characters in a template path are escaped in the URI."""
+    warning = ValidationWarning("warning", "m", "Café", "unused-variable", "my team/café #1.json")
+    out = io.StringIO()
+    write_report(iter([warning]), "sarif", out)
+
+    (result,) = json.loads(out.getvalue())["runs"][0]["results"]
+    location = result["locations"][0]["physicalLocation"]["artifactLocation"]
+    assert location["uri"] == "my%20team/caf%C3%A9%20%231.json"
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+
+def test_store_warnings_carry_known_check_ids(repo, capsys):
+    """Warnings from a real store carry check ids that the rule table knows."""
+    _, out, _ = _cmd_validate(repo, capsys, fmt="ndjson")
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert {r["check"] for r in records} == {"undefined-placeholder", "prefix-shadow"}
+    assert {r["check"] for r in records} <= set(CHECKS)
+
+
+def test_machine_formats_keep_stdout_parseable(repo, capsys):
+    """Load failures go to stderr, and errors still exit 1."""
+    (repo.templates_dir / "broken.json").write_text("{not json", encoding="utf-8")
+    _write_json(repo.templates_dir / "dup.json", {"name": "Dup", "content": "x", "trigger": ":rev"})
+
+    code, out, err = _cmd_validate(repo, capsys, fmt="json")
+
+    assert code == 1
+    assert json.loads(out)["summary"]["errors"] == 2
+    assert "broken.json" in err
+
+
+def test_changed_since_limits_per_template_checks(repo, capsys):
+    """Only changed templates get per-template checks; cross checks cover the store."""
+    code, out, _ = _cmd_validate(repo, capsys, fmt="ndjson", changed_since="HEAD")
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert code == 0
+    assert [(r["template"], r["check"]) for r in records] == [
+        ("New", "undefined-placeholder"),
+        ("Review", "prefix-shadow"),
+    ]
+
+
+def test_changed_since_includes_uncommitted_edits(repo, capsys):
+    """An edit to a tracked template since the revision counts as a change."""
+    _write_json(
+        repo.templates_dir / "rev.json", {"name": "Rev", "content": "{{v}}", "trigger": ":rev"}
+    )
+
+    _, out, _ = _cmd_validate(repo, capsys, changed_since="HEAD")
+
+    assert "[Rev]" in out
+    assert "[Review]: Placeholder" not in out
+
+
+def test_changed_since_matches_non_ascii_paths(repo, capsys):
+    """Changed templates with non-ASCII file or folder names are not skipped."""
+    folder = repo.templates_dir / "équipe"
+    folder.mkdir()
+    _write_json(folder / "café.json", {"name": "Café", "content": "{{lait}}", "trigger": ":cafe"})
+    _git(repo.templates_dir, "add", ".")
+    _git(repo.templates_dir, "commit", "-q", "-m", "café")
+    _write_json(folder / "café.json", {"name": "Café", "content": "{{crème}}", "trigger": ":cafe"})
+
+    _, out, _ = _cmd_validate(repo, capsys, fmt="ndjson", changed_since="HEAD")
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert ("Café", "équipe/café.json") in {(r["template"], r["path"]) for r in records}
+
+
+def test_changed_since_with_an_unknown_revision_fails(repo, capsys):
+    """A revision git cannot resolve is reported and exits 1 without validating."""
+    with patch("espansr.integrations.validate.iter_validate_all") as iter_validate:
+        code, out, err = _cmd_validate(repo, capsys, fmt="ndjson", changed_since="no-such-rev")
+
+    assert code == 1
+    assert out == ""
+    assert "no-such-rev" in err
+    iter_validate.assert_not_called()